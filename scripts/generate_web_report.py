@@ -13,27 +13,30 @@ Usage:
 
 import argparse
 import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+# Jinja2 is imported lazily in get_template_environment() so that CLI help and
+# early validation failures do not pay its import cost.
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
 # Import shared utilities
+from report_constants import ETHICS_DISCLAIMER
 from report_utils import (
     SHIP_BASELINE_DATA,
-    load_all_results,
-    filter_incomplete_runs,
-    filter_fake_models,
+    calculate_score_distribution,
     filter_by_scenario,
+    filter_fake_models,
+    filter_incomplete_runs,
+    get_baseline_data,
     group_by_model,
     group_by_scenario,
-    calculate_score_distribution,
-    get_baseline_data,
+    load_all_results,
 )
-from report_constants import ETHICS_DISCLAIMER
-
 
 # ============================================================================
 # Data Structures
@@ -86,7 +89,7 @@ class ScoreDistribution:
     avg_accuracy: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportMetadata:
     """Report header information."""
     title: str
@@ -138,7 +141,7 @@ class ChartData:
     options: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportData:
     """Complete data package for HTML template."""
     metadata: ReportMetadata
@@ -147,7 +150,7 @@ class ReportData:
     config: ReportConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportResult:
     """Result of report generation."""
     success: bool
@@ -506,90 +509,104 @@ def prepare_chart_data(
 
 
 # ============================================================================
-# Main Report Generation
+# Template Environment
 # ============================================================================
 
-def generate_web_report(
-    runs_dir: Path = Path("runs"),
-    output_path: Path = Path("reports/index.html"),
-    scenario: Optional[str] = None,
-    by_model: bool = True,
-    include_baseline: bool = True,
-    include_incomplete: bool = False,
-    include_fake: bool = False,
-    detailed: bool = True,
-    title: Optional[str] = None
-) -> ReportResult:
-    """Generate web-based HTML report from evaluation runs.
+@lru_cache(maxsize=None)
+def get_template_environment(template_dir: Path) -> "Environment":
+    """Build (once per directory) the Jinja2 environment used to render reports.
+
+    The template ships with the package and does not change while a process is
+    running, so mtime checks are disabled and compiled bytecode is cached on disk
+    to be reused across process restarts.
 
     Args:
-        runs_dir: Directory containing evaluation runs (default: "runs")
-        output_path: Where to save generated HTML file (default: "reports/index.html")
-        scenario: Filter to specific scenario ID (e.g., SHIP-MO-Q3), None = all
-        by_model: Group results by model (True) or by scenario (False)
-        include_baseline: Include SHIP study human baseline data
-        include_incomplete: Include runs without rubric scores
-        include_fake: Include fake: test models
-        detailed: Show detailed statistics (completeness %, accuracy %)
-        title: Custom report title
+        template_dir: Directory containing the report templates
 
     Returns:
-        ReportResult object with generation status and metadata
+        Configured Jinja2 Environment
     """
-    start_time = datetime.now()
-    errors = []
-    warnings = []
-
-    # T039: Input validation
-    if not runs_dir.exists():
-        return ReportResult(
-            success=False,
-            output_path=output_path,
-            runs_analyzed=0,
-            runs_included=0,
-            runs_excluded=0,
-            filters_applied=[],
-            file_size_bytes=0,
-            generation_time_seconds=0.0,
-            errors=[f"Runs directory does not exist: {runs_dir}"],
-        )
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(['html']),
+        auto_reload=False,
+        cache_size=400,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
 
-    if not runs_dir.is_dir():
-        return ReportResult(
-            success=False,
-            output_path=output_path,
-            runs_analyzed=0,
-            runs_included=0,
-            runs_excluded=0,
-            filters_applied=[],
-            file_size_bytes=0,
-            generation_time_seconds=0.0,
-            errors=[f"Runs path is not a directory: {runs_dir}"],
-        )
 
-    # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+# ============================================================================
+# Main Report Generation
+# ============================================================================
 
-    # Create config
-    config = ReportConfig(
-        runs_dir=runs_dir,
-        output_path=output_path,
-        scenario_filter=scenario,
-        group_by_model=by_model,
-        include_baseline=include_baseline,
-        include_incomplete=include_incomplete,
-        include_fake=include_fake,
-        show_detailed_stats=detailed,
-        title=title or "Accuracy of Medicare Information Provided by State Health Insurance Assistance Programs",
-    )
+DEFAULT_TEMPLATE_PATH = Path(__file__).parent / "web_report_template.html"
+CHART_JS_PATH = Path("/tmp/chart.min.js")
 
-    try:
-        # T032: Load data
-        results = load_all_results(runs_dir)
-        total_runs = len(results)
 
-        # T040: Handle empty results
-        if total_runs == 0:
+class ReportRenderer:
+    """Renders web reports, reusing one-time setup across calls.
+
+    The compiled template and the embedded Chart.js source are loaded on first
+    use and kept for the lifetime of the renderer, so generating many reports
+    (e.g. one per scenario) only pays for loading data and rendering.
+    """
+
+    def __init__(
+        self,
+        template_path: Path = DEFAULT_TEMPLATE_PATH,
+        chart_js_path: Path = CHART_JS_PATH,
+    ):
+        self.template_path = template_path
+        self.chart_js_path = chart_js_path
+        self._template = None
+        self._chart_js: Optional[str] = None
+        self._chart_js_checked = False
+
+    def _get_template(self):
+        """Load and compile the report template once."""
+        if self._template is None:
+            env = get_template_environment(self.template_path.parent)
+            self._template = env.get_template(self.template_path.name)
+        return self._template
+
+    def _get_chart_js(self) -> Optional[str]:
+        """Read the Chart.js library once, or None if it is not available."""
+        if not self._chart_js_checked:
+            if self.chart_js_path.exists():
+                with open(self.chart_js_path, 'r') as f:
+                    self._chart_js = f.read()
+            self._chart_js_checked = True
+        return self._chart_js
+
+    def render(
+        self,
+        runs_dir: Path = Path("runs"),
+        output_path: Path = Path("reports/index.html"),
+        scenario: Optional[str] = None,
+        by_model: bool = True,
+        include_baseline: bool = True,
+        include_incomplete: bool = False,
+        include_fake: bool = False,
+        detailed: bool = True,
+        title: Optional[str] = None
+    ) -> ReportResult:
+        """Generate web-based HTML report from evaluation runs.
+
+        See generate_web_report() for argument details.
+
+        Returns:
+            ReportResult object with generation status and metadata
+        """
+        start_time = datetime.now()
+        errors = []
+        warnings = []
+
+        # T039: Input validation
+        if not runs_dir.exists():
             return ReportResult(
                 success=False,
                 output_path=output_path,
@@ -598,172 +615,272 @@ def generate_web_report(
                 runs_excluded=0,
                 filters_applied=[],
                 file_size_bytes=0,
-                generation_time_seconds=(datetime.now() - start_time).total_seconds(),
-                errors=["No evaluation runs found in directory"],
+                generation_time_seconds=0.0,
+                errors=[f"Runs directory does not exist: {runs_dir}"],
             )
 
-        # T033: Apply filters
-        filters_applied = []
-        runs_before_filter = len(results)
+        if not runs_dir.is_dir():
+            return ReportResult(
+                success=False,
+                output_path=output_path,
+                runs_analyzed=0,
+                runs_included=0,
+                runs_excluded=0,
+                filters_applied=[],
+                file_size_bytes=0,
+                generation_time_seconds=0.0,
+                errors=[f"Runs path is not a directory: {runs_dir}"],
+            )
 
-        if scenario:
-            results = filter_by_scenario(results, scenario)
-            filters_applied.append(f"Scenario: {scenario}")
+        # Ensure output directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if not include_incomplete:
-            results = filter_incomplete_runs(results)
-            filters_applied.append("Excluded incomplete runs")
+        # Create config
+        config = ReportConfig(
+            runs_dir=runs_dir,
+            output_path=output_path,
+            scenario_filter=scenario,
+            group_by_model=by_model,
+            include_baseline=include_baseline,
+            include_incomplete=include_incomplete,
+            include_fake=include_fake,
+            show_detailed_stats=detailed,
+            title=title or (
+                "Accuracy of Medicare Information Provided by "
+                "State Health Insurance Assistance Programs"
+            ),
+        )
 
-        if not include_fake:
-            results = filter_fake_models(results)
-            filters_applied.append("Excluded fake models")
+        try:
+            # T032: Load data
+            results = load_all_results(runs_dir)
+            total_runs = len(results)
+
+            # T040: Handle empty results
+            if total_runs == 0:
+                return ReportResult(
+                    success=False,
+                    output_path=output_path,
+                    runs_analyzed=0,
+                    runs_included=0,
+                    runs_excluded=0,
+                    filters_applied=[],
+                    file_size_bytes=0,
+                    generation_time_seconds=(datetime.now() - start_time).total_seconds(),
+                    errors=["No evaluation runs found in directory"],
+                )
 
-        runs_after_filter = len(results)
-        runs_excluded = runs_before_filter - runs_after_filter
+            # T033: Apply filters
+            filters_applied = []
+            runs_before_filter = len(results)
+
+            if scenario:
+                results = filter_by_scenario(results, scenario)
+                filters_applied.append(f"Scenario: {scenario}")
+
+            if not include_incomplete:
+                results = filter_incomplete_runs(results)
+                filters_applied.append("Excluded incomplete runs")
+
+            if not include_fake:
+                results = filter_fake_models(results)
+                filters_applied.append("Excluded fake models")
+
+            runs_after_filter = len(results)
+            runs_excluded = runs_before_filter - runs_after_filter
+
+            # T040: Check if all runs filtered out
+            if runs_after_filter == 0:
+                return ReportResult(
+                    success=False,
+                    output_path=output_path,
+                    runs_analyzed=total_runs,
+                    runs_included=0,
+                    runs_excluded=runs_excluded,
+                    filters_applied=filters_applied,
+                    file_size_bytes=0,
+                    generation_time_seconds=(datetime.now() - start_time).total_seconds(),
+                    errors=[f"No runs match filters: {', '.join(filters_applied)}"],
+                )
 
-        # T040: Check if all runs filtered out
-        if runs_after_filter == 0:
-            return ReportResult(
-                success=False,
-                output_path=output_path,
-                runs_analyzed=total_runs,
-                runs_included=0,
+            # T034: Group data (already done in prepare_table_data)
+            # T035: Prepare report data
+            table_sections = prepare_table_data(results, config)
+            chart_data = prepare_chart_data(results, config)
+
+            # Create metadata
+            metadata = ReportMetadata(
+                title=config.title,
+                generated_at=datetime.now(),
+                runs_directory=str(runs_dir),
+                total_runs_analyzed=total_runs,
+                runs_included=runs_after_filter,
                 runs_excluded=runs_excluded,
                 filters_applied=filters_applied,
-                file_size_bytes=0,
-                generation_time_seconds=(datetime.now() - start_time).total_seconds(),
-                errors=[f"No runs match filters: {', '.join(filters_applied)}"],
+                ethics_disclaimer=ETHICS_DISCLAIMER,
             )
 
-        # T034: Group data (already done in prepare_table_data)
-        # T035: Prepare report data
-        table_sections = prepare_table_data(results, config)
-        chart_data = prepare_chart_data(results, config)
-
-        # Create metadata
-        metadata = ReportMetadata(
-            title=config.title,
-            generated_at=datetime.now(),
-            runs_directory=str(runs_dir),
-            total_runs_analyzed=total_runs,
-            runs_included=runs_after_filter,
-            runs_excluded=runs_excluded,
-            filters_applied=filters_applied,
-            ethics_disclaimer=ETHICS_DISCLAIMER,
-        )
+            # Create report data package
+            report_data = ReportData(
+                metadata=metadata,
+                table_sections=table_sections,
+                chart_data=chart_data,
+                config=config,
+            )
 
-        # Create report data package
-        report_data = ReportData(
-            metadata=metadata,
-            table_sections=table_sections,
-            chart_data=chart_data,
-            config=config,
-        )
+            # T036: Render template with Jinja2
+            template_path = self.template_path
+            if not template_path.exists():
+                return ReportResult(
+                    success=False,
+                    output_path=output_path,
+                    runs_analyzed=total_runs,
+                    runs_included=runs_after_filter,
+                    runs_excluded=runs_excluded,
+                    filters_applied=filters_applied,
+                    file_size_bytes=0,
+                    generation_time_seconds=(datetime.now() - start_time).total_seconds(),
+                    errors=[f"Template not found: {template_path}"],
+                )
+
+            template = self._get_template()
+
+            # Convert chart_data to dictionaries for JSON serialization
+            chart_data_dicts = [asdict(chart) for chart in chart_data]
+
+            # Render HTML
+            html_content = template.render(
+                metadata=metadata,
+                table_sections=table_sections,
+                chart_data=chart_data_dicts,
+                config=config,
+            )
+
+            # T022: Embed Chart.js
+            chart_js_code = self._get_chart_js()
+            if chart_js_code is not None:
+                # Replace placeholder with actual Chart.js code
+                html_content = html_content.replace(
+                    '// Chart.js library will be embedded here (T022)\n'
+                    '        console.log("Chart.js placeholder - '
+                    'will be replaced with actual library");',
+                    chart_js_code
+                )
+            else:
+                warnings.append("Chart.js not found - charts will not be displayed")
+
+            # T037: Write HTML file
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+
+            file_size = output_path.stat().st_size
+
+            # Check file size
+            if file_size > 2_000_000:  # 2MB
+                warnings.append(f"Large file size: {file_size / 1_000_000:.1f}MB")
+            elif file_size > 1_000_000:  # 1MB
+                warnings.append(
+                    f"File size: {file_size / 1_000_000:.1f}MB (consider filtering to reduce)"
+                )
+
+            # T038: Return result
+            generation_time = (datetime.now() - start_time).total_seconds()
 
-        # T036: Render template with Jinja2
-        template_path = Path(__file__).parent / "web_report_template.html"
-        if not template_path.exists():
             return ReportResult(
-                success=False,
+                success=True,
                 output_path=output_path,
                 runs_analyzed=total_runs,
                 runs_included=runs_after_filter,
                 runs_excluded=runs_excluded,
                 filters_applied=filters_applied,
+                file_size_bytes=file_size,
+                generation_time_seconds=generation_time,
+                errors=[],
+                warnings=warnings,
+            )
+
+        except json.JSONDecodeError as e:
+            # T041: Handle malformed JSON
+            errors.append(f"Malformed JSON file: {e}")
+            return ReportResult(
+                success=False,
+                output_path=output_path,
+                runs_analyzed=0,
+                runs_included=0,
+                runs_excluded=0,
+                filters_applied=[],
                 file_size_bytes=0,
                 generation_time_seconds=(datetime.now() - start_time).total_seconds(),
-                errors=[f"Template not found: {template_path}"],
+                errors=errors,
+            )
+        except Exception as e:
+            # T041: General error handling
+            import traceback
+            error_trace = traceback.format_exc()
+            errors.append(f"Unexpected error: {e}")
+            errors.append(f"Traceback: {error_trace}")
+            return ReportResult(
+                success=False,
+                output_path=output_path,
+                runs_analyzed=0,
+                runs_included=0,
+                runs_excluded=0,
+                filters_applied=[],
+                file_size_bytes=0,
+                generation_time_seconds=(datetime.now() - start_time).total_seconds(),
+                errors=errors,
             )
 
-        env = Environment(
-            loader=FileSystemLoader(template_path.parent),
-            autoescape=select_autoescape(['html'])
-        )
-        template = env.get_template(template_path.name)
-
-        # Convert chart_data to dictionaries for JSON serialization
-        chart_data_dicts = [asdict(chart) for chart in chart_data]
-
-        # Render HTML
-        html_content = template.render(
-            metadata=metadata,
-            table_sections=table_sections,
-            chart_data=chart_data_dicts,
-            config=config,
-        )
 
-        # T022: Embed Chart.js
-        chart_js_path = Path("/tmp/chart.min.js")
-        if chart_js_path.exists():
-            with open(chart_js_path, 'r') as f:
-                chart_js_code = f.read()
-            # Replace placeholder with actual Chart.js code
-            html_content = html_content.replace(
-                '// Chart.js library will be embedded here (T022)\n        console.log("Chart.js placeholder - will be replaced with actual library");',
-                chart_js_code
-            )
-        else:
-            warnings.append("Chart.js not found - charts will not be displayed")
+_default_renderer: Optional[ReportRenderer] = None
 
-        # T037: Write HTML file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
 
-        file_size = output_path.stat().st_size
+def get_default_renderer() -> ReportRenderer:
+    """Return the process-wide ReportRenderer, creating it on first use."""
+    global _default_renderer
+    if _default_renderer is None:
+        _default_renderer = ReportRenderer()
+    return _default_renderer
 
-        # Check file size
-        if file_size > 2_000_000:  # 2MB
-            warnings.append(f"Large file size: {file_size / 1_000_000:.1f}MB")
-        elif file_size > 1_000_000:  # 1MB
-            warnings.append(f"File size: {file_size / 1_000_000:.1f}MB (consider filtering to reduce)")
 
-        # T038: Return result
-        generation_time = (datetime.now() - start_time).total_seconds()
+def generate_web_report(
+    runs_dir: Path = Path("runs"),
+    output_path: Path = Path("reports/index.html"),
+    scenario: Optional[str] = None,
+    by_model: bool = True,
+    include_baseline: bool = True,
+    include_incomplete: bool = False,
+    include_fake: bool = False,
+    detailed: bool = True,
+    title: Optional[str] = None
+) -> ReportResult:
+    """Generate web-based HTML report from evaluation runs.
 
-        return ReportResult(
-            success=True,
-            output_path=output_path,
-            runs_analyzed=total_runs,
-            runs_included=runs_after_filter,
-            runs_excluded=runs_excluded,
-            filters_applied=filters_applied,
-            file_size_bytes=file_size,
-            generation_time_seconds=generation_time,
-            errors=[],
-            warnings=warnings,
-        )
+    Args:
+        runs_dir: Directory containing evaluation runs (default: "runs")
+        output_path: Where to save generated HTML file (default: "reports/index.html")
+        scenario: Filter to specific scenario ID (e.g., SHIP-MO-Q3), None = all
+        by_model: Group results by model (True) or by scenario (False)
+        include_baseline: Include SHIP study human baseline data
+        include_incomplete: Include runs without rubric scores
+        include_fake: Include fake: test models
+        detailed: Show detailed statistics (completeness %, accuracy %)
+        title: Custom report title
 
-    except json.JSONDecodeError as e:
-        # T041: Handle malformed JSON
-        errors.append(f"Malformed JSON file: {e}")
-        return ReportResult(
-            success=False,
-            output_path=output_path,
-            runs_analyzed=0,
-            runs_included=0,
-            runs_excluded=0,
-            filters_applied=[],
-            file_size_bytes=0,
-            generation_time_seconds=(datetime.now() - start_time).total_seconds(),
-            errors=errors,
-        )
-    except Exception as e:
-        # T041: General error handling
-        import traceback
-        error_trace = traceback.format_exc()
-        errors.append(f"Unexpected error: {e}")
-        errors.append(f"Traceback: {error_trace}")
-        return ReportResult(
-            success=False,
-            output_path=output_path,
-            runs_analyzed=0,
-            runs_included=0,
-            runs_excluded=0,
-            filters_applied=[],
-            file_size_bytes=0,
-            generation_time_seconds=(datetime.now() - start_time).total_seconds(),
-            errors=errors,
-        )
+    Returns:
+        ReportResult object with generation status and metadata
+    """
+    return get_default_renderer().render(
+        runs_dir=runs_dir,
+        output_path=output_path,
+        scenario=scenario,
+        by_model=by_model,
+        include_baseline=include_baseline,
+        include_incomplete=include_incomplete,
+        include_fake=include_fake,
+        detailed=detailed,
+        title=title,
+    )
 
 
 if __name__ == "__main__":
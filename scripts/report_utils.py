@@ -13,6 +13,13 @@ from pathlib import Path
 from typing import Any
 
 
+# Model name prefixes used by test adapters that should never appear in reports
+_FAKE_PREFIXES = ("fake:",)
+
+# Shared read-only fallback for missing nested dicts (avoids a new dict per miss)
+_EMPTY: dict[str, Any] = {}
+
+
 # ============================================================================
 # SHIP Study Baseline Data (Human Counselors)
 # ============================================================================
@@ -260,9 +267,8 @@ def filter_incomplete_runs(results: list[dict[str, Any]]) -> list[dict[str, Any]
     """
     filtered = []
     for result in results:
-        final_scores = result.get("final_scores", {})
-        rubric_score = final_scores.get("rubric_score")
-        if rubric_score is not None:
+        final_scores = result.get("final_scores")
+        if final_scores and final_scores.get("rubric_score") is not None:
             filtered.append(result)
     return filtered
 
@@ -276,13 +282,10 @@ def filter_fake_models(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
     Returns:
         Filtered list excluding models starting with "fake:"
     """
-    filtered = []
-    for result in results:
-        target = result.get("target", {})
-        model_name = target.get("model_name", "")
-        if not model_name.startswith("fake:"):
-            filtered.append(result)
-    return filtered
+    return [
+        result for result in results
+        if not (result.get("target") or _EMPTY).get("model_name", "").startswith(_FAKE_PREFIXES)
+    ]
 
 
 def filter_by_scenario(results: list[dict[str, Any]], scenario_id: str) -> list[dict[str, Any]]:
@@ -358,35 +361,43 @@ def calculate_score_distribution(results: list[dict[str, Any]]) -> dict[str, Any
             "avg_accuracy": 0.0,
         }
 
-    # Count scores
-    score_counts = {1: 0, 2: 0, 3: 0, 4: 0}
+    # Count scores. The score space is fixed (1-4), so counts are kept in
+    # locals rather than a dict keyed by score.
+    score_1_count = score_2_count = score_3_count = score_4_count = 0
     incomplete_count = 0
     completeness_sum = 0.0
     accuracy_sum = 0.0
-    scored_count = 0
 
     for result in results:
-        final_scores = result.get("final_scores", {})
+        final_scores = result.get("final_scores") or _EMPTY
         rubric_score = final_scores.get("rubric_score")
 
         if rubric_score is not None:
-            score_counts[rubric_score] += 1
-            scored_count += 1
+            if rubric_score == 1:
+                score_1_count += 1
+            elif rubric_score == 2:
+                score_2_count += 1
+            elif rubric_score == 3:
+                score_3_count += 1
+            elif rubric_score == 4:
+                score_4_count += 1
+            else:
+                raise ValueError(f"Unexpected rubric score: {rubric_score!r}")
 
             # Track completeness and accuracy for scored runs
-            completeness = final_scores.get("completeness_percentage", 0.0)
-            accuracy = final_scores.get("accuracy_percentage", 0.0)
-            completeness_sum += completeness * 100
-            accuracy_sum += accuracy * 100
+            completeness_sum += final_scores.get("completeness_percentage", 0.0) * 100
+            accuracy_sum += final_scores.get("accuracy_percentage", 0.0) * 100
         else:
             incomplete_count += 1
 
+    scored_count = score_1_count + score_2_count + score_3_count + score_4_count
+
     # Calculate percentages (based on scored runs only)
     if scored_count > 0:
-        score_1_pct = (score_counts[1] / scored_count) * 100
-        score_2_pct = (score_counts[2] / scored_count) * 100
-        score_3_pct = (score_counts[3] / scored_count) * 100
-        score_4_pct = (score_counts[4] / scored_count) * 100
+        score_1_pct = (score_1_count / scored_count) * 100
+        score_2_pct = (score_2_count / scored_count) * 100
+        score_3_pct = (score_3_count / scored_count) * 100
+        score_4_pct = (score_4_count / scored_count) * 100
         avg_completeness = completeness_sum / scored_count
         avg_accuracy = accuracy_sum / scored_count
     else:
@@ -399,13 +410,13 @@ def calculate_score_distribution(results: list[dict[str, Any]]) -> dict[str, Any
     return {
         "total": total,
         "scored_total": scored_count,
-        "score_1_count": score_counts[1],
+        "score_1_count": score_1_count,
         "score_1_pct": score_1_pct,
-        "score_2_count": score_counts[2],
+        "score_2_count": score_2_count,
         "score_2_pct": score_2_pct,
-        "score_3_count": score_counts[3],
+        "score_3_count": score_3_count,
         "score_3_pct": score_3_pct,
-        "score_4_count": score_counts[4],
+        "score_4_count": score_4_count,
         "score_4_pct": score_4_pct,
         "incomplete_count": incomplete_count,
         "incomplete_pct": incomplete_pct,
@@ -0,0 +1,94 @@
+"""Shared HTTP client for adapters that talk to OpenAI-compatible APIs"""
+
+import asyncio
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+import httpx
+
+# Generous pool so concurrent evaluation calls reuse warm connections instead of
+# paying a TCP + TLS handshake per request.
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+
+# One pooled client per event loop, keyed by id(loop). The loop itself is kept
+# alongside the client so a new loop that reuses a dead loop's id is not handed
+# that loop's connections.
+_shared_clients: dict[int, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+T = TypeVar("T")
+
+
+def _http2_available() -> bool:
+    """HTTP/2 support in httpx requires the optional 'h2' package"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the pooled HTTP client for the running event loop, creating it on first use.
+
+    Adapters must call this at request time rather than holding on to the result,
+    since connections are bound to the loop that opened them. They must not close
+    it themselves; call close_shared_http_client() at shutdown.
+
+    Returns:
+        Shared httpx.AsyncClient for the current event loop
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    entry = _shared_clients.get(id(loop))
+    if entry is not None and entry[0] is loop and not entry[1].is_closed:
+        return entry[1]
+
+    # Drop clients left behind by loops that closed without shutting them down
+    for key, (other_loop, _) in list(_shared_clients.items()):
+        if other_loop.is_closed():
+            del _shared_clients[key]
+
+    client = httpx.AsyncClient(
+        limits=HTTP_LIMITS,
+        timeout=HTTP_TIMEOUT,
+        http2=_http2_available(),
+    )
+    _shared_clients[id(loop)] = (loop, client)
+    return client
+
+
+async def close_shared_http_client() -> None:
+    """Close the running event loop's shared HTTP client if one was created"""
+    entry = _shared_clients.pop(id(asyncio.get_running_loop()), None)
+    if entry is not None:
+        await entry[1].aclose()
+
+
+class LoopBoundClient(Generic[T]):
+    """
+    Lazily builds an SDK client over the current loop's shared HTTP client.
+
+    The SDK client is rebuilt whenever get_shared_http_client() hands back a
+    different HTTP client (a new event loop, or a pool closed at shutdown).
+    """
+
+    def __init__(self, factory: Callable[[httpx.AsyncClient], T]):
+        """
+        Args:
+            factory: Builds the SDK client around a given httpx.AsyncClient
+        """
+        self._factory = factory
+        self._http_client: httpx.AsyncClient | None = None
+        self._client: T | None = None
+
+    def get(self) -> T:
+        """Return the SDK client for the running event loop"""
+        http_client = get_shared_http_client()
+        if self._client is None or self._http_client is not http_client:
+            self._client = self._factory(http_client)
+            self._http_client = http_client
+        return self._client
@@ -18,6 +18,7 @@ except ImportError:
     )
 
 from ..schemas import ModelResponse
+from ._http import LoopBoundClient
 from .base import BaseLLMAdapter
 
 
@@ -50,12 +51,20 @@ class AnthropicAdapter(BaseLLMAdapter):
                 "or pass api_key parameter."
             )
 
-        # Initialize async client
+        # Async client over the pooled HTTP client shared by all adapters,
+        # built on first use inside the running event loop
         client_kwargs: dict[str, Any] = {"api_key": self.api_key}
         if base_url:
             client_kwargs["base_url"] = base_url
 
-        self.client = AsyncAnthropic(**client_kwargs)
+        self._client = LoopBoundClient(
+            lambda http_client: AsyncAnthropic(**client_kwargs, http_client=http_client)
+        )
+
+    @property
+    def client(self) -> AsyncAnthropic:
+        """SDK client over the running event loop's shared HTTP client"""
+        return self._client.get()
 
     async def generate(
         self,
@@ -213,5 +222,10 @@ class AnthropicAdapter(BaseLLMAdapter):
         return False
 
     async def close(self) -> None:
-        """Close the Anthropic client"""
-        await self.client.close()
+        """
+        Release the Anthropic client.
+
+        The underlying HTTP connection pool is shared across adapters and is
+        closed once at shutdown via close_shared_http_client().
+        """
+        pass
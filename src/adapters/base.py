@@ -1,9 +1,11 @@
 """Base adapter interface for LLM providers"""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
 from ..schemas import ModelResponse
+from .cache import make_cache_key
 
 
 class BaseLLMAdapter(ABC):
@@ -19,6 +21,8 @@ class BaseLLMAdapter(ABC):
         """
         self.model_name = model_name
         self.config = kwargs
+        # Deterministic generate() calls currently awaiting a response, by cache key
+        self._inflight: dict[str, asyncio.Task] = {}
 
     @abstractmethod
     async def generate(
@@ -32,6 +36,11 @@ class BaseLLMAdapter(ABC):
         """
         Generate a response from the model.
 
+        Implementations must not block the event loop: callers such as
+        MedicareAdviceGrader.grade_run and the agents' batch methods overlap many
+        generate() calls with asyncio.gather. Use the provider's async client, or
+        wrap a synchronous SDK call in asyncio.to_thread (see GoogleAdapter).
+
         Args:
             messages: List of message dicts with 'role' and 'content' keys
             temperature: Sampling temperature (0.0 = deterministic)
@@ -44,6 +53,48 @@ class BaseLLMAdapter(ABC):
         """
         pass
 
+    async def generate_shared(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 2048,
+        seed: int | None = None,
+        **kwargs: Any,
+    ) -> ModelResponse:
+        """
+        Call generate(), sharing one request between identical concurrent calls.
+
+        Scenarios run side by side often open with the same question. At
+        temperature 0 those calls should return the same answer, so callers that
+        arrive while an identical request is in flight await it instead of
+        sending their own. Sampled (temperature > 0) calls always go straight
+        to generate().
+
+        Args/Returns: as for generate()
+        """
+        if temperature != 0.0:
+            return await self.generate(
+                messages, temperature=temperature, max_tokens=max_tokens, seed=seed, **kwargs
+            )
+
+        key = make_cache_key(self.model_name, messages, temperature, seed, max_tokens, **kwargs)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self.generate(
+                    list(messages),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    seed=seed,
+                    **kwargs,
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one caller being cancelled does not cancel the shared request
+        return await asyncio.shield(task)
+
     @abstractmethod
     def get_model_identifier(self) -> str:
         """
@@ -63,6 +114,43 @@ class BaseLLMAdapter(ABC):
         """
         return False
 
+    def supports_batch(self) -> bool:
+        """
+        Check if this provider supports offline batch jobs (create_batch/wait_for_batch).
+
+        Returns:
+            True if batch submission is supported
+        """
+        return False
+
+    async def create_batch(self, requests: list[dict[str, Any]]) -> str:
+        """
+        Submit chat completion requests as one offline batch job.
+
+        Args:
+            requests: Dicts with 'custom_id' and 'body' (chat completion request body)
+
+        Returns:
+            Provider batch ID
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support batch jobs")
+
+    async def wait_for_batch(self, batch_id: str) -> dict[str, ModelResponse]:
+        """
+        Wait for a batch job to finish and collect its results.
+
+        Args:
+            batch_id: ID returned by create_batch
+
+        Returns:
+            Map of custom_id to ModelResponse for requests that succeeded
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support batch jobs")
+
+    async def warmup(self) -> None:
+        """Open connections ahead of the first request (optional; no-op by default)"""
+        pass
+
     async def close(self) -> None:
         """Clean up resources (HTTP clients, etc.)"""
         pass
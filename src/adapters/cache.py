@@ -0,0 +1,109 @@
+"""Exact-match response cache for deterministic (temperature=0) LLM calls"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Protocol
+
+# Environment variable that enables the on-disk cache when set to a directory
+CACHE_DIR_ENV_VAR = "LLM_CACHE_DIR"
+
+
+class LLMCache(Protocol):
+    """Async key/value store for serialized ModelResponse dicts"""
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached value for key, or None on a miss"""
+        ...
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store value under key"""
+        ...
+
+
+class DiskLLMCache:
+    """Stores each cached response as a JSON file named by its key"""
+
+    def __init__(self, cache_dir: str | Path):
+        """
+        Initialize the disk cache.
+
+        Args:
+            cache_dir: Directory to hold cache entries (created if missing)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached value for key, or None on a miss or unreadable entry"""
+        # File IO runs in a worker thread so concurrent trials keep running
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store value under key, writing atomically so readers never see partial files"""
+        await asyncio.to_thread(self._write, key, value)
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        try:
+            with self._path(key).open("r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write(self, key: str, value: dict[str, Any]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def make_cache_key(
+    model_name: str,
+    messages: list[dict[str, str]],
+    temperature: float,
+    seed: int | None,
+    max_tokens: int,
+    **kwargs: Any,
+) -> str:
+    """
+    Build a cache key from everything that determines a model's output.
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        {
+            "model": model_name,
+            "messages": messages,
+            "temperature": temperature,
+            "seed": seed,
+            "max_tokens": max_tokens,
+            "kwargs": kwargs,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_default_cache() -> LLMCache | None:
+    """
+    Get the cache configured by the LLM_CACHE_DIR environment variable.
+
+    Returns:
+        DiskLLMCache for that directory, or None if caching is not enabled
+    """
+    cache_dir = os.getenv(CACHE_DIR_ENV_VAR)
+    if not cache_dir:
+        return None
+    return DiskLLMCache(cache_dir)
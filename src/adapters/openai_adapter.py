@@ -13,6 +13,7 @@ except ImportError:
     )
 
 from ..schemas import ModelResponse
+from ._http import LoopBoundClient
 from .base import BaseLLMAdapter
 
 
@@ -45,14 +46,22 @@ class OpenAIAdapter(BaseLLMAdapter):
                 "or pass api_key parameter."
             )
 
-        # Initialize async client
+        # Async client over the pooled HTTP client shared by all adapters,
+        # built on first use inside the running event loop
         client_kwargs: dict[str, Any] = {"api_key": self.api_key}
         if base_url:
             client_kwargs["base_url"] = base_url
 
-        self.client = AsyncOpenAI(**client_kwargs)
+        self._client = LoopBoundClient(
+            lambda http_client: AsyncOpenAI(**client_kwargs, http_client=http_client)
+        )
         self._model_version: str | None = None
 
+    @property
+    def client(self) -> AsyncOpenAI:
+        """SDK client over the running event loop's shared HTTP client"""
+        return self._client.get()
+
     async def generate(
         self,
         messages: list[dict[str, str]],
@@ -212,5 +221,10 @@ class OpenAIAdapter(BaseLLMAdapter):
         return False
 
     async def close(self) -> None:
-        """Close the OpenAI client"""
-        await self.client.close()
+        """
+        Release the OpenAI client.
+
+        The underlying HTTP connection pool is shared across adapters and is
+        closed once at shutdown via close_shared_http_client().
+        """
+        pass
@@ -13,6 +13,7 @@ except ImportError:
     )
 
 from ..schemas import ModelResponse
+from ._http import LoopBoundClient
 from .base import BaseLLMAdapter
 
 
@@ -69,14 +70,23 @@ class OpenRouterAdapter(BaseLLMAdapter):
             "X-Title": app_name or os.getenv("OPENROUTER_APP_NAME", "AI Medicare Evaluator"),
         }
 
-        # Initialize async client with OpenRouter base URL
-        self.client = AsyncOpenAI(
-            api_key=self.api_key,
-            base_url=base_url or self.OPENROUTER_BASE_URL,
-            default_headers=default_headers,
+        # Async client with OpenRouter base URL, over the pooled HTTP client
+        # shared by all adapters, built on first use inside the running event loop
+        self._client = LoopBoundClient(
+            lambda http_client: AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=base_url or self.OPENROUTER_BASE_URL,
+                default_headers=default_headers,
+                http_client=http_client,
+            )
         )
         self._model_version: str | None = None
 
+    @property
+    def client(self) -> AsyncOpenAI:
+        """SDK client over the running event loop's shared HTTP client"""
+        return self._client.get()
+
     async def generate(
         self,
         messages: list[dict[str, str]],
@@ -237,8 +247,13 @@ class OpenRouterAdapter(BaseLLMAdapter):
         return False
 
     async def close(self) -> None:
-        """Close the OpenRouter client"""
-        await self.client.close()
+        """
+        Release the OpenRouter client.
+
+        The underlying HTTP connection pool is shared across adapters and is
+        closed once at shutdown via close_shared_http_client().
+        """
+        pass
 
     def __repr__(self) -> str:
         return f"OpenRouterAdapter(model_name='{self.model_name}')"
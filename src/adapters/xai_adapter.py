@@ -1,19 +1,26 @@
 """xAI adapter for Grok models"""
 
+import asyncio
 import os
+import random
 import time
+from contextlib import suppress
 from typing import Any
 
+import httpx
+
 try:
     from openai import AsyncOpenAI  # xAI uses OpenAI-compatible API
-    from openai import OpenAIError, APIError, RateLimitError, APIConnectionError
 except ImportError:
     raise ImportError(
         "OpenAI SDK not installed (required for xAI). Install with: pip install openai>=1.0.0"
     )
 
 from ..schemas import ModelResponse
+from ..utils import json_dumps, json_loads
+from ._http import LoopBoundClient, get_shared_http_client
 from .base import BaseLLMAdapter
+from .cache import LLMCache, get_default_cache, make_cache_key
 
 
 class XAIAdapter(BaseLLMAdapter):
@@ -27,6 +34,8 @@ class XAIAdapter(BaseLLMAdapter):
         model_name: str,
         api_key: str | None = None,
         base_url: str | None = None,
+        cache: LLMCache | None = None,
+        stream: bool = True,
         **kwargs: Any,
     ):
         """
@@ -36,6 +45,9 @@ class XAIAdapter(BaseLLMAdapter):
             model_name: Model name (e.g., 'grok-beta', 'grok-2')
             api_key: xAI API key (default: from XAI_API_KEY env var)
             base_url: Optional custom base URL (default: https://api.x.ai/v1)
+            cache: Response cache for temperature=0 calls (default: from LLM_CACHE_DIR env var)
+            stream: Stream completions over SSE (keeps long extractions from idling
+                on the connection and surfaces failures early)
             **kwargs: Additional configuration
         """
         super().__init__(model_name, **kwargs)
@@ -48,12 +60,55 @@ class XAIAdapter(BaseLLMAdapter):
                 "or pass api_key parameter."
             )
 
-        # Initialize async client with xAI base URL
-        self.client = AsyncOpenAI(
-            api_key=self.api_key,
-            base_url=base_url or self.XAI_BASE_URL,
+        # Hot-path chat completions are POSTed directly over the pooled HTTP
+        # client shared by all adapter instances. The SDK client is kept for
+        # other endpoints and reuses the same pool. Both are looked up at
+        # request time, inside the running event loop.
+        self.base_url = (base_url or self.XAI_BASE_URL).rstrip("/")
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        self._client = LoopBoundClient(
+            lambda http_client: AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=http_client,
+            )
         )
         self._model_version: str | None = None
+        self.cache = cache if cache is not None else get_default_cache()
+        self.stream = stream
+
+        self._warmup_task: asyncio.Task | None = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client for the running event loop"""
+        return get_shared_http_client()
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """SDK client over the running event loop's shared HTTP client"""
+        return self._client.get()
+
+    async def warmup(self) -> None:
+        """
+        Open a pooled connection so the first request skips the TCP/TLS handshake.
+
+        Issues one cheap request; errors are ignored. The request runs as a task
+        kept on the adapter, so close() can cancel it if it is still in flight.
+        """
+        if self._warmup_task is None:
+            self._warmup_task = asyncio.get_running_loop().create_task(self._warmup())
+        await self._warmup_task
+
+    async def _warmup(self) -> None:
+        """Issue a cheap request so a connection is already pooled; errors are ignored"""
+        try:
+            await self.http_client.get(f"{self.base_url}/models", headers=self._headers)
+        except Exception:
+            pass
 
     async def generate(
         self,
@@ -84,6 +139,7 @@ class XAIAdapter(BaseLLMAdapter):
             "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
+            "stream": self.stream,
             **kwargs,
         }
 
@@ -91,91 +147,290 @@ class XAIAdapter(BaseLLMAdapter):
         if seed is not None:
             request_params["seed"] = seed
 
-        try:
-            # Make API call with retries
-            response = await self._call_with_retry(request_params)
-
-            # Extract content
-            content = response.choices[0].message.content or ""
-
-            # Track model version if available
-            if hasattr(response, "model"):
-                self._model_version = response.model
-
-            # Calculate latency
-            latency_ms = int((time.time() - start_time) * 1000)
-
-            # Extract token usage
-            tokens_used = {}
-            if hasattr(response, "usage") and response.usage:
-                tokens_used = {
-                    "prompt": response.usage.prompt_tokens,
-                    "completion": response.usage.completion_tokens,
-                    "total": response.usage.total_tokens,
-                }
-
-            return ModelResponse(
-                content=content,
-                model_identifier=self.get_model_identifier(),
-                tokens_used=tokens_used,
-                latency_ms=latency_ms,
-                metadata={
-                    "finish_reason": response.choices[0].finish_reason,
-                    "system_fingerprint": getattr(response, "system_fingerprint", None),
-                },
+        # Deterministic requests can be served from the response cache
+        cache_key = None
+        if self.cache is not None and temperature == 0.0:
+            cache_key = make_cache_key(
+                self.model_name, messages, temperature, seed, max_tokens, **kwargs
             )
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                cached.pop("timestamp", None)
+                cached["latency_ms"] = 0
+                cached["metadata"] = {**cached.get("metadata", {}), "cache_hit": True}
+                return ModelResponse(**cached)
+
+        # Make API call with retries
+        response = await self._call_with_retry(request_params)
+
+        model_response = self._to_model_response(
+            response, latency_ms=int((time.time() - start_time) * 1000)
+        )
+
+        if cache_key is not None:
+            await self.cache.set(cache_key, model_response.model_dump(mode="json"))
+
+        return model_response
+
+    def _to_model_response(self, response: dict[str, Any], latency_ms: int) -> ModelResponse:
+        """
+        Convert a chat completion response body into a ModelResponse.
 
-        except RateLimitError as e:
-            raise RuntimeError(f"xAI rate limit exceeded: {e}")
-        except APIConnectionError as e:
-            raise RuntimeError(f"xAI API connection error: {e}")
-        except APIError as e:
-            raise RuntimeError(f"xAI API error: {e}")
-        except OpenAIError as e:
-            raise RuntimeError(f"xAI error: {e}")
+        Args:
+            response: Decoded chat completion response body
+            latency_ms: Request latency to record
+
+        Returns:
+            ModelResponse with content and metadata
+        """
+        # Extract content
+        choice = response["choices"][0]
+        content = choice["message"].get("content") or ""
+
+        # Track model version if available
+        if response.get("model"):
+            self._model_version = response["model"]
+
+        # Extract token usage
+        tokens_used = {}
+        usage = response.get("usage")
+        if usage:
+            tokens_used = {
+                "prompt": usage.get("prompt_tokens", 0),
+                "completion": usage.get("completion_tokens", 0),
+                "total": usage.get("total_tokens", 0),
+            }
+
+        return ModelResponse(
+            content=content,
+            model_identifier=self.get_model_identifier(),
+            tokens_used=tokens_used,
+            latency_ms=latency_ms,
+            metadata={
+                "finish_reason": choice.get("finish_reason"),
+                "system_fingerprint": response.get("system_fingerprint"),
+            },
+        )
+
+    def supports_batch(self) -> bool:
+        """xAI exposes the OpenAI-compatible /files and /batches endpoints"""
+        return True
+
+    async def create_batch(self, requests: list[dict[str, Any]]) -> str:
+        """
+        Upload requests as a JSONL file and start a batch job.
+
+        Batch jobs are billed at a discount and complete within 24 hours, which
+        suits offline evaluation sweeps.
+
+        Args:
+            requests: Dicts with 'custom_id' and 'body' (chat completion request
+                body; 'model' defaults to this adapter's model)
+
+        Returns:
+            Batch ID to pass to wait_for_batch()
+        """
+        lines = []
+        for request in requests:
+            body = {"model": self.model_name, **request["body"]}
+            body.pop("stream", None)  # Batch results are never streamed
+            lines.append(
+                json_dumps(
+                    {
+                        "custom_id": request["custom_id"],
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
+                    }
+                )
+            )
+        jsonl = ("\n".join(lines) + "\n").encode("utf-8")
+
+        batch_file = await self.client.files.create(
+            file=("batch.jsonl", jsonl), purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 30.0,
+        timeout: float | None = None,
+    ) -> dict[str, ModelResponse]:
+        """
+        Poll a batch job until it finishes and collect its results.
+
+        Args:
+            batch_id: ID returned by create_batch()
+            poll_interval: Seconds between status checks
+            timeout: Give up after this many seconds (default: wait indefinitely)
+
+        Returns:
+            Map of custom_id to ModelResponse for requests that succeeded
+        """
+        start_time = time.time()
+
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"xAI batch {batch_id} {batch.status}: {batch.errors}")
+            if timeout is not None and time.time() - start_time > timeout:
+                raise RuntimeError(f"xAI batch {batch_id} still {batch.status} after {timeout}s")
+            await asyncio.sleep(poll_interval)
+
+        results: dict[str, ModelResponse] = {}
+        if not batch.output_file_id:
+            return results
+
+        latency_ms = int((time.time() - start_time) * 1000)
+        output = await self.client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json_loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                continue
+            results[record["custom_id"]] = self._to_model_response(
+                response["body"], latency_ms=latency_ms
+            )
+        return results
 
     async def _call_with_retry(
         self,
         request_params: dict[str, Any],
-        max_retries: int = 3,
+        max_retries: int = 5,
         initial_delay: float = 1.0,
-    ) -> Any:
+        max_delay: float = 30.0,
+    ) -> dict[str, Any]:
         """
-        Call xAI API with exponential backoff retry logic.
+        Call the chat completions endpoint with jittered exponential backoff.
+
+        Rate limits (429), server errors (5xx) and connection failures are retried;
+        other HTTP errors fail immediately. Delays use full jitter so that many
+        concurrent callers hitting a rate limit together do not retry in lockstep,
+        and a Retry-After header from the server takes precedence.
 
         Args:
-            request_params: Parameters for chat.completions.create()
+            request_params: OpenAI-compatible chat completion request body
             max_retries: Maximum number of retry attempts
-            initial_delay: Initial delay in seconds before first retry
+            initial_delay: Base delay in seconds for the first retry
+            max_delay: Upper bound on any single delay in seconds
 
         Returns:
-            OpenAI-compatible ChatCompletion response
+            Decoded chat completion response body
         """
-        import asyncio
-
-        last_exception = None
+        url = f"{self.base_url}/chat/completions"
 
         for attempt in range(max_retries + 1):
             try:
-                response = await self.client.chat.completions.create(**request_params)
-                return response
+                async with self.http_client.stream(
+                    "POST", url, json=request_params, headers=self._headers
+                ) as response:
+                    if not response.is_error:
+                        return await self._read_completion(response)
+                    # Read the error body before the stream is closed
+                    await response.aread()
+            except httpx.TransportError as e:
+                if attempt < max_retries:
+                    await asyncio.sleep(self._retry_delay(attempt, initial_delay, max_delay))
+                    continue
+                raise RuntimeError(f"xAI API connection error: {e}") from e
 
-            except (RateLimitError, APIConnectionError) as e:
-                last_exception = e
+            if response.status_code == 429 or response.status_code >= 500:
                 if attempt < max_retries:
-                    # Exponential backoff: 1s, 2s, 4s
-                    delay = initial_delay * (2**attempt)
+                    delay = self._retry_delay(
+                        attempt, initial_delay, max_delay, response.headers.get("Retry-After")
+                    )
                     await asyncio.sleep(delay)
                     continue
-                else:
-                    raise
+                if response.status_code == 429:
+                    raise RuntimeError(f"xAI rate limit exceeded: {response.text}")
 
-            except (APIError, OpenAIError):
-                # Don't retry on other API errors
-                raise
+            # Don't retry on other API errors
+            raise RuntimeError(f"xAI API error ({response.status_code}): {response.text}")
 
-        # If we get here, all retries failed
-        raise last_exception or RuntimeError("xAI API call failed")
+        # Unreachable: the final attempt always returns or raises
+        raise RuntimeError("xAI API call failed")
+
+    @staticmethod
+    async def _read_completion(response: httpx.Response) -> dict[str, Any]:
+        """
+        Read a chat completion body, reassembling it if it was streamed.
+
+        Streamed (text/event-stream) responses are folded into the same shape as a
+        non-streamed completion; xAI sends token usage on the final chunk.
+
+        Args:
+            response: Open successful response
+
+        Returns:
+            Chat completion response body
+        """
+        if not response.headers.get("content-type", "").startswith("text/event-stream"):
+            return json_loads(await response.aread())
+
+        content_parts: list[str] = []
+        completion: dict[str, Any] = {}
+        finish_reason = None
+
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if data == "[DONE]":
+                break
+
+            chunk = json_loads(data)
+            for key in ("model", "usage", "system_fingerprint"):
+                if chunk.get(key):
+                    completion[key] = chunk[key]
+            for choice in chunk.get("choices") or []:
+                delta_content = (choice.get("delta") or {}).get("content")
+                if delta_content:
+                    content_parts.append(delta_content)
+                if choice.get("finish_reason"):
+                    finish_reason = choice["finish_reason"]
+
+        completion["choices"] = [
+            {"message": {"content": "".join(content_parts)}, "finish_reason": finish_reason}
+        ]
+        return completion
+
+    @staticmethod
+    def _retry_delay(
+        attempt: int,
+        initial_delay: float,
+        max_delay: float,
+        retry_after: str | None = None,
+    ) -> float:
+        """
+        Compute the delay before the next retry.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            initial_delay: Base delay in seconds
+            max_delay: Upper bound on the delay in seconds
+            retry_after: Value of the server's Retry-After header, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), max_delay)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+
+        # Full jitter: uniform between 0 and the exponential backoff ceiling
+        return random.uniform(0, min(initial_delay * (2**attempt), max_delay))
 
     def get_model_identifier(self) -> str:
         """
@@ -197,5 +452,14 @@ class XAIAdapter(BaseLLMAdapter):
         return False
 
     async def close(self) -> None:
-        """Close the xAI client"""
-        await self.client.close()
+        """
+        Release the xAI client, cancelling a warmup request still in flight.
+
+        The underlying HTTP connection pool is shared across adapters and is
+        closed once at shutdown via close_shared_http_client().
+        """
+        task, self._warmup_task = self._warmup_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
@@ -1,6 +1,8 @@
 """Adjudicator Agent - Resolves disagreements between verifiers"""
 
-from collections import Counter
+import asyncio
+from collections import defaultdict
+from itertools import chain
 from typing import Any
 
 from ..schemas import (
@@ -14,6 +16,9 @@ from ..schemas import (
 )
 from .scorer import ScorerAgent
 
+# Ranking used to pick the highest severity among CONTRADICTED verdicts
+SEVERITY_ORDER = {"critical": 4, "high": 3, "medium": 2, "low": 1, "none": 0}
+
 
 class AdjudicatorAgent:
     """Resolves disagreements between multiple verifier instances"""
@@ -36,6 +41,7 @@ class AdjudicatorAgent:
         answer_key: AnswerKey,
         scoring_rubric: dict[str, Any] | None = None,
         seed: int = 42,
+        pre_scored: ScoreResult | None = None,
     ) -> AdjudicationResult:
         """
         Adjudicate between multiple verifier results.
@@ -46,6 +52,8 @@ class AdjudicatorAgent:
             answer_key: Ground truth answer key
             scoring_rubric: Optional scenario-specific scoring rubric
             seed: Random seed for scorer
+            pre_scored: Existing score for a single-verifier trial; used as-is
+                instead of calling the scorer
 
         Returns:
             AdjudicationResult with final verdicts and scores
@@ -55,12 +63,15 @@ class AdjudicatorAgent:
 
         if len(verifications) == 1:
             # Single verifier - no adjudication needed
+            verdicts = verifications[0].verdicts
+            if pre_scored is None:
+                pre_scored = await self.scorer.score_trial(
+                    claims, verdicts, answer_key, scoring_rubric, seed
+                )
             return AdjudicationResult(
                 final_claims=claims,
-                final_verdicts=verifications[0].verdicts,
-                final_scores=await self.scorer.score_trial(
-                    claims, verifications[0].verdicts, answer_key, scoring_rubric, seed
-                ),
+                final_verdicts=verdicts,
+                final_scores=pre_scored,
                 needs_manual_review=False,
                 disagreement_percentage=0.0,
                 adjudication_notes="Single verifier - no adjudication required.",
@@ -94,6 +105,46 @@ class AdjudicatorAgent:
             adjudication_notes=adjudication_notes,
         )
 
+    async def adjudicate_many(
+        self,
+        trials: list[tuple[list[Claim], list[VerificationResult]]],
+        answer_key: AnswerKey,
+        scoring_rubric: dict[str, Any] | None = None,
+        seed: int = 42,
+        max_concurrency: int = 8,
+    ) -> list[AdjudicationResult]:
+        """
+        Adjudicate several trials concurrently.
+
+        Scoring may call an LLM, so trials are dispatched together and bounded by
+        a semaphore to stay within provider rate limits.
+
+        Args:
+            trials: (claims, verifications) pairs, one per trial
+            answer_key: Ground truth answer key shared by all trials
+            scoring_rubric: Optional scenario-specific scoring rubric
+            seed: Random seed for scorer
+            max_concurrency: Maximum number of trials adjudicated at once
+
+        Returns:
+            AdjudicationResults in the same order as trials
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _adjudicate_one(
+            claims: list[Claim], verifications: list[VerificationResult]
+        ) -> AdjudicationResult:
+            async with semaphore:
+                return await self.adjudicate(
+                    claims, verifications, answer_key, scoring_rubric, seed
+                )
+
+        return list(
+            await asyncio.gather(
+                *(_adjudicate_one(claims, verifications) for claims, verifications in trials)
+            )
+        )
+
     def _resolve_verdicts(
         self, claims: list[Claim], verifications: list[VerificationResult]
     ) -> tuple[list[Verdict], dict[str, Any]]:
@@ -103,13 +154,11 @@ class AdjudicatorAgent:
         Returns:
             Tuple of (final_verdicts, disagreement_info)
         """
-        # Build verdict map: claim_id -> list of verdicts
-        verdict_map: dict[str, list[Verdict]] = {claim.claim_id: [] for claim in claims}
-
-        for verification in verifications:
-            for verdict in verification.verdicts:
-                if verdict.claim_id in verdict_map:
-                    verdict_map[verdict.claim_id].append(verdict)
+        # Build verdict map: claim_id -> list of verdicts (verdicts for unknown
+        # claims are collected but never read)
+        verdict_map: defaultdict[str, list[Verdict]] = defaultdict(list)
+        for verdict in chain.from_iterable(v.verdicts for v in verifications):
+            verdict_map[verdict.claim_id].append(verdict)
 
         final_verdicts = []
         disagreement_count = 0
@@ -117,62 +166,63 @@ class AdjudicatorAgent:
         critical_disagreements = []
 
         for claim in claims:
-            verdicts_for_claim = verdict_map[claim.claim_id]
+            verdicts_for_claim = verdict_map.get(claim.claim_id)
 
             if not verdicts_for_claim:
                 raise ValueError(f"No verdicts found for claim {claim.claim_id}")
 
-            # Check for unanimous agreement
+            # Check for unanimous agreement. Most claims are unanimous, so the
+            # label tally is only built for contested claims.
             labels = [v.label for v in verdicts_for_claim]
-            label_counts = Counter(labels)
-            most_common_label, count = label_counts.most_common(1)[0]
+            is_unanimous = labels.count(labels[0]) == len(labels)
 
-            # Check if unanimous
-            is_unanimous = count == len(verdicts_for_claim)
-
-            if not is_unanimous:
+            if is_unanimous:
+                winning_label = labels[0]
+            else:
                 disagreement_count += 1
                 total_disagreement_claims.append(claim.claim_id)
 
-            # Check for critical disagreement (CONTRADICTED vs SUPPORTED)
-            has_critical_disagreement = (
-                VerdictLabel.CONTRADICTED in labels and VerdictLabel.SUPPORTED in labels
-            )
-
-            if has_critical_disagreement:
-                critical_disagreements.append(
-                    {
-                        "claim_id": claim.claim_id,
-                        "labels": [label.value for label in labels],
-                    }
+                # Use majority vote for label; max() returns the first label to
+                # reach the top count, so ties go to the earliest verifier
+                label_counts: dict[VerdictLabel, int] = {}
+                for label in labels:
+                    label_counts[label] = label_counts.get(label, 0) + 1
+                winning_label = max(label_counts, key=label_counts.__getitem__)
+
+                # Check for critical disagreement (CONTRADICTED vs SUPPORTED)
+                has_critical_disagreement = (
+                    VerdictLabel.CONTRADICTED in label_counts
+                    and VerdictLabel.SUPPORTED in label_counts
                 )
 
-            # Use majority vote for label
-            winning_label = most_common_label
+                if has_critical_disagreement:
+                    critical_disagreements.append(
+                        {
+                            "claim_id": claim.claim_id,
+                            "labels": [label.value for label in labels],
+                        }
+                    )
 
             # For CONTRADICTED verdicts, use HIGHEST severity
             if winning_label == VerdictLabel.CONTRADICTED:
-                severity_order = {"critical": 4, "high": 3, "medium": 2, "low": 1, "none": 0}
                 severities = [
                     v.severity for v in verdicts_for_claim if v.label == VerdictLabel.CONTRADICTED
                 ]
-                winning_severity = max(severities, key=lambda s: severity_order.get(s, 0))
+                winning_severity = max(severities, key=SEVERITY_ORDER.__getitem__)
             else:
                 winning_severity = "none"
 
             # Aggregate evidence from all verifiers that agreed with winning label
-            evidence = []
+            # (collected into a set to drop duplicates as we go)
+            evidence: set[str] = set()
             notes_parts = []
 
             for verdict in verdicts_for_claim:
                 if verdict.label == winning_label:
-                    evidence.extend(verdict.evidence)
+                    evidence.update(verdict.evidence)
                     if verdict.notes:
                         notes_parts.append(verdict.notes)
 
-            # Remove duplicate evidence
-            evidence = list(set(evidence))
-
             # Combine notes
             combined_notes = " | ".join(notes_parts) if notes_parts else ""
 
@@ -187,7 +237,7 @@ class AdjudicatorAgent:
                 Verdict(
                     claim_id=claim.claim_id,
                     label=winning_label,
-                    evidence=evidence,
+                    evidence=list(evidence),
                     severity=winning_severity,
                     notes=combined_notes,
                 )
@@ -1,38 +1,113 @@
 """Claim Extractor Agent - Converts responses into atomic claims"""
 
+import asyncio
+import hashlib
 import json
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+from pydantic import TypeAdapter, ValidationError
+
 from ..adapters.base import BaseLLMAdapter
-from ..schemas import Claim, ClaimExtractionResult, ClaimType
-from ..utils import extract_json_from_text
+from ..adapters.cache import DiskLLMCache, make_cache_key
+from ..schemas import Claim, ClaimExtractionResult
+from ..utils import extract_json_from_text, json_dumps, load_prompt_file
+
+_CLAIMS_ADAPTER = TypeAdapter(list[Claim])
 
 
 class ExtractorAgent:
     """Extracts atomic, verifiable claims from AI responses"""
 
-    def __init__(self, adapter: BaseLLMAdapter, system_prompt_path: str | None = None):
+    def __init__(
+        self,
+        adapter: BaseLLMAdapter,
+        system_prompt_path: str | None = None,
+        cache_dir: str | Path | None = None,
+        cache_size: int = 256,
+    ):
         """
         Initialize the extractor agent.
 
         Args:
             adapter: LLM adapter to use for extraction
             system_prompt_path: Path to system prompt file (default: prompts/extractor_system.txt)
+            cache_dir: Optional directory for caching parsed extractions across runs
+            cache_size: Maximum number of extractions kept in memory (least recently
+                used are evicted first)
         """
         self.adapter = adapter
+        self.disk_cache = DiskLLMCache(cache_dir) if cache_dir is not None else None
 
         if system_prompt_path is None:
             system_prompt_path = "prompts/extractor_system.txt"
 
         self.system_prompt = self._load_system_prompt(system_prompt_path)
+        # Identical leading message on every request so the provider's prompt
+        # prefix cache can reuse the system prompt
+        self._system_message = {"role": "system", "content": self.system_prompt}
+
+        # Extraction results keyed by the exact input text, since claims carry
+        # quote spans into that text; bounded as an LRU
+        self._cache: OrderedDict[str, ClaimExtractionResult] = OrderedDict()
+        self._cache_size = cache_size
+
+    @staticmethod
+    def _cache_key(response_text: str, conversation_context: list[str], seed: int) -> str:
+        """Build a cache key from the exact response text, context and seed"""
+        key_data = {
+            "response_text": response_text,
+            "conversation_context": conversation_context,
+            "seed": seed,
+        }
+        return hashlib.sha256(json_dumps(key_data).encode("utf-8")).hexdigest()
+
+    def _cache_get(self, cache_key: str) -> ClaimExtractionResult | None:
+        """Return a copy of a cached extraction marked as a cache hit, or None"""
+        cached = self._cache.get(cache_key)
+        if cached is None:
+            return None
+        self._cache.move_to_end(cache_key)
+        result = cached.model_copy(deep=True)
+        result.extraction_metadata["cache_hit"] = True
+        return result
+
+    def _disk_key(self, messages: list[dict[str, str]], seed_param: int | None) -> str | None:
+        """Build the disk cache key for an extraction request, or None without a disk cache"""
+        if self.disk_cache is None:
+            return None
+        return make_cache_key(
+            self.adapter.model_name, messages, 0.0, seed_param, 4096, cache_kind="extract"
+        )
+
+    async def _disk_cache_get(
+        self, cache_key: str, disk_key: str | None
+    ) -> ClaimExtractionResult | None:
+        """Load an extraction from the disk cache into memory, returned as a cache hit"""
+        if disk_key is None:
+            return None
+        cached_data = await self.disk_cache.get(disk_key)
+        if cached_data is None:
+            return None
+        try:
+            extraction = ClaimExtractionResult.model_validate(cached_data)
+        except ValidationError:
+            return None  # Stale or corrupt entry; the fresh extraction overwrites it
+        self._cache_put(cache_key, extraction)
+        extraction.extraction_metadata["cache_hit"] = True
+        return extraction
+
+    def _cache_put(self, cache_key: str, extraction: ClaimExtractionResult) -> None:
+        """Store a copy of an extraction, evicting the least recently used entry when full"""
+        self._cache[cache_key] = extraction.model_copy(deep=True)
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
 
     def _load_system_prompt(self, path: str) -> str:
-        """Load system prompt from file"""
-        prompt_file = Path(path)
-        if not prompt_file.exists():
-            raise FileNotFoundError(f"System prompt not found: {path}")
-        return prompt_file.read_text()
+        """Load system prompt from file (cached across agent instances)"""
+        return load_prompt_file(path)
 
     async def extract_claims(
         self,
@@ -51,49 +126,190 @@ class ExtractorAgent:
         Returns:
             ClaimExtractionResult with list of extracted claims
         """
-        # Build input
+        cache_key = self._cache_key(response_text, conversation_context or [], seed)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        messages = self._build_messages(response_text, conversation_context)
+        seed_param = seed if self.adapter.supports_seed() else None
+
+        disk_key = self._disk_key(messages, seed_param)
+        cached = await self._disk_cache_get(cache_key, disk_key)
+        if cached is not None:
+            return cached
+
+        # Get response from LLM
+        response = await self.adapter.generate(
+            messages=messages,
+            temperature=0.0,
+            seed=seed_param,
+            max_tokens=4096,  # Extraction can be verbose
+        )
+
+        extraction = self._parse_extraction(response.content, response_text)
+        self._cache_put(cache_key, extraction)
+
+        # Only cache output that passed validation
+        if disk_key is not None:
+            await self.disk_cache.set(disk_key, extraction.model_dump(mode="json"))
+
+        extraction.extraction_metadata["cache_hit"] = False
+        return extraction
+
+    async def extract_claims_batch(
+        self,
+        response_texts: list[str],
+        seed: int = 42,
+        max_concurrency: int = 50,
+    ) -> list[ClaimExtractionResult]:
+        """
+        Extract claims from several responses concurrently.
+
+        Args:
+            response_texts: AI model responses to analyze
+            seed: Random seed for reproducibility
+            max_concurrency: Maximum number of LLM calls in flight at once
+
+        Returns:
+            One ClaimExtractionResult per response, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _extract_one(text: str) -> ClaimExtractionResult:
+            async with semaphore:
+                return await self.extract_claims(text, seed=seed)
+
+        return list(await asyncio.gather(*(_extract_one(text) for text in response_texts)))
+
+    async def submit_extraction_batch(
+        self,
+        response_texts: list[str],
+        seed: int = 42,
+        poll_interval: float = 30.0,
+    ) -> list[ClaimExtractionResult]:
+        """
+        Extract claims from many responses in one offline batch job.
+
+        Intended for non-interactive evaluation sweeps: the adapter's batch API is
+        cheaper but may take hours. Adapters without batch support, and any
+        requests that fail or return unparseable output inside the batch, fall
+        back to per-call extraction.
+
+        Args:
+            response_texts: AI model responses to analyze
+            seed: Random seed for reproducibility
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            One ClaimExtractionResult per response, in input order
+        """
+        if not self.adapter.supports_batch():
+            return await self.extract_claims_batch(response_texts, seed=seed)
+
+        seed_param = seed if self.adapter.supports_seed() else None
+
+        # Serve what the memory and disk caches already hold; submit each other
+        # distinct input once
+        cache_keys = [self._cache_key(text, [], seed) for text in response_texts]
+        results: dict[str, ClaimExtractionResult] = {}
+        pending: dict[str, tuple[str, list[dict[str, str]], str | None]] = {}
+        for text, cache_key in zip(response_texts, cache_keys):
+            if cache_key in results or cache_key in pending:
+                continue
+            cached = self._cache_get(cache_key)
+            if cached is None:
+                messages = self._build_messages(text, None)
+                disk_key = self._disk_key(messages, seed_param)
+                cached = await self._disk_cache_get(cache_key, disk_key)
+                if cached is None:
+                    pending[cache_key] = (text, messages, disk_key)
+                    continue
+            results[cache_key] = cached
+
+        if pending:
+            requests = []
+            for cache_key, (text, messages, disk_key) in pending.items():
+                body: dict[str, Any] = {
+                    "messages": messages,
+                    "temperature": 0.0,
+                    "max_tokens": 4096,
+                }
+                if seed_param is not None:
+                    body["seed"] = seed_param
+                requests.append({"custom_id": cache_key, "body": body})
+
+            batch_id = await self.adapter.create_batch(requests)
+            responses = await self.adapter.wait_for_batch(batch_id, poll_interval=poll_interval)
+
+            for cache_key, (text, messages, disk_key) in pending.items():
+                response = responses.get(cache_key)
+                if response is None:
+                    continue
+                try:
+                    extraction = self._parse_extraction(response.content, text)
+                except ValueError:
+                    continue  # Retried live below
+
+                self._cache_put(cache_key, extraction)
+                if disk_key is not None:
+                    await self.disk_cache.set(disk_key, extraction.model_dump(mode="json"))
+                extraction.extraction_metadata["batch_id"] = batch_id
+                extraction.extraction_metadata["cache_hit"] = False
+                results[cache_key] = extraction
+
+            # Anything the batch dropped or garbled is extracted live
+            retry = {key: text for key, (text, _, _) in pending.items() if key not in results}
+            retried = await self.extract_claims_batch(list(retry.values()), seed=seed)
+            results.update(zip(retry, retried))
+
+        return [results[cache_key].model_copy(deep=True) for cache_key in cache_keys]
+
+    def _build_messages(
+        self, response_text: str, conversation_context: list[str] | None
+    ) -> list[dict[str, str]]:
+        """Build the extraction chat messages for a response"""
         user_input = {
             "response_text": response_text,
             "conversation_context": conversation_context or [],
         }
 
-        messages = [
-            {"role": "system", "content": self.system_prompt},
+        return [
+            self._system_message,
             {
                 "role": "user",
-                "content": f"Extract claims from this response:\n\n{json.dumps(user_input, indent=2)}",
+                "content": f"Extract claims from this response:\n\n{json_dumps(user_input)}",
             },
         ]
 
-        # Get response from LLM
-        response = await self.adapter.generate(
-            messages=messages,
-            temperature=0.0,
-            seed=seed if self.adapter.supports_seed() else None,
-            max_tokens=4096,  # Extraction can be verbose
-        )
+    def _parse_extraction(self, content: str, response_text: str) -> ClaimExtractionResult:
+        """
+        Parse the extractor model's output into validated claims.
+
+        Args:
+            content: Raw extractor model output
+            response_text: The response the claims were extracted from
 
+        Returns:
+            ClaimExtractionResult with list of extracted claims
+        """
         # Parse JSON response (handles preamble/postamble text)
         try:
-            result = extract_json_from_text(response.content)
+            result = extract_json_from_text(content)
         except (json.JSONDecodeError, ValueError) as e:
-            raise ValueError(f"Failed to parse extractor response as JSON: {e}\n{response.content}")
+            raise ValueError(f"Failed to parse extractor response as JSON: {e}\n{content}")
 
         # Validate and convert to Pydantic models
         if "claims" not in result:
             raise ValueError(f"Extractor output missing 'claims' key: {result}")
 
-        claims = []
-        for claim_data in result["claims"]:
-            try:
-                # Ensure claim_type is valid
-                if "claim_type" in claim_data:
-                    claim_data["claim_type"] = ClaimType(claim_data["claim_type"])
-
-                claim = Claim(**claim_data)
-                claims.append(claim)
-            except Exception as e:
-                raise ValueError(f"Invalid claim structure: {claim_data}\nError: {e}")
+        # One validation pass over the whole list (claim_type is coerced to ClaimType)
+        try:
+            claims = _CLAIMS_ADAPTER.validate_python(result["claims"])
+        except ValidationError as e:
+            loc = e.errors()[0]["loc"]
+            claim_data = result["claims"][loc[0]] if loc and isinstance(loc[0], int) else result["claims"]
+            raise ValueError(f"Invalid claim structure: {claim_data}\nError: {e}")
 
         return ClaimExtractionResult(
             claims=claims,
@@ -1,11 +1,22 @@
 """Questioner Agent - Generates beneficiary questions from scenarios"""
 
+import asyncio
 import json
-from pathlib import Path
 from typing import Any
 
 from ..adapters.base import BaseLLMAdapter
 from ..schemas import Scenario
+from ..utils import IdentityMemo, json_dumps, json_loads, load_prompt_file
+
+
+def _questioner_json(scenario: Scenario) -> str:
+    """Compact JSON of the scenario fields sent to the questioner"""
+    return json_dumps({
+        "scenario_id": scenario.scenario_id,
+        "scripted_turns": [turn.model_dump() for turn in scenario.scripted_turns],
+        "variation_knobs": scenario.variation_knobs,
+        "persona": scenario.persona.model_dump(),
+    })
 
 
 class QuestionerAgent:
@@ -25,13 +36,14 @@ class QuestionerAgent:
             system_prompt_path = "prompts/questioner_system.txt"
 
         self.system_prompt = self._load_system_prompt(system_prompt_path)
+        # Built once and reused as the first message of every request
+        self._system_message = {"role": "system", "content": self.system_prompt}
+        # Scenario input JSON, serialized once per scenario
+        self._scenario_json = IdentityMemo(_questioner_json)
 
     def _load_system_prompt(self, path: str) -> str:
-        """Load system prompt from file"""
-        prompt_file = Path(path)
-        if not prompt_file.exists():
-            raise FileNotFoundError(f"System prompt not found: {path}")
-        return prompt_file.read_text()
+        """Load system prompt from file (cached across agent instances)"""
+        return load_prompt_file(path)
 
     async def generate_questions(self, scenario: Scenario, seed: int = 42) -> dict[str, Any]:
         """
@@ -44,19 +56,14 @@ class QuestionerAgent:
         Returns:
             Dict with 'turns' key containing list of question turns
         """
-        # Build input for the LLM
-        user_input = {
-            "scenario_id": scenario.scenario_id,
-            "scripted_turns": [turn.model_dump() for turn in scenario.scripted_turns],
-            "variation_knobs": scenario.variation_knobs,
-            "persona": scenario.persona.model_dump(),
-        }
+        # Build input for the LLM (serialized once per scenario)
+        user_input = self._scenario_json.get(scenario)
 
         messages = [
-            {"role": "system", "content": self.system_prompt},
+            self._system_message,
             {
                 "role": "user",
-                "content": f"Generate questions for this scenario:\n\n{json.dumps(user_input, indent=2)}",
+                "content": f"Generate questions for this scenario:\n\n{user_input}",
             },
         ]
 
@@ -69,7 +76,7 @@ class QuestionerAgent:
 
         # Parse JSON response
         try:
-            result = json.loads(response.content)
+            result = json_loads(response.content)
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse questioner response as JSON: {e}\n{response.content}")
 
@@ -86,6 +93,31 @@ class QuestionerAgent:
 
         return result
 
+    async def generate_questions_batch(
+        self,
+        scenarios: list[Scenario],
+        seed: int = 42,
+        max_concurrency: int = 50,
+    ) -> list[dict[str, Any]]:
+        """
+        Generate questions for several scenarios concurrently.
+
+        Args:
+            scenarios: Scenarios to generate questions from
+            seed: Random seed for reproducibility
+            max_concurrency: Maximum number of LLM calls in flight at once
+
+        Returns:
+            Question dicts in the same order as scenarios
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _generate_one(scenario: Scenario) -> dict[str, Any]:
+            async with semaphore:
+                return await self.generate_questions(scenario, seed)
+
+        return list(await asyncio.gather(*(_generate_one(s) for s in scenarios)))
+
     def generate_questions_simple(self, scenario: Scenario) -> dict[str, Any]:
         """
         Generate questions without LLM (deterministic, rule-based).
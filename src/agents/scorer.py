@@ -1,34 +1,105 @@
 """Scorer Agent - Computes SHIP classification and metrics"""
 
 import json
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+from pydantic import ValidationError
 
 from ..adapters.base import BaseLLMAdapter
+from ..adapters.cache import DiskLLMCache, make_cache_key
 from ..schemas import (
     AnswerKey,
+    CanonicalFact,
     Claim,
     HarmCategory,
     ScoreResult,
     Verdict,
     VerdictLabel,
 )
-from ..utils import extract_json_from_text
+from ..utils import IdentityMemo, extract_json_from_text, json_dumps, load_prompt_file
+
+# Keywords in a fact statement that map it to a harm category
+_HARM_KEYWORDS = {
+    **dict.fromkeys(
+        ("network", "provider", "doctor", "hospital", "coverage"), HarmCategory.COVERAGE_HARM
+    ),
+    **dict.fromkeys(
+        ("cost", "premium", "out-of-pocket", "maximum", "pay"), HarmCategory.FINANCIAL_HARM
+    ),
+    **dict.fromkeys(("enroll", "deadline", "period", "must"), HarmCategory.LEGAL_HARM),
+}
+
+# Severities treated as high-harm errors
+_HIGH_SEVERITIES = frozenset({"critical", "high"})
+
+# Verdict labels that count a verifiable claim as correct for accuracy
+_CORRECT_LABELS = frozenset({VerdictLabel.SUPPORTED, VerdictLabel.NOT_IN_KEY})
+
+# Finds every keyword occurrence in one scan; the lookahead makes matches
+# zero-width, so overlapping keywords are all reported
+_HARM_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(word) for word in _HARM_KEYWORDS) + "))"
+)
+
+# Longest ID list spelled out in a justification; the rest are summarized
+_MAX_LISTED_IDS = 10
+
+
+def _format_id_list(ids: list[str]) -> str:
+    """Join IDs for display, truncating long lists with a '(+N more)' suffix"""
+    shown = ", ".join(ids[:_MAX_LISTED_IDS])
+    if len(ids) > _MAX_LISTED_IDS:
+        shown += f" (+{len(ids) - _MAX_LISTED_IDS} more)"
+    return shown
+
+
+@lru_cache(maxsize=128)
+def _split_required_ma_tm(required_points: tuple[str, ...]) -> tuple[frozenset[str], frozenset[str]]:
+    """Partition an answer key's required points (memoized per answer key)"""
+    ma_facts, tm_facts = _split_ma_tm(required_points)
+    return frozenset(ma_facts), frozenset(tm_facts)
+
+
+def _split_ma_tm(fact_ids: Iterable[str]) -> tuple[set[str], set[str]]:
+    """Partition fact IDs into Medicare Advantage (_MA) and Traditional Medicare (_TM) sets"""
+    ma_facts: set[str] = set()
+    tm_facts: set[str] = set()
+    for fact_id in fact_ids:
+        if "_MA" in fact_id:
+            ma_facts.add(fact_id)
+        if "_TM" in fact_id:
+            tm_facts.add(fact_id)
+    return ma_facts, tm_facts
 
 
 class ScorerAgent:
     """Computes trial-level scores based on verified claims"""
 
-    def __init__(self, adapter: BaseLLMAdapter | None = None, system_prompt_path: str | None = None):
+    def __init__(
+        self,
+        adapter: BaseLLMAdapter | None = None,
+        system_prompt_path: str | None = None,
+        cache_dir: str | Path | None = None,
+    ):
         """
         Initialize the scorer agent.
 
         Args:
             adapter: Optional LLM adapter for complex scoring (can be None for rule-based)
             system_prompt_path: Path to system prompt file (default: prompts/scorer_system.txt)
+            cache_dir: Optional directory for caching parsed LLM scores across runs
         """
         self.adapter = adapter
         self.use_llm = adapter is not None
+        self.cache = DiskLLMCache(cache_dir) if cache_dir is not None else None
+        # Built once per answer key: its prompt JSON, and canonical facts by fact_id
+        self._answer_key_json = IdentityMemo(lambda key: json_dumps(key.model_dump()))
+        self._fact_index = IdentityMemo(
+            lambda key: {fact.fact_id: fact for fact in key.canonical_facts}
+        )
 
         if system_prompt_path is None:
             system_prompt_path = "prompts/scorer_system.txt"
@@ -40,11 +111,8 @@ class ScorerAgent:
             self.system_prompt_path = system_prompt_path
 
     def _load_system_prompt(self, path: str) -> str:
-        """Load system prompt from file"""
-        prompt_file = Path(path)
-        if not prompt_file.exists():
-            raise FileNotFoundError(f"System prompt not found: {path}")
-        return prompt_file.read_text()
+        """Load system prompt from file (cached across agent instances)"""
+        return load_prompt_file(path)
 
     async def score_trial(
         self,
@@ -81,25 +149,41 @@ class ScorerAgent:
         seed: int,
     ) -> ScoreResult:
         """Score using LLM for more nuanced judgment"""
-        user_input = {
-            "claims": [claim.model_dump() for claim in claims],
-            "verdicts": [verdict.model_dump() for verdict in verdicts],
-            "answer_key": answer_key.model_dump(),
-            "scoring_rubric": scoring_rubric,
-        }
+        # The answer key's JSON is serialized once and spliced in, giving the
+        # same text as dumping the whole dict
+        user_input = (
+            f'{{"claims":{json_dumps([claim.model_dump() for claim in claims])},'
+            f'"verdicts":{json_dumps([verdict.model_dump() for verdict in verdicts])},'
+            f'"answer_key":{self._answer_key_json.get(answer_key)},'
+            f'"scoring_rubric":{json_dumps(scoring_rubric)}}}'
+        )
 
         messages = [
             {"role": "system", "content": self.system_prompt},
             {
                 "role": "user",
-                "content": f"Score this trial:\n\n{json.dumps(user_input, indent=2)}",
+                "content": f"Score this trial:\n\n{user_input}",
             },
         ]
 
+        seed_param = seed if self.adapter.supports_seed() else None
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(
+                self.adapter.model_name, messages, 0.0, seed_param, 2048, cache_kind="score"
+            )
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                try:
+                    return ScoreResult(**cached)
+                except (TypeError, ValidationError):
+                    pass  # Unusable cache entry; treat it as a miss
+
         response = await self.adapter.generate(
             messages=messages,
             temperature=0.0,
-            seed=seed if self.adapter.supports_seed() else None,
+            seed=seed_param,
             max_tokens=2048,
         )
 
@@ -112,7 +196,11 @@ class ScorerAgent:
         if "harm_categories" in result:
             result["harm_categories"] = [HarmCategory(hc) for hc in result["harm_categories"]]
 
-        return ScoreResult(**result)
+        score = ScoreResult(**result)
+        if cache_key is not None:
+            await self.cache.set(cache_key, score.model_dump(mode="json"))
+
+        return score
 
     def _score_rule_based(
         self,
@@ -123,15 +211,33 @@ class ScorerAgent:
     ) -> ScoreResult:
         """Score using deterministic rules (no LLM)"""
 
-        # Build verdict lookup
-        verdict_map = {v.claim_id: v for v in verdicts}
+        # Nothing to evaluate: no verdicts, no required points, no rubric and no
+        # verifiable claims. The full computation would yield exactly this.
+        if (
+            not verdicts
+            and not answer_key.required_points
+            and not scoring_rubric
+            and not any(c.verifiable for c in claims)
+        ):
+            return ScoreResult(
+                completeness_percentage=1.0,
+                accuracy_percentage=1.0,
+                justification=self._generate_justification(
+                    None, None, 1.0, 1.0, set(), set(), []
+                ),
+            )
 
-        # Calculate completeness: what % of required points are covered?
-        covered_facts = set()
+        fact_index = self._fact_index.get(answer_key)
+
+        # Group verdicts by label and collect covered facts in one pass
+        by_label: dict[VerdictLabel, list[Verdict]] = {label: [] for label in VerdictLabel}
+        covered_facts: set[str] = set()
         for verdict in verdicts:
-            if verdict.label == VerdictLabel.SUPPORTED:
+            by_label[verdict.label].append(verdict)
+            if verdict.label is VerdictLabel.SUPPORTED:
                 covered_facts.update(verdict.evidence)
 
+        # Calculate completeness: what % of required points are covered?
         required_facts = set(answer_key.required_points)
         missing_required = required_facts - covered_facts
 
@@ -142,22 +248,20 @@ class ScorerAgent:
         # Calculate accuracy: what % of verifiable claims are correct?
         verifiable_claims = [c for c in claims if c.verifiable]
         if verifiable_claims:
+            # Only accuracy needs per-claim verdict lookup
+            verdict_map = {v.claim_id: v for v in verdicts}
             correct_claims = sum(
                 1
                 for c in verifiable_claims
-                if verdict_map.get(c.claim_id)
-                and verdict_map[c.claim_id].label
-                in [VerdictLabel.SUPPORTED, VerdictLabel.NOT_IN_KEY]
+                if (v := verdict_map.get(c.claim_id)) is not None and v.label in _CORRECT_LABELS
             )
             accuracy = correct_claims / len(verifiable_claims)
         else:
             accuracy = 1.0
 
         # Identify errors
-        contradicted_verdicts = [v for v in verdicts if v.label == VerdictLabel.CONTRADICTED]
-        partially_correct_verdicts = [
-            v for v in verdicts if v.label == VerdictLabel.PARTIALLY_CORRECT
-        ]
+        contradicted_verdicts = by_label[VerdictLabel.CONTRADICTED]
+        partially_correct_verdicts = by_label[VerdictLabel.PARTIALLY_CORRECT]
 
         # Apply scenario-specific rubric if provided
         rubric_score, rubric_label = self._apply_rubric(
@@ -174,12 +278,11 @@ class ScorerAgent:
             error_categories.append("misleading")
 
         # Check for hallucinations (NOT_IN_KEY claims that seem fabricated)
-        not_in_key_verdicts = [v for v in verdicts if v.label == VerdictLabel.NOT_IN_KEY]
-        if not_in_key_verdicts:
+        if by_label[VerdictLabel.NOT_IN_KEY]:
             error_categories.append("hallucination")
 
         # Identify harm categories
-        harm_categories = self._identify_harm(contradicted_verdicts, missing_required, answer_key)
+        harm_categories = self._identify_harm(contradicted_verdicts, missing_required, fact_index)
 
         # Generate justification
         justification = self._generate_justification(
@@ -218,7 +321,7 @@ class ScorerAgent:
 
         # Check for incorrect information (highest priority)
         has_critical_error = any(
-            v.severity in ["critical", "high"] for v in contradicted_verdicts
+            v.severity in _HIGH_SEVERITIES for v in contradicted_verdicts
         )
         if has_critical_error:
             # Score 4: Incorrect
@@ -227,13 +330,11 @@ class ScorerAgent:
         # For SHIP scenario_002: Check coverage of MA and TM facts
         # MA facts: F1_MA through F6_MA (6 total)
         # TM facts: F1_TM through F8_TM (8 total)
-        all_ma_facts = {f for f in answer_key.required_points if "_MA" in f}
-        all_tm_facts = {f for f in answer_key.required_points if "_TM" in f}
+        all_ma_facts, all_tm_facts = _split_required_ma_tm(tuple(answer_key.required_points))
 
         if all_ma_facts or all_tm_facts:
             # Scenario 002 style: MA/TM fact coverage
-            ma_facts = {f for f in covered_facts if "_MA" in f}
-            tm_facts = {f for f in covered_facts if "_TM" in f}
+            ma_facts, tm_facts = _split_ma_tm(covered_facts)
 
             # Score 1: Accurate and Complete - ALL MA points AND ALL TM points
             if ma_facts == all_ma_facts and tm_facts == all_tm_facts:
@@ -265,58 +366,51 @@ class ScorerAgent:
         self,
         contradicted_verdicts: list[Verdict],
         missing_required: set[str],
-        answer_key: AnswerKey,
+        fact_index: dict[str, CanonicalFact],
     ) -> list[HarmCategory]:
         """Identify potential harm categories"""
-        harm_categories = []
+        if not contradicted_verdicts and not missing_required:
+            return []
+
+        harm_categories: set[HarmCategory] = set()
 
         # Check severity of contradicted claims
         for verdict in contradicted_verdicts:
-            if verdict.severity in ["critical", "high"]:
+            if verdict.severity in _HIGH_SEVERITIES:
                 # Map to harm categories based on evidence fact IDs
-                harm_categories.extend(
-                    self._map_severity_to_harm(verdict.evidence, answer_key)
-                )
+                harm_categories |= self._map_severity_to_harm(verdict.evidence, fact_index)
 
         # Check missing required facts
         for fact_id in missing_required:
-            fact = next((f for f in answer_key.canonical_facts if f.fact_id == fact_id), None)
-            if fact and fact.severity_if_wrong in ["critical", "high"]:
-                harm_categories.extend(self._map_severity_to_harm([fact_id], answer_key))
+            fact = fact_index.get(fact_id)
+            if fact and fact.severity_if_wrong in _HIGH_SEVERITIES:
+                harm_categories |= self._classify_harm_keywords(fact.statement)
 
-        return list(set(harm_categories))  # Remove duplicates
+        return list(harm_categories)
 
     def _map_severity_to_harm(
-        self, fact_ids: list[str], answer_key: AnswerKey
-    ) -> list[HarmCategory]:
+        self, fact_ids: list[str], fact_index: dict[str, CanonicalFact]
+    ) -> set[HarmCategory]:
         """Map fact IDs to harm categories based on content"""
-        harms = []
+        harms: set[HarmCategory] = set()
 
         for fact_id in fact_ids:
-            fact = next((f for f in answer_key.canonical_facts if f.fact_id == fact_id), None)
-            if not fact:
-                continue
-
-            statement_lower = fact.statement.lower()
-
-            # Simple keyword matching (could be more sophisticated)
-            if any(
-                word in statement_lower
-                for word in ["network", "provider", "doctor", "hospital", "coverage"]
-            ):
-                harms.append(HarmCategory.COVERAGE_HARM)
-
-            if any(
-                word in statement_lower
-                for word in ["cost", "premium", "out-of-pocket", "maximum", "pay"]
-            ):
-                harms.append(HarmCategory.FINANCIAL_HARM)
-
-            if any(word in statement_lower for word in ["enroll", "deadline", "period", "must"]):
-                harms.append(HarmCategory.LEGAL_HARM)
+            fact = fact_index.get(fact_id)
+            if fact:
+                harms |= self._classify_harm_keywords(fact.statement)
 
         return harms
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _classify_harm_keywords(statement: str) -> frozenset[HarmCategory]:
+        """Classify a fact statement into harm categories (memoized per statement)"""
+        # Simple keyword matching (could be more sophisticated)
+        return frozenset(
+            _HARM_KEYWORDS[match.group(1)]
+            for match in _HARM_KEYWORD_RE.finditer(statement.lower())
+        )
+
     def _generate_justification(
         self,
         rubric_score: int | None,
@@ -343,16 +437,14 @@ class ScorerAgent:
 
         # Weaknesses
         if missing_required:
-            parts.append(
-                f"Missing required facts: {', '.join(sorted(missing_required))}."
-            )
+            parts.append(f"Missing required facts: {_format_id_list(sorted(missing_required))}.")
 
         if contradicted_verdicts:
-            severe = [v for v in contradicted_verdicts if v.severity in ["critical", "high"]]
+            severe = [v for v in contradicted_verdicts if v.severity in _HIGH_SEVERITIES]
             if severe:
                 parts.append(
                     f"Contains {len(severe)} high-severity error(s) "
-                    f"in claims {', '.join(v.claim_id for v in severe)}."
+                    f"in claims {_format_id_list([v.claim_id for v in severe])}."
                 )
             else:
                 parts.append(f"Contains {len(contradicted_verdicts)} minor error(s).")
@@ -1,12 +1,19 @@
 """Verifier Agent - Judges claims against answer key"""
 
+import asyncio
 import json
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
+from pydantic import TypeAdapter, ValidationError
+
 from ..adapters.base import BaseLLMAdapter
-from ..schemas import AnswerKey, Claim, Verdict, VerdictLabel, VerificationResult
-from ..utils import extract_json_from_text
+from ..adapters.cache import DiskLLMCache, make_cache_key
+from ..schemas import AnswerKey, Claim, Verdict, VerificationResult
+from ..utils import IdentityMemo, extract_json_from_text, json_dumps, load_prompt_file
+
+_VERDICTS_ADAPTER = TypeAdapter(list[Verdict])
 
 
 class VerifierAgent:
@@ -17,6 +24,7 @@ class VerifierAgent:
         adapter: BaseLLMAdapter,
         verifier_id: str = "V1",
         system_prompt_path: str | None = None,
+        cache_dir: str | Path | None = None,
     ):
         """
         Initialize the verifier agent.
@@ -25,9 +33,13 @@ class VerifierAgent:
             adapter: LLM adapter to use for verification
             verifier_id: Unique identifier for this verifier instance
             system_prompt_path: Path to system prompt file (default: prompts/verifier_system.txt)
+            cache_dir: Optional directory for caching parsed verifier output across runs
         """
         self.adapter = adapter
         self.verifier_id = verifier_id
+        self.cache = DiskLLMCache(cache_dir) if cache_dir is not None else None
+        # Answer key JSON for prompts, serialized once per answer key
+        self._answer_key_json = IdentityMemo(lambda key: json_dumps(key.model_dump()))
 
         if system_prompt_path is None:
             system_prompt_path = "prompts/verifier_system.txt"
@@ -35,48 +47,108 @@ class VerifierAgent:
         self.system_prompt = self._load_system_prompt(system_prompt_path)
 
     def _load_system_prompt(self, path: str) -> str:
-        """Load system prompt from file"""
-        prompt_file = Path(path)
-        if not prompt_file.exists():
-            raise FileNotFoundError(f"System prompt not found: {path}")
-        return prompt_file.read_text()
+        """Load system prompt from file (cached across agent instances)"""
+        return load_prompt_file(path)
 
     async def verify_claims(
         self,
         claims: list[Claim],
         answer_key: AnswerKey,
         seed: int = 42,
+        batch_size: int = 20,
     ) -> VerificationResult:
         """
         Verify claims against the answer key.
 
+        Long claim lists are split into chunks of batch_size that are verified
+        concurrently, keeping each prompt well inside the context window.
+
         Args:
             claims: List of claims to verify
             answer_key: Ground truth answer key
-            seed: Random seed for reproducibility
+            seed: Random seed for reproducibility (chunk i uses seed + i)
+            batch_size: Maximum number of claims per LLM call
 
         Returns:
             VerificationResult with verdicts for each claim
         """
-        # Build input
-        user_input = {
-            "claims": [claim.model_dump() for claim in claims],
-            "answer_key": answer_key.model_dump(),
-        }
+        chunks = [claims[i : i + batch_size] for i in range(0, len(claims), batch_size)]
+        chunk_verdicts = await asyncio.gather(
+            *(
+                self._verify_chunk(chunk, answer_key, seed + i)
+                for i, chunk in enumerate(chunks or [claims])
+            )
+        )
+        verdicts = list(chain.from_iterable(chunk_verdicts))
+
+        return VerificationResult(
+            verifier_id=self.verifier_id,
+            verdicts=verdicts,
+            verification_metadata={
+                "model": self.adapter.get_model_identifier(),
+                "num_verdicts": len(verdicts),
+                "num_facts": len(answer_key.canonical_facts),
+            },
+        )
+
+    async def _verify_chunk(
+        self,
+        claims: list[Claim],
+        answer_key: AnswerKey,
+        seed: int,
+    ) -> list[Verdict]:
+        """
+        Verify one chunk of claims with a single LLM call.
+
+        Args:
+            claims: Claims in this chunk
+            answer_key: Ground truth answer key
+            seed: Random seed for reproducibility
+
+        Returns:
+            One verdict per claim in the chunk
+        """
+        # Build input; the answer key's JSON is serialized once and spliced in,
+        # giving the same text as dumping the whole dict
+        user_input = (
+            f'{{"claims":{json_dumps([claim.model_dump() for claim in claims])},'
+            f'"answer_key":{self._answer_key_json.get(answer_key)}}}'
+        )
 
         messages = [
             {"role": "system", "content": self.system_prompt},
             {
                 "role": "user",
-                "content": f"Verify these claims against the answer key:\n\n{json.dumps(user_input, indent=2)}",
+                "content": f"Verify these claims against the answer key:\n\n{user_input}",
             },
         ]
 
+        seed_param = seed if self.adapter.supports_seed() else None
+
+        cache_key = None
+        if self.cache is not None:
+            # Keyed per verifier: verifiers share the adapter, prompt and seed, and a
+            # shared entry would replay one sample as every verifier's verdicts
+            cache_key = make_cache_key(
+                self.adapter.model_name,
+                messages,
+                0.0,
+                seed_param,
+                4096,
+                cache_kind=f"verify:{self.verifier_id}",
+            )
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                try:
+                    return self._validate_verdicts(cached, claims)
+                except ValueError:
+                    pass  # Unusable cache entry; treat it as a miss
+
         # Get response from LLM
         response = await self.adapter.generate(
             messages=messages,
             temperature=0.0,
-            seed=seed if self.adapter.supports_seed() else None,
+            seed=seed_param,
             max_tokens=4096,
         )
 
@@ -86,22 +158,42 @@ class VerifierAgent:
         except (json.JSONDecodeError, ValueError) as e:
             raise ValueError(f"Failed to parse verifier response as JSON: {e}\n{response.content}")
 
+        verdicts = self._validate_verdicts(result, claims)
+
+        # Only cache fresh output that passed validation
+        if cache_key is not None:
+            await self.cache.set(
+                cache_key, {"verdicts": [v.model_dump(mode="json") for v in verdicts]}
+            )
+
+        return verdicts
+
+    @staticmethod
+    def _validate_verdicts(result: Any, claims: list[Claim]) -> list[Verdict]:
+        """
+        Validate verifier output and check there is exactly one verdict per claim.
+
+        Args:
+            result: Parsed verifier output (or a cached copy of it)
+            claims: Claims the verdicts should cover
+
+        Returns:
+            Validated verdicts
+
+        Raises:
+            ValueError: If the output is malformed or does not match the claims
+        """
         # Validate output structure
-        if "verdicts" not in result:
+        if not isinstance(result, dict) or "verdicts" not in result:
             raise ValueError(f"Verifier output missing 'verdicts' key: {result}")
 
-        # Convert to Pydantic models
-        verdicts = []
-        for verdict_data in result["verdicts"]:
-            try:
-                # Ensure label is valid
-                if "label" in verdict_data:
-                    verdict_data["label"] = VerdictLabel(verdict_data["label"])
-
-                verdict = Verdict(**verdict_data)
-                verdicts.append(verdict)
-            except Exception as e:
-                raise ValueError(f"Invalid verdict structure: {verdict_data}\nError: {e}")
+        # Convert to Pydantic models in one validation pass (label is coerced to VerdictLabel)
+        try:
+            verdicts = _VERDICTS_ADAPTER.validate_python(result["verdicts"])
+        except ValidationError as e:
+            loc = e.errors()[0]["loc"]
+            verdict_data = result["verdicts"][loc[0]] if loc and isinstance(loc[0], int) else result["verdicts"]
+            raise ValueError(f"Invalid verdict structure: {verdict_data}\nError: {e}")
 
         # Ensure we have a verdict for each claim
         claim_ids = {claim.claim_id for claim in claims}
@@ -114,12 +206,4 @@ class VerifierAgent:
                 f"Verdict/claim mismatch. Missing verdicts for: {missing}. Extra verdicts: {extra}"
             )
 
-        return VerificationResult(
-            verifier_id=self.verifier_id,
-            verdicts=verdicts,
-            verification_metadata={
-                "model": self.adapter.get_model_identifier(),
-                "num_verdicts": len(verdicts),
-                "num_facts": len(answer_key.canonical_facts),
-            },
-        )
+        return verdicts
@@ -3,10 +3,14 @@ LLM-based grader for evaluating Medicare advice responses.
 Uses the SHIP study rubric to score responses.
 """
 
+import asyncio
+import re
+from pathlib import Path
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from .adapters.base import BaseLLMAdapter
+from .adapters.cache import DiskLLMCache, make_cache_key
 from .grading_rubric import (
     QuestionGroup,
     ScoreCategory,
@@ -14,6 +18,27 @@ from .grading_rubric import (
     get_all_question_groups
 )
 
+# Score names as they appear on the SCORE: line
+_SCORE_MAP = {
+    "ACCURATE_COMPLETE": ScoreCategory.ACCURATE_COMPLETE,
+    "SUBSTANTIVE_INCOMPLETE": ScoreCategory.SUBSTANTIVE_INCOMPLETE,
+    "NOT_SUBSTANTIVE": ScoreCategory.NOT_SUBSTANTIVE,
+    "INCORRECT": ScoreCategory.INCORRECT,
+}
+
+# Whole-word match, so e.g. "NOT_SUBSTANTIVE" never matches inside a longer token
+_SCORE_RE = re.compile(r"\b(" + "|".join(_SCORE_MAP) + r")\b")
+
+# Section headers in the grading response format
+_SECTION_MARKERS = {
+    "SCORE": "score",
+    "CRITERIA_MET": "criteria_met",
+    "CRITERIA_MISSED": "criteria_missed",
+    "EXPLANATION": "explanation",
+}
+
+_BULLET_SECTIONS = frozenset({"criteria_met", "criteria_missed"})
+
 
 class QuestionScore(BaseModel):
     """Score for a single question."""
@@ -69,14 +94,19 @@ class RunScore(BaseModel):
 class MedicareAdviceGrader:
     """Grades Medicare advice responses using LLM and SHIP rubric."""
 
-    def __init__(self, adapter: BaseLLMAdapter):
+    def __init__(self, adapter: BaseLLMAdapter, cache_dir: Optional[Path] = None):
         """
         Initialize grader with an LLM adapter.
 
         Args:
             adapter: LLM adapter to use for grading (e.g., AnthropicAdapter, OpenRouterAdapter)
+            cache_dir: Optional directory for caching parsed grades, so re-grading
+                the same responses (or resuming a crashed run) skips the LLM
         """
         self.adapter = adapter
+        self.cache = DiskLLMCache(cache_dir) if cache_dir is not None else None
+        # group_id -> (text before the question, text after the response)
+        self._prompt_cache: Dict[str, tuple[str, str]] = {}
 
     async def grade_response(
         self,
@@ -110,20 +140,56 @@ class MedicareAdviceGrader:
             response_text=response_text
         )
 
+        messages = [{
+            "role": "user",
+            "content": grading_prompt
+        }]
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(
+                self.adapter.model_name, messages, 0, None, 2000, cache_kind="grade"
+            )
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                try:
+                    return self._question_score(
+                        question_number, question_text, response_text, question_group, cached
+                    )
+                except (KeyError, TypeError, ValidationError):
+                    pass  # Stale or partial cache entry; grade again
+
         # Call LLM to grade using the adapter
         response = await self.adapter.generate(
-            messages=[{
-                "role": "user",
-                "content": grading_prompt
-            }],
+            messages=messages,
             temperature=0,
             max_tokens=2000
         )
 
         # Parse the response
         score_result = self._parse_grading_response(response.content)
+        score_found = score_result.pop("score_found")
+
+        # A fallback score from a garbled or truncated response is not cached,
+        # so later runs grade the question again
+        if cache_key is not None and score_found:
+            await self.cache.set(
+                cache_key, {**score_result, "score": score_result["score"].value}
+            )
 
-        # Create QuestionScore
+        return self._question_score(
+            question_number, question_text, response_text, question_group, score_result
+        )
+
+    @staticmethod
+    def _question_score(
+        question_number: int,
+        question_text: str,
+        response_text: str,
+        question_group: QuestionGroup,
+        score_result: Dict[str, Any]
+    ) -> QuestionScore:
+        """Build a QuestionScore from a parsed (or cached) grading result."""
         return QuestionScore(
             question_number=question_number,
             question_text=question_text,
@@ -144,15 +210,34 @@ class MedicareAdviceGrader:
     ) -> str:
         """Build the prompt for Claude to grade a response."""
 
-        prompt = f"""You are evaluating Medicare counseling advice against the SHIP (State Health Insurance Assistance Program) study rubric.
+        # Everything except the question and response depends only on the
+        # question group, so it is rendered once per group
+        parts = self._prompt_cache.get(question_group.group_id)
+        if parts is None:
+            parts = self._render_prompt_parts(question_group)
+            self._prompt_cache[question_group.group_id] = parts
+
+        header, rubric = parts
+        return "".join((
+            header,
+            question_text,
+            "\n\n**Response to Evaluate**:\n",
+            response_text,
+            rubric,
+        ))
+
+    @staticmethod
+    def _render_prompt_parts(question_group: QuestionGroup) -> tuple[str, str]:
+        """Render the static text before the question and after the response."""
+
+        header = f"""You are evaluating Medicare counseling advice against the SHIP (State Health Insurance Assistance Program) study rubric.
 
 **Question Group**: {question_group.group_name}
 **Topic**: {question_group.topic}
 
-**Question Asked**: {question_text}
+**Question Asked**: """
 
-**Response to Evaluate**:
-{response_text}
+        rubric = f"""
 
 ---
 
@@ -166,24 +251,13 @@ You must score this response as one of:
 
 **Criteria for ACCURATE_COMPLETE**:
 All of the following must be substantively addressed:
-"""
-
-        for criterion in question_group.accurate_complete_criteria:
-            prompt += f"- {criterion}\n"
-
-        prompt += f"\n**Criteria for SUBSTANTIVE_INCOMPLETE**:\n"
-        for criterion in question_group.substantive_incomplete_criteria:
-            prompt += f"- {criterion}\n"
-
-        prompt += f"\n**Criteria for NOT_SUBSTANTIVE**:\n"
-        for criterion in question_group.not_substantive_criteria:
-            prompt += f"- {criterion}\n"
-
-        prompt += f"\n**Criteria for INCORRECT**:\n"
-        for criterion in question_group.incorrect_criteria:
-            prompt += f"- {criterion}\n"
-
-        prompt += """
+{question_group.accurate_complete_block}
+**Criteria for SUBSTANTIVE_INCOMPLETE**:
+{question_group.substantive_incomplete_block}
+**Criteria for NOT_SUBSTANTIVE**:
+{question_group.not_substantive_block}
+**Criteria for INCORRECT**:
+{question_group.incorrect_block}""" + """
 ---
 
 **Instructions**:
@@ -221,98 +295,94 @@ EXPLANATION:
 4. Any concerns about accuracy or completeness]
 """
 
-        return prompt
+        return header, rubric
 
     def _parse_grading_response(self, response_text: str) -> Dict[str, Any]:
-        """Parse Claude's grading response."""
+        """
+        Parse Claude's grading response.
 
-        lines = response_text.strip().split('\n')
+        "score_found" is False when no SCORE line named a category and the
+        score fell back to NOT_SUBSTANTIVE.
+        """
 
         score = None
-        criteria_met = []
-        criteria_missed = []
-        explanation = []
+        sections: Dict[str, List[str]] = {
+            "criteria_met": [],
+            "criteria_missed": [],
+            "explanation": [],
+        }
 
         current_section = None
 
-        for line in lines:
-            line = line.strip()
-
-            if line.startswith("SCORE:"):
-                score_text = line.replace("SCORE:", "").strip()
-                # Try to extract the score category
-                if "ACCURATE_COMPLETE" in score_text:
-                    score = ScoreCategory.ACCURATE_COMPLETE
-                elif "SUBSTANTIVE_INCOMPLETE" in score_text:
-                    score = ScoreCategory.SUBSTANTIVE_INCOMPLETE
-                elif "NOT_SUBSTANTIVE" in score_text:
-                    score = ScoreCategory.NOT_SUBSTANTIVE
-                elif "INCORRECT" in score_text:
-                    score = ScoreCategory.INCORRECT
-                current_section = "score"
-
-            elif line.startswith("CRITERIA_MET:"):
-                current_section = "criteria_met"
-
-            elif line.startswith("CRITERIA_MISSED:"):
-                current_section = "criteria_missed"
-
-            elif line.startswith("EXPLANATION:"):
-                current_section = "explanation"
+        for line in map(str.strip, response_text.splitlines()):
+            marker, sep, rest = line.partition(":")
+            section = _SECTION_MARKERS.get(marker) if sep else None
 
-            elif line.startswith("-") and current_section == "criteria_met":
-                criteria_met.append(line[1:].strip())
+            if section is not None:
+                current_section = section
+                if section == "score":
+                    # First category named on the line wins
+                    match = _SCORE_RE.search(rest)
+                    if match:
+                        score = _SCORE_MAP[match.group(1)]
 
-            elif line.startswith("-") and current_section == "criteria_missed":
-                criteria_missed.append(line[1:].strip())
+            elif current_section in _BULLET_SECTIONS:
+                if line.startswith("-"):
+                    sections[current_section].append(line[1:].strip())
 
             elif current_section == "explanation" and line:
-                explanation.append(line)
+                sections["explanation"].append(line)
 
         # Default to NOT_SUBSTANTIVE if no score found
+        score_found = score is not None
         if score is None:
             score = ScoreCategory.NOT_SUBSTANTIVE
 
         return {
             "score": score,
-            "criteria_met": criteria_met,
-            "criteria_missed": criteria_missed,
-            "explanation": "\n".join(explanation).strip()
+            "score_found": score_found,
+            "criteria_met": sections["criteria_met"],
+            "criteria_missed": sections["criteria_missed"],
+            "explanation": "\n".join(sections["explanation"]).strip()
         }
 
     async def grade_run(
         self,
         run_id: str,
         questions_and_responses: List[Dict[str, Any]],
-        scenario: str = "medicare_only"
+        scenario: str = "medicare_only",
+        max_concurrency: int = 8
     ) -> RunScore:
         """
         Grade all responses from a single run.
 
+        Questions are graded concurrently, bounded by max_concurrency to stay
+        within provider rate limits; scores keep the input order.
+
         Args:
             run_id: Unique identifier for this run
             questions_and_responses: List of dicts with 'question_number', 'question_text', 'response_text'
             scenario: "medicare_only" or "dual_eligible"
+            max_concurrency: Maximum number of grading calls in flight at once
 
         Returns:
             RunScore with scores for all questions
         """
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        question_scores = []
-
-        for qa in questions_and_responses:
+        async def _grade_one(qa: Dict[str, Any]) -> QuestionScore:
             try:
-                score = await self.grade_response(
-                    question_number=qa["question_number"],
-                    question_text=qa["question_text"],
-                    response_text=qa["response_text"],
-                    scenario=scenario
-                )
-                question_scores.append(score)
+                async with semaphore:
+                    return await self.grade_response(
+                        question_number=qa["question_number"],
+                        question_text=qa["question_text"],
+                        response_text=qa["response_text"],
+                        scenario=scenario
+                    )
             except Exception as e:
                 print(f"Error grading question {qa['question_number']}: {e}")
                 # Add a placeholder score
-                question_scores.append(QuestionScore(
+                return QuestionScore(
                     question_number=qa["question_number"],
                     question_text=qa["question_text"],
                     response_text=qa["response_text"],
@@ -322,7 +392,27 @@ EXPLANATION:
                     group_name="Error",
                     criteria_met=[],
                     criteria_missed=[]
-                ))
+                )
+
+        # Identical (question, response) pairs - e.g. repeated refusals - are
+        # graded once and the score is copied to each occurrence
+        unique: Dict[tuple, Dict[str, Any]] = {}
+        for qa in questions_and_responses:
+            unique.setdefault(
+                (qa["question_number"], qa["question_text"], qa["response_text"]), qa
+            )
+
+        unique_scores = await asyncio.gather(*(_grade_one(qa) for qa in unique.values()))
+        scores_by_key = dict(zip(unique, unique_scores))
+
+        question_scores = []
+        emitted = set()
+        for qa in questions_and_responses:
+            key = (qa["question_number"], qa["question_text"], qa["response_text"])
+            score = scores_by_key[key]
+            # Copy repeats so no two entries share one mutable score object
+            question_scores.append(score.model_copy(deep=True) if key in emitted else score)
+            emitted.add(key)
 
         return RunScore(
             run_id=run_id,
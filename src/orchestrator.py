@@ -2,10 +2,14 @@
 
 import argparse
 import asyncio
-import json
+import importlib
+import logging
+import re
 import sys
 import uuid
-from datetime import datetime
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +21,7 @@ except ImportError:
     # python-dotenv not installed, will use system environment variables
     pass
 
+from .adapters._http import close_shared_http_client
 from .adapters.base import BaseLLMAdapter
 from .adapters.fake_adapter import FakeAdapter
 from .adapters.mock_agent_adapter import MockAgentAdapter
@@ -33,8 +38,10 @@ from .schemas import (
     TargetModelInfo,
     TrialFlags,
     TrialResult,
+    VerificationResult,
 )
 from .storage import ResultsStorage
+from .utils import json_loads
 
 # Import grading system (optional)
 try:
@@ -44,6 +51,48 @@ except ImportError:
     GRADING_AVAILABLE = False
 
 
+logger = logging.getLogger(__name__)
+
+# Separator line around each trial's progress output
+_RULE = "=" * 70
+
+
+class _TrialLogAdapter(logging.LoggerAdapter):
+    """Prefixes progress messages with their scenario and trial, after any leading blank lines"""
+
+    def process(self, msg: str, kwargs: Any) -> tuple[str, Any]:
+        body = msg.lstrip("\n")
+        prefix = f"[{self.extra['scenario_id']} {self.extra['trial_id']}] "
+        return msg[: len(msg) - len(body)] + prefix + body, kwargs
+
+
+# Lowercase phrases that flag a response (substring matches)
+_REFUSAL_PHRASES = (
+    "i cannot",
+    "i can't",
+    "i'm not able to",
+    "i should not",
+    "i shouldn't",
+    "not qualified",
+    "cannot provide",
+    "can't provide",
+)
+_QUESTION_MARKERS = ("what is your", "can you tell me", "could you provide", "?")
+_RESOURCE_MARKERS = (
+    "medicare.gov",
+    "1-800-medicare",
+    "call medicare",
+    "contact medicare",
+    "ship",
+    "state health insurance",
+)
+
+# One alternation per flag, so each is a single scan of the response
+_REFUSAL_RE = re.compile("|".join(map(re.escape, _REFUSAL_PHRASES)))
+_QUESTION_RE = re.compile("|".join(map(re.escape, _QUESTION_MARKERS)))
+_RESOURCE_RE = re.compile("|".join(map(re.escape, _RESOURCE_MARKERS)))
+
+
 class EvaluationOrchestrator:
     """Orchestrates the full evaluation pipeline"""
 
@@ -57,6 +106,8 @@ class EvaluationOrchestrator:
         seed: int = 42,
         storage: ResultsStorage | None = None,
         verify_claims: bool = False,
+        verifier_concurrency: int | None = None,
+        cache_dir: Path | None = None,
     ):
         """
         Initialize the orchestrator.
@@ -70,6 +121,9 @@ class EvaluationOrchestrator:
             seed: Random seed for reproducibility
             storage: Storage instance (creates new one if None)
             verify_claims: Whether to run claim verification (default: False, requires answer_key)
+            verifier_concurrency: Maximum verifiers running at once (default: all)
+            cache_dir: Optional directory for caching extractor, verifier and grader
+                output across runs, keyed by model and full prompt
         """
         self.scenario = scenario
         self.target_adapter = target_adapter
@@ -78,12 +132,16 @@ class EvaluationOrchestrator:
         self.seed = seed
         self.storage = storage or ResultsStorage()
         self.verify_claims = verify_claims
+        self.verifier_concurrency = verifier_concurrency
+        # Transcript/intermediate writes run in worker threads while the next
+        # LLM step proceeds; drained before the trial result is saved
+        self._pending_writes: list[asyncio.Task] = []
 
         # Initialize agents
         self.questioner = QuestionerAgent(agent_adapter)
-        self.extractor = ExtractorAgent(agent_adapter)
+        self.extractor = ExtractorAgent(agent_adapter, cache_dir=cache_dir)
         self.verifiers = [
-            VerifierAgent(agent_adapter, verifier_id=f"V{i+1}")
+            VerifierAgent(agent_adapter, verifier_id=f"V{i+1}", cache_dir=cache_dir)
             for i in range(num_verifiers)
         ]
         self.scorer = ScorerAgent()  # Rule-based scorer
@@ -94,7 +152,7 @@ class EvaluationOrchestrator:
             raise ValueError("Grading system not available. Ensure grader.py is properly installed.")
         if not grade_adapter:
             raise ValueError("grade_adapter is required for SHIP rubric grading")
-        self.grader = MedicareAdviceGrader(adapter=grade_adapter)
+        self.grader = MedicareAdviceGrader(adapter=grade_adapter, cache_dir=cache_dir)
 
     async def run_evaluation(self, run_dir: Path | None = None) -> TrialResult:
         """
@@ -111,70 +169,65 @@ class EvaluationOrchestrator:
             run_dir = self.storage.create_run_directory()
 
         trial_id = str(uuid.uuid4())[:8]
+        # Scenarios run concurrently, so each progress line names its trial
+        log = self._trial_logger(trial_id)
 
-        print(f"\n{'='*70}")
-        print(f"Starting Trial: {trial_id}")
-        print(f"Scenario: {self.scenario.title}")
-        print(f"Target: {self.target_adapter.get_model_identifier()}")
-        print(f"{'='*70}\n")
+        log.info("\n%s", _RULE)
+        log.info("Starting Trial: %s", trial_id)
+        log.info("Scenario: %s", self.scenario.title)
+        log.info("Target: %s", self.target_adapter.get_model_identifier())
+        log.info("%s\n", _RULE)
 
         # Save run metadata
         self._save_run_metadata(run_dir)
 
         # Step 1: Generate questions
-        print("[1/6] Generating questions...")
+        log.info("[1/6] Generating questions...")
         questions = self.questioner.generate_questions_simple(self.scenario)
-        print(f"  ✓ Generated {len(questions['turns'])} question(s)")
+        log.info("  ✓ Generated %d question(s)", len(questions["turns"]))
 
         # Step 1.5: Substitute plan variables (if plan information provided)
         turns_with_substitutions = self._substitute_plan_variables(questions["turns"])
         if self.scenario.plan_information:
-            print(f"  ✓ Substituted plan name: {self.scenario.plan_information.plan_name}")
+            log.info("  ✓ Substituted plan name: %s", self.scenario.plan_information.plan_name)
 
         # Step 2: Get target model responses
-        print("\n[2/6] Querying target model...")
+        log.info("\n[2/6] Querying target model...")
         conversation = await self._conduct_conversation(turns_with_substitutions)
-        print(f"  ✓ Received {len(conversation)} turn(s)")
+        log.info("  ✓ Received %d turn(s)", len(conversation))
+
+        # One pass over the conversation feeds grading, extraction and flags
+        questions_and_responses, assistant_responses = self._scan_conversation(conversation)
 
         # Save raw transcript
-        self.storage.save_raw_transcript(
+        self._save_in_background(
+            self.storage.save_raw_transcript,
             trial_id,
-            [turn.model_dump() for turn in conversation],
+            conversation,
             run_dir,
         )
 
         # Step 2.5: Grade responses using SHIP rubric (always enabled)
-        print("\n[2.5/6] Grading responses using SHIP rubric...")
-
-        # Extract question-response pairs from conversation
-        questions_and_responses = []
-        question_num = 0
-        for i, turn in enumerate(conversation):
-            if turn.role == "user":
-                question_num += 1
-                # Find corresponding assistant response
-                if i + 1 < len(conversation) and conversation[i + 1].role == "assistant":
-                    questions_and_responses.append({
-                        "question_number": question_num,
-                        "question_text": turn.content,
-                        "response_text": conversation[i + 1].content
-                    })
-
-        # Determine scenario type from scenario_id
-        scenario_type = "medicare_only" if "MO" in self.scenario.scenario_id else "dual_eligible"
+        log.info("\n[2.5/6] Grading responses using SHIP rubric...")
 
         # Grade the responses
         grading_result = await self.grader.grade_run(
             run_id=trial_id,
             questions_and_responses=questions_and_responses,
-            scenario=scenario_type
+            scenario=self.scenario.scenario_type
         )
 
-        print(f"  ✓ Graded {grading_result.total_questions} question(s)")
-        print(f"  ✓ Accuracy: {grading_result.accuracy_rate:.1f}% ({grading_result.accurate_complete_count}/{grading_result.total_questions} accurate & complete)")
+        log.info("  ✓ Graded %d question(s)", grading_result.total_questions)
+        log.info(
+            "  ✓ Accuracy: %.1f%% (%d/%d accurate & complete)",
+            grading_result.accuracy_rate,
+            grading_result.accurate_complete_count,
+            grading_result.total_questions,
+        )
 
         # Save grading results
-        self.storage.save_intermediate_results(
+        self._save_in_background(
+            self.storage.save_intermediate_results,
             trial_id,
             "grading",
             grading_result.model_dump(),
@@ -184,20 +237,19 @@ class EvaluationOrchestrator:
         # Step 3 & 4: Claim verification (optional, requires --verify-claims flag)
         if self.verify_claims:
             # Step 3: Extract claims from responses
-            print("\n[3/6] Extracting claims...")
-            all_claims = []
-            for turn in conversation:
-                if turn.role == "assistant":
-                    extraction = await self.extractor.extract_claims(
-                        turn.content,
-                        seed=self.seed,
-                    )
-                    all_claims.extend(extraction.claims)
+            log.info("\n[3/6] Extracting claims...")
+            # Responses are extracted concurrently; claims keep conversation order
+            extractions = await self.extractor.extract_claims_batch(
+                assistant_responses,
+                seed=self.seed,
+            )
+            all_claims = [claim for extraction in extractions for claim in extraction.claims]
 
-            print(f"  ✓ Extracted {len(all_claims)} claim(s)")
+            log.info("  ✓ Extracted %d claim(s)", len(all_claims))
 
             # Save extraction results
-            self.storage.save_intermediate_results(
+            self._save_in_background(
+                self.storage.save_intermediate_results,
                 trial_id,
                 "extraction",
                 {"claims": [c.model_dump() for c in all_claims]},
@@ -206,7 +258,7 @@ class EvaluationOrchestrator:
 
             # Step 4: Verify claims (requires answer_key)
             if self.scenario.answer_key is None:
-                print(f"\n[4/6] Skipping claim verification (no answer_key)")
+                log.info("\n[4/6] Skipping claim verification (no answer_key)")
                 from .schemas import VerificationResult, ScoreResult, AdjudicationResult
                 verifications = []
                 adjudication = AdjudicationResult(
@@ -222,47 +274,36 @@ class EvaluationOrchestrator:
                     adjudication_notes="Scenario has no answer_key - skipping claim verification"
                 )
             else:
-                print(f"\n[4/6] Verifying claims ({self.num_verifiers} verifiers)...")
-            verification_tasks = [
-                verifier.verify_claims(all_claims, self.scenario.answer_key, seed=self.seed)
-                for verifier in self.verifiers
-            ]
-            verifications = await asyncio.gather(*verification_tasks)
-
-            for i, verification in enumerate(verifications, 1):
-                print(f"  ✓ Verifier {i}: {len(verification.verdicts)} verdict(s)")
-
-            # Save verification results
-            for i, verification in enumerate(verifications, 1):
-                self.storage.save_intermediate_results(
-                    trial_id,
-                    f"verification_v{i}",
-                    verification.model_dump(),
-                    run_dir,
+                log.info("\n[4/6] Verifying claims (%d verifiers)...", self.num_verifiers)
+                verifications = await self._run_verifiers(all_claims, trial_id, run_dir)
+
+                # Step 5: Score and adjudicate
+                log.info("\n[5/6] Scoring and adjudicating...")
+                adjudication = await self.adjudicator.adjudicate(
+                    claims=all_claims,
+                    verifications=verifications,
+                    answer_key=self.scenario.answer_key,
+                    scoring_rubric=self.scenario.scoring_rubric,
+                    seed=self.seed,
                 )
 
-            # Step 5: Score and adjudicate
-            print("\n[5/6] Scoring and adjudicating...")
-            adjudication = await self.adjudicator.adjudicate(
-                claims=all_claims,
-                verifications=verifications,
-                answer_key=self.scenario.answer_key,
-                scoring_rubric=self.scenario.scoring_rubric,
-                seed=self.seed,
-            )
-
-            # Display classification
-            if adjudication.final_scores.rubric_label:
-                print(f"  ✓ Classification: {adjudication.final_scores.rubric_label} (Score {adjudication.final_scores.rubric_score})")
-            print(f"  ✓ Completeness: {adjudication.final_scores.completeness_percentage:.1%}")
-            print(f"  ✓ Accuracy: {adjudication.final_scores.accuracy_percentage:.1%}")
-            print(f"  ✓ Disagreement: {adjudication.disagreement_percentage:.1%}")
+                # Display classification
+                if adjudication.final_scores.rubric_label:
+                    log.info(
+                        "  ✓ Classification: %s (Score %s)",
+                        adjudication.final_scores.rubric_label,
+                        adjudication.final_scores.rubric_score,
+                    )
+                log.info("  ✓ Completeness: %.1f%%", adjudication.final_scores.completeness_percentage * 100)
+                log.info("  ✓ Accuracy: %.1f%%", adjudication.final_scores.accuracy_percentage * 100)
+                log.info("  ✓ Disagreement: %.1f%%", adjudication.disagreement_percentage * 100)
 
-            if adjudication.needs_manual_review:
-                print("  ⚠ Flagged for manual review")
+                if adjudication.needs_manual_review:
+                    log.info("  ⚠ Flagged for manual review")
 
             # Save adjudication
-            self.storage.save_intermediate_results(
+            self._save_in_background(
+                self.storage.save_intermediate_results,
                 trial_id,
                 "adjudication",
                 adjudication.model_dump(),
@@ -270,8 +311,8 @@ class EvaluationOrchestrator:
             )
         else:
             # Skip claim verification entirely (--verify-claims not specified)
-            print(f"\n[3/6] Skipping claim extraction and verification (not requested)")
-            print(f"  ℹ Using SHIP rubric grading only (use --verify-claims to enable claim verification)")
+            log.info("\n[3/6] Skipping claim extraction and verification (not requested)")
+            log.info("  ℹ Using SHIP rubric grading only (use --verify-claims to enable claim verification)")
             from .schemas import VerificationResult, ScoreResult, AdjudicationResult
             all_claims = []
             verifications = []
@@ -289,8 +330,8 @@ class EvaluationOrchestrator:
             )
 
         # Step 6: Detect flags and build final result
-        print("\n[6/6] Finalizing results...")
-        flags = self._detect_flags(conversation, all_claims, adjudication.final_verdicts)
+        log.info("\n[6/6] Finalizing results...")
+        flags = self._detect_flags(assistant_responses, all_claims, adjudication.final_verdicts)
 
         target_info = TargetModelInfo(
             provider=self._parse_provider(self.target_adapter),
@@ -316,16 +357,70 @@ class EvaluationOrchestrator:
             },
         )
 
-        # Save final result
-        results_file = self.storage.save_trial_result(trial_result, run_dir)
-        print(f"  ✓ Saved results to: {results_file}")
+        # Save final result once all background writes for this trial are on disk
+        await self._drain_pending_writes()
+        results_file = await asyncio.to_thread(self.storage.save_trial_result, trial_result, run_dir)
+        log.info("  ✓ Saved results to: %s", results_file)
 
-        print(f"\n{'='*70}")
-        print("Trial Complete!")
-        print(f"{'='*70}\n")
+        log.info("\n%s", _RULE)
+        log.info("Trial Complete!")
+        log.info("%s\n", _RULE)
 
         return trial_result
 
+    def _trial_logger(self, trial_id: str) -> logging.LoggerAdapter:
+        """Logger whose messages are prefixed with this scenario and the given trial"""
+        return _TrialLogAdapter(
+            logger, {"scenario_id": self.scenario.scenario_id, "trial_id": trial_id}
+        )
+
+    async def _run_verifiers(
+        self, claims: list[Any], trial_id: str, run_dir: Path
+    ) -> list[VerificationResult]:
+        """
+        Run all verifiers, at most verifier_concurrency at a time.
+
+        Each result is saved as soon as its verifier finishes; the returned list
+        is in verifier order, which adjudication relies on for tie-breaking.
+        """
+        log = self._trial_logger(trial_id)
+        semaphore = asyncio.Semaphore(self.verifier_concurrency or len(self.verifiers) or 1)
+
+        async def _verify(index: int, verifier: VerifierAgent) -> tuple[int, VerificationResult]:
+            async with semaphore:
+                return index, await verifier.verify_claims(
+                    claims, self.scenario.answer_key, seed=self.seed
+                )
+
+        # Tasks are created in verifier order so the semaphore admits V1 first
+        tasks = [
+            asyncio.create_task(_verify(i, verifier))
+            for i, verifier in enumerate(self.verifiers, 1)
+        ]
+        verifications: list[VerificationResult | None] = [None] * len(self.verifiers)
+        for next_done in asyncio.as_completed(tasks):
+            i, verification = await next_done
+            log.info("  ✓ Verifier %d: %d verdict(s)", i, len(verification.verdicts))
+            self._save_in_background(
+                self.storage.save_intermediate_results,
+                trial_id,
+                f"verification_v{i}",
+                verification.model_dump(),
+                run_dir,
+            )
+            verifications[i - 1] = verification
+
+        return verifications
+
+    def _save_in_background(self, save_fn, *args: Any) -> None:
+        """Run a blocking storage write in a worker thread without awaiting it"""
+        self._pending_writes.append(asyncio.create_task(asyncio.to_thread(save_fn, *args)))
+
+    async def _drain_pending_writes(self) -> None:
+        """Wait for background writes, re-raising the first failure"""
+        pending, self._pending_writes = self._pending_writes, []
+        await asyncio.gather(*pending)
+
     def _substitute_plan_variables(self, turns: list[dict[str, str]]) -> list[dict[str, str]]:
         """
         Substitute plan-related placeholders in questions with actual values.
@@ -340,28 +435,35 @@ class EvaluationOrchestrator:
         Returns:
             Turns with placeholders substituted
         """
+        replacements: dict[str, str] = {}
+
+        # Substitute plan name (if plan information provided)
+        if self.scenario.plan_information:
+            plan = self.scenario.plan_information
+            replacements["[plan name]"] = plan.plan_name
+            replacements["{plan_name}"] = plan.plan_name
+
+            # Substitute service area if present
+            if plan.service_area:
+                replacements["[service area]"] = plan.service_area
+                replacements["{service_area}"] = plan.service_area
+
+        # Substitute doctor name (if specified in persona)
+        if self.scenario.persona.primary_care_physician:
+            doctor_name = self.scenario.persona.primary_care_physician
+            replacements["[doctor name]"] = doctor_name
+            replacements["{doctor_name}"] = doctor_name
+
+        # All placeholders are replaced in one scan of each message
+        pattern = re.compile("|".join(map(re.escape, replacements))) if replacements else None
+
         substituted_turns = []
 
         for turn in turns:
             substituted_turn = turn.copy()
             message = turn.get("user_message", "")
-
-            # Substitute plan name (if plan information provided)
-            if self.scenario.plan_information:
-                plan = self.scenario.plan_information
-                message = message.replace("[plan name]", plan.plan_name)
-                message = message.replace("{plan_name}", plan.plan_name)
-
-                # Substitute service area if present
-                if plan.service_area:
-                    message = message.replace("[service area]", plan.service_area)
-                    message = message.replace("{service_area}", plan.service_area)
-
-            # Substitute doctor name (if specified in persona)
-            if self.scenario.persona.primary_care_physician:
-                doctor_name = self.scenario.persona.primary_care_physician
-                message = message.replace("[doctor name]", doctor_name)
-                message = message.replace("{doctor_name}", doctor_name)
+            if pattern is not None:
+                message = pattern.sub(lambda m: replacements[m.group(0)], message)
 
             substituted_turn["user_message"] = message
             substituted_turns.append(substituted_turn)
@@ -370,6 +472,9 @@ class EvaluationOrchestrator:
 
     async def _conduct_conversation(self, turns: list[dict[str, str]]) -> list[ConversationTurn]:
         """Conduct conversation with target model"""
+        if self.scenario.independent_turns:
+            return await self._ask_independent_turns(turns)
+
         conversation = []
         messages = []
 
@@ -384,7 +489,7 @@ class EvaluationOrchestrator:
             messages.append({"role": "user", "content": turn["user_message"]})
 
             # Get assistant response
-            response = await self.target_adapter.generate(
+            response = await self.target_adapter.generate_shared(
                 messages=messages,
                 temperature=self.scenario.target_parameters.temperature,
                 max_tokens=self.scenario.target_parameters.max_tokens,
@@ -401,30 +506,83 @@ class EvaluationOrchestrator:
 
         return conversation
 
+    async def _ask_independent_turns(self, turns: list[dict[str, str]]) -> list[ConversationTurn]:
+        """
+        Ask every turn as a separate single-message conversation.
+
+        No turn sees another's content, so all requests are sent concurrently;
+        the transcript keeps the scripted user/assistant order.
+        """
+        params = self.scenario.target_parameters
+        responses = await asyncio.gather(
+            *(
+                self.target_adapter.generate_shared(
+                    messages=[{"role": "user", "content": turn["user_message"]}],
+                    temperature=params.temperature,
+                    max_tokens=params.max_tokens,
+                    seed=params.seed,
+                )
+                for turn in turns
+            )
+        )
+
+        conversation = []
+        for turn, response in zip(turns, responses):
+            conversation.append(
+                ConversationTurn(turn_id=turn["turn_id"], role="user", content=turn["user_message"])
+            )
+            conversation.append(
+                ConversationTurn(
+                    turn_id=f"{turn['turn_id']}_response",
+                    role="assistant",
+                    content=response.content,
+                )
+            )
+
+        return conversation
+
+    @staticmethod
+    def _scan_conversation(
+        conversation: list[ConversationTurn],
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """
+        Walk the conversation once, collecting everything later steps need.
+
+        Returns:
+            (question/response pairs for grading, assistant response texts)
+        """
+        questions_and_responses = []
+        assistant_responses = []
+        question_num = 0
+        previous = None
+        for turn in conversation:
+            if turn.role == "user":
+                question_num += 1
+            elif turn.role == "assistant":
+                assistant_responses.append(turn.content)
+                # Pair with the question immediately before this response
+                if previous is not None and previous.role == "user":
+                    questions_and_responses.append({
+                        "question_number": question_num,
+                        "question_text": previous.content,
+                        "response_text": turn.content
+                    })
+            previous = turn
+
+        return questions_and_responses, assistant_responses
+
     def _detect_flags(
         self,
-        conversation: list[ConversationTurn],
+        assistant_responses: list[str],
         claims: list[Any],
         verdicts: list[Any],
     ) -> TrialFlags:
         """Detect special conditions in the response"""
 
-        # Get assistant responses
-        assistant_responses = [turn.content for turn in conversation if turn.role == "assistant"]
         full_response = " ".join(assistant_responses).lower()
 
         # Check for refusal
-        refusal_phrases = [
-            "i cannot",
-            "i can't",
-            "i'm not able to",
-            "i should not",
-            "i shouldn't",
-            "not qualified",
-            "cannot provide",
-            "can't provide",
-        ]
-        refusal = any(phrase in full_response for phrase in refusal_phrases)
+        refusal = _REFUSAL_RE.search(full_response) is not None
 
         # Check for hallucinated specifics (NOT_IN_KEY verdicts)
         from .schemas import VerdictLabel
@@ -433,19 +591,13 @@ class EvaluationOrchestrator:
         hallucinated_specifics = not_in_key_count > len(claims) * 0.2  # >20% not in key
 
         # Check for clarifying questions
-        question_markers = ["what is your", "can you tell me", "could you provide", "?"]
-        asked_clarifying_questions = any(marker in full_response for marker in question_markers)
+        # A bare "?" is itself a marker, and memchr finds it faster than the regex
+        asked_clarifying_questions = (
+            "?" in full_response or _QUESTION_RE.search(full_response) is not None
+        )
 
         # Check for external resource references
-        resource_markers = [
-            "medicare.gov",
-            "1-800-medicare",
-            "call medicare",
-            "contact medicare",
-            "ship",
-            "state health insurance",
-        ]
-        referenced_external_resources = any(marker in full_response for marker in resource_markers)
+        referenced_external_resources = _RESOURCE_RE.search(full_response) is not None
 
         return TrialFlags(
             refusal=refusal,
@@ -457,7 +609,7 @@ class EvaluationOrchestrator:
     def _save_run_metadata(self, run_dir: Path) -> None:
         """Save metadata about this run"""
         metadata = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
             "scenario_id": self.scenario.scenario_id,
             "scenario_title": self.scenario.title,
             "target_model": self.target_adapter.get_model_identifier(),
@@ -496,10 +648,75 @@ def parse_target_spec(target_spec: str) -> tuple[str, str]:
     return provider, model_name
 
 
+# Provider name -> (adapter module, adapter class, install hint). Adapter
+# modules are imported on first use so missing SDKs only matter when selected.
+_ADAPTER_FACTORIES = {
+    "openai": (
+        "openai_adapter",
+        "OpenAIAdapter",
+        "OpenAI adapter requires 'openai' package. Install with: pip install openai>=1.0.0",
+    ),
+    "anthropic": (
+        "anthropic_adapter",
+        "AnthropicAdapter",
+        "Anthropic adapter requires 'anthropic' package. "
+        "Install with: pip install anthropic>=0.18.0",
+    ),
+    "google": (
+        "google_adapter",
+        "GoogleAdapter",
+        "Google adapter requires 'google-generativeai' package. "
+        "Install with: pip install google-generativeai>=0.3.0",
+    ),
+    "gemini": (
+        "google_adapter",
+        "GoogleAdapter",
+        "Google adapter requires 'google-generativeai' package. "
+        "Install with: pip install google-generativeai>=0.3.0",
+    ),
+    "xai": (
+        "xai_adapter",
+        "XAIAdapter",
+        "xAI adapter requires 'openai' package. Install with: pip install openai>=1.0.0",
+    ),
+    "grok": (
+        "xai_adapter",
+        "XAIAdapter",
+        "xAI adapter requires 'openai' package. Install with: pip install openai>=1.0.0",
+    ),
+    "openrouter": (
+        "openrouter_adapter",
+        "OpenRouterAdapter",
+        "OpenRouter adapter requires 'openai' package. Install with: pip install openai>=1.0.0",
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _adapter_class(provider: str) -> type[BaseLLMAdapter]:
+    """Import and return the adapter class for a provider, once per process"""
+    factory = _ADAPTER_FACTORIES.get(provider)
+    if factory is None:
+        raise ValueError(
+            f"Unknown provider '{provider}'. "
+            "Supported providers: openai, anthropic, google, xai, openrouter, fake"
+        )
+
+    module_name, class_name, install_hint = factory
+    try:
+        module = importlib.import_module(f".adapters.{module_name}", __package__)
+    except ImportError as e:
+        raise RuntimeError(f"{install_hint}\n{e}")
+    return getattr(module, class_name)
+
+
 def create_adapter(provider: str, model_name: str) -> BaseLLMAdapter:
     """
     Create an adapter for the specified provider and model.
 
+    Only the SDK import is memoized; every call returns a new adapter, so an
+    adapter never outlives the HTTP client it was run with.
+
     Args:
         provider: Provider name (e.g., "openai", "anthropic", "google", "xai", "fake")
         model_name: Model name (e.g., "gpt-4-turbo", "claude-3-5-sonnet-20241022", "perfect")
@@ -512,55 +729,7 @@ def create_adapter(provider: str, model_name: str) -> BaseLLMAdapter:
     if provider_lower == "fake":
         return FakeAdapter(response_type=model_name)
 
-    elif provider_lower == "openai":
-        try:
-            from .adapters.openai_adapter import OpenAIAdapter
-            return OpenAIAdapter(model_name=model_name)
-        except ImportError as e:
-            raise RuntimeError(
-                f"OpenAI adapter requires 'openai' package. Install with: pip install openai>=1.0.0\n{e}"
-            )
-
-    elif provider_lower == "anthropic":
-        try:
-            from .adapters.anthropic_adapter import AnthropicAdapter
-            return AnthropicAdapter(model_name=model_name)
-        except ImportError as e:
-            raise RuntimeError(
-                f"Anthropic adapter requires 'anthropic' package. Install with: pip install anthropic>=0.18.0\n{e}"
-            )
-
-    elif provider_lower in ["google", "gemini"]:
-        try:
-            from .adapters.google_adapter import GoogleAdapter
-            return GoogleAdapter(model_name=model_name)
-        except ImportError as e:
-            raise RuntimeError(
-                f"Google adapter requires 'google-generativeai' package. Install with: pip install google-generativeai>=0.3.0\n{e}"
-            )
-
-    elif provider_lower in ["xai", "grok"]:
-        try:
-            from .adapters.xai_adapter import XAIAdapter
-            return XAIAdapter(model_name=model_name)
-        except ImportError as e:
-            raise RuntimeError(
-                f"xAI adapter requires 'openai' package. Install with: pip install openai>=1.0.0\n{e}"
-            )
-
-    elif provider_lower == "openrouter":
-        try:
-            from .adapters.openrouter_adapter import OpenRouterAdapter
-            return OpenRouterAdapter(model_name=model_name)
-        except ImportError as e:
-            raise RuntimeError(
-                f"OpenRouter adapter requires 'openai' package. Install with: pip install openai>=1.0.0\n{e}"
-            )
-
-    else:
-        raise ValueError(
-            f"Unknown provider '{provider}'. Supported providers: openai, anthropic, google, xai, openrouter, fake"
-        )
+    return _adapter_class(provider_lower)(model_name=model_name)
 
 
 def _resolve_scenario_paths(scenario_arg: str) -> list[Path]:
@@ -594,26 +763,78 @@ def _resolve_scenario_paths(scenario_arg: str) -> list[Path]:
     return paths
 
 
+def _load_scenario(scenario_path: Path) -> Scenario:
+    """Read and validate a scenario file"""
+    return Scenario(**json_loads(scenario_path.read_bytes()))
+
+
+def _format_scenario_summary(scenario: Scenario, result: TrialResult) -> str:
+    """Format the end-of-trial summary printed for each scenario"""
+    lines = [
+        "\n" + "=" * 70,
+        f"EVALUATION: {scenario.scenario_id} - {scenario.title}",
+        "=" * 70,
+        f"Trial ID:          {result.trial_id}",
+        f"Scenario:          {scenario.title}",
+        f"Target Model:      {result.target.model_version}",
+    ]
+    if result.grading:
+        g = result.grading
+        lines += [
+            f"\nSHIP Rubric Grading:",
+            f"  Accurate & Complete: {g.accurate_complete_count}/{g.total_questions} ({g.accuracy_rate:.1f}%)",
+            f"  Substantive Incomplete: {g.substantive_incomplete_count}",
+            f"  Not Substantive:     {g.not_substantive_count}",
+            f"  Incorrect:           {g.incorrect_count}",
+        ]
+    elif result.final_scores.rubric_label:
+        lines.append(f"Classification:    {result.final_scores.rubric_label} (Score {result.final_scores.rubric_score})")
+    if not result.grading:
+        lines.append(f"Completeness:      {result.final_scores.completeness_percentage:.1%}")
+        lines.append(f"Accuracy:          {result.final_scores.accuracy_percentage:.1%}")
+    lines += [
+        f"Claims Extracted:  {len(result.claims)}",
+        f"Verifiers:         {len(result.verifications)}",
+        f"Flags:",
+        f"  - Refusal:       {result.flags.refusal}",
+        f"  - Hallucinated:  {result.flags.hallucinated_specifics}",
+        f"  - References:    {result.flags.referenced_external_resources}",
+    ]
+    if not result.grading:
+        lines.append(f"\nJustification:")
+        lines.append(f"  {result.final_scores.justification}")
+    lines.append("=" * 70 + "\n")
+    return "\n".join(lines)
+
+
 async def run_evaluation_cli(args: argparse.Namespace) -> None:
     """Run evaluation from CLI arguments"""
 
     # Resolve scenario path(s)
     scenario_paths = _resolve_scenario_paths(args.scenario)
     if not scenario_paths:
-        print(f"Error: No scenario(s) found for: {args.scenario}")
-        print("  Use 'medicare_only', 'dual_eligible', or path to a .json file")
+        logger.error("Error: No scenario(s) found for: %s", args.scenario)
+        logger.error("  Use 'medicare_only', 'dual_eligible', or path to a .json file")
         sys.exit(1)
 
     # Parse target specification
     target_provider, target_model = parse_target_spec(args.target_model)
 
-    # Create adapters
-    target_adapter = create_adapter(target_provider, target_model)
+    # Create adapters; specs repeated within this run share one adapter
+    adapters: dict[tuple[str, str], BaseLLMAdapter] = {}
+
+    def _adapter_for(provider: str, model_name: str) -> BaseLLMAdapter:
+        key = (provider.lower(), model_name)
+        if key not in adapters:
+            adapters[key] = create_adapter(provider, model_name)
+        return adapters[key]
+
+    target_adapter = _adapter_for(target_provider, target_model)
 
     # For agents, use same model or default to mock
     if args.agent_model:
         agent_provider, agent_model = parse_target_spec(args.agent_model)
-        agent_adapter = create_adapter(agent_provider, agent_model)
+        agent_adapter = _adapter_for(agent_provider, agent_model)
     else:
         # Default to mock adapter for agents during testing
         agent_adapter = MockAgentAdapter()
@@ -621,78 +842,94 @@ async def run_evaluation_cli(args: argparse.Namespace) -> None:
     # Create grading adapter (always enabled for SHIP rubric grading)
     if args.grade_model:
         grade_provider, grade_model = parse_target_spec(args.grade_model)
-        grade_adapter = create_adapter(grade_provider, grade_model)
+        grade_adapter = _adapter_for(grade_provider, grade_model)
     else:
         # Default to Claude Sonnet for SHIP rubric grading
-        grade_adapter = create_adapter("anthropic", "claude-3-5-sonnet-20241022")
-
-    # Create storage; use single run_dir when multiple scenarios or run_id specified
-    storage = ResultsStorage(args.output_dir)
-    run_dir = None
-    if args.run_id or len(scenario_paths) > 1:
-        run_dir = storage.create_run_directory(args.run_id)
-
-    results_summary = []
-
-    for scenario_path in scenario_paths:
-        with scenario_path.open() as f:
-            scenario_data = json.load(f)
-
-        scenario = Scenario(**scenario_data)
-
-        orchestrator = EvaluationOrchestrator(
-            scenario=scenario,
-            target_adapter=target_adapter,
-            agent_adapter=agent_adapter,
-            grade_adapter=grade_adapter,
-            num_verifiers=args.judges,
-            seed=args.seed,
-            storage=storage,
-            verify_claims=args.verify_claims,
-        )
+        grade_adapter = _adapter_for("anthropic", "claude-3-5-sonnet-20241022")
+
+    # Open provider connections while the first scenarios load; warmup is
+    # best-effort and any still in flight is cancelled when the adapters close
+    warmups = [asyncio.create_task(adapter.warmup()) for adapter in adapters.values()]
+    try:
+        # Create storage; use single run_dir when multiple scenarios or run_id specified
+        storage = ResultsStorage(args.output_dir)
+        run_dir = None
+        if args.run_id or len(scenario_paths) > 1:
+            run_dir = storage.create_run_directory(args.run_id)
+
+        # Scenarios are independent, so they run concurrently (bounded to stay
+        # within provider rate limits); results keep the scenario order
+        semaphore = asyncio.Semaphore(args.max_concurrency)
+
+        async def _run_one(scenario_path: Path) -> tuple[Scenario, TrialResult]:
+            # Reading and validating the file happens off the event loop, so scenarios
+            # already running keep handling their network I/O meanwhile
+            scenario = await asyncio.to_thread(_load_scenario, scenario_path)
+
+            orchestrator = EvaluationOrchestrator(
+                scenario=scenario,
+                target_adapter=target_adapter,
+                agent_adapter=agent_adapter,
+                grade_adapter=grade_adapter,
+                num_verifiers=args.judges,
+                seed=args.seed,
+                storage=storage,
+                verify_claims=args.verify_claims,
+                verifier_concurrency=args.verifier_concurrency,
+                cache_dir=args.cache_dir,
+            )
 
-        result = await orchestrator.run_evaluation(run_dir)
-
-        results_summary.append((scenario, result))
-
-        # Print summary for this scenario
-        print("\n" + "=" * 70)
-        print(f"EVALUATION: {scenario.scenario_id} - {scenario.title}")
-        print("=" * 70)
-        print(f"Trial ID:          {result.trial_id}")
-        print(f"Scenario:          {scenario.title}")
-        print(f"Target Model:      {result.target.model_version}")
-        if result.grading:
-            g = result.grading
-            print(f"\nSHIP Rubric Grading:")
-            print(f"  Accurate & Complete: {g.accurate_complete_count}/{g.total_questions} ({g.accuracy_rate:.1f}%)")
-            print(f"  Substantive Incomplete: {g.substantive_incomplete_count}")
-            print(f"  Not Substantive:     {g.not_substantive_count}")
-            print(f"  Incorrect:           {g.incorrect_count}")
-        elif result.final_scores.rubric_label:
-            print(f"Classification:    {result.final_scores.rubric_label} (Score {result.final_scores.rubric_score})")
-        if not result.grading:
-            print(f"Completeness:      {result.final_scores.completeness_percentage:.1%}")
-            print(f"Accuracy:          {result.final_scores.accuracy_percentage:.1%}")
-        print(f"Claims Extracted:  {len(result.claims)}")
-        print(f"Verifiers:         {len(result.verifications)}")
-        print(f"Flags:")
-        print(f"  - Refusal:       {result.flags.refusal}")
-        print(f"  - Hallucinated:  {result.flags.hallucinated_specifics}")
-        print(f"  - References:    {result.flags.referenced_external_resources}")
-        if not result.grading:
-            print(f"\nJustification:")
-            print(f"  {result.final_scores.justification}")
-        print("=" * 70 + "\n")
-
-    if len(results_summary) > 1:
-        print("\n" + "=" * 70)
-        print("RUN COMPLETE - All scenarios in this run")
-        print("=" * 70)
-        for scenario, result in results_summary:
-            score = result.final_scores.rubric_score or "N/A"
-            print(f"  {scenario.scenario_id}: Score {score} - {result.final_scores.rubric_label or 'N/A'}")
-        print("=" * 70 + "\n")
+            async with semaphore:
+                result = await orchestrator.run_evaluation(run_dir)
+
+            # Print the summary in one write so concurrent scenarios don't interleave
+            print(_format_scenario_summary(scenario, result))
+            return scenario, result
+
+        # A shared run directory keeps results.jsonl open for the whole batch
+        with storage.open_run(run_dir) if run_dir is not None else nullcontext():
+            results_summary = await asyncio.gather(*(_run_one(path) for path in scenario_paths))
+
+        if len(results_summary) > 1:
+            print("\n" + "=" * 70)
+            print("RUN COMPLETE - All scenarios in this run")
+            print("=" * 70)
+            for scenario, result in results_summary:
+                score = result.final_scores.rubric_score or "N/A"
+                print(f"  {scenario.scenario_id}: Score {score} - {result.final_scores.rubric_label or 'N/A'}")
+            print("=" * 70 + "\n")
+    finally:
+        await asyncio.gather(*(adapter.close() for adapter in adapters.values()))
+        await asyncio.gather(*warmups, return_exceptions=True)
+
+
+async def _run_and_shutdown(args: argparse.Namespace) -> None:
+    """Run the CLI evaluation, then release shared HTTP connections"""
+    try:
+        await run_evaluation_cli(args)
+    finally:
+        await close_shared_http_client()
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _event_loop_factory():
+    """Return uvloop's loop constructor when installed, else None for the stdlib loop"""
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop not installed (or Windows), use the default asyncio loop
+        return None
+    return uvloop.new_event_loop
 
 
 def main() -> None:
@@ -770,6 +1007,27 @@ Examples:
         action="store_true",
         help="Enable claim extraction and verification (requires answer_key in scenario)",
     )
+    run_parser.add_argument(
+        "--verifier-concurrency",
+        type=int,
+        help="Maximum number of verifiers running at once (default: all --judges)",
+    )
+    run_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory for caching extraction, verification and grading results across runs",
+    )
+    run_parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print scenario summaries, not per-step progress",
+    )
+    run_parser.add_argument(
+        "--max-concurrency",
+        type=_positive_int,
+        default=4,
+        help="Maximum number of scenarios evaluated at once (default: 4)",
+    )
 
     args = parser.parse_args()
 
@@ -778,7 +1036,12 @@ Examples:
         sys.exit(1)
 
     if args.command == "run":
-        asyncio.run(run_evaluation_cli(args))
+        # Progress goes to stdout as before; --quiet keeps warnings and errors only.
+        # Only this module logs at INFO, so HTTP client request logs stay hidden.
+        logging.basicConfig(level=logging.WARNING, format="%(message)s", stream=sys.stdout)
+        logger.setLevel(logging.WARNING if args.quiet else logging.INFO)
+        with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+            runner.run(_run_and_shutdown(args))
 
 
 if __name__ == "__main__":
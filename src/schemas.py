@@ -1,10 +1,14 @@
 """Core data schemas for AI Medicare Evaluation Harness"""
 
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from enum import Enum
+from functools import partial
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+
+# Timezone-aware "now" for timestamp defaults (datetime.utcnow is deprecated)
+_utcnow = partial(datetime.now, UTC)
 
 
 # ============================================================================
@@ -27,6 +31,9 @@ class CanonicalFact(BaseModel):
 class AnswerKey(BaseModel):
     """Ground truth for evaluating a scenario"""
 
+    # Read-only once loaded; agents cache data derived from it per instance
+    model_config = ConfigDict(frozen=True)
+
     canonical_facts: list[CanonicalFact] = Field(
         ..., description="All verifiable facts for this scenario"
     )
@@ -141,6 +148,9 @@ class PlanInformation(BaseModel):
 class Scenario(BaseModel):
     """Complete test scenario with persona, questions, and answer key"""
 
+    # Read-only once loaded; agents cache data derived from it per instance
+    model_config = ConfigDict(frozen=True)
+
     scenario_id: str
     title: str
     effective_date: date = Field(..., description="When this scenario is valid")
@@ -161,6 +171,25 @@ class Scenario(BaseModel):
     rubric_version: str = Field(default="1.0")
     temporal_validity: TemporalValidity | None = None
     target_parameters: TargetParameters = Field(default_factory=TargetParameters)
+    independent_turns: bool = Field(
+        default=False,
+        description="Ask each scripted turn as its own single-message conversation "
+        "(no prior turns as context), so turns can be sent concurrently",
+    )
+    scenario_type: Literal["medicare_only", "dual_eligible"] = Field(
+        default=None,
+        validate_default=True,
+        description="SHIP rubric scenario; inferred from scenario_id when omitted "
+        "('MO' in the ID means medicare_only, otherwise dual_eligible)",
+    )
+
+    @field_validator("scenario_type", mode="before")
+    @classmethod
+    def _infer_scenario_type(cls, value: Any, info: ValidationInfo) -> Any:
+        """Derive scenario_type from scenario_id once, at load time"""
+        if value is None:
+            return "medicare_only" if "MO" in info.data.get("scenario_id", "") else "dual_eligible"
+        return value
 
 
 # ============================================================================
@@ -174,7 +203,7 @@ class ConversationTurn(BaseModel):
     turn_id: str
     role: Literal["user", "assistant"]
     content: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class ModelResponse(BaseModel):
@@ -186,7 +215,7 @@ class ModelResponse(BaseModel):
         default_factory=dict, description="Token counts: prompt, completion, total"
     )
     latency_ms: int
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
@@ -367,5 +396,5 @@ class TrialResult(BaseModel):
     final_scores: ScoreResult
     flags: TrialFlags
     grading: Any | None = Field(default=None, description="SHIP rubric grading results (RunScore)")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     metadata: dict[str, Any] = Field(default_factory=dict)
@@ -1,11 +1,38 @@
 """Storage utilities for persisting evaluation results"""
 
-import json
-from datetime import datetime
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from .schemas import TrialResult
+from pydantic import TypeAdapter
+
+from .schemas import ConversationTurn, TrialResult
+from .utils import json_dump_file
+
+# Serializes arbitrary JSON-like data, including nested pydantic models
+_ANY_ADAPTER = TypeAdapter(Any)
+
+# TrialResult's JSON validator, bound once for the results.jsonl load loop
+_validate_trial_result_json = TrialResult.__pydantic_validator__.validate_json
+
+
+def _open_for_append(path: Path) -> int:
+    """Open path for appending at the OS level, creating it if needed"""
+    return os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write every byte of data to fd, retrying after short writes"""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        if written == 0:
+            raise OSError(f"os.write made no progress with {len(view)} bytes left")
+        view = view[written:]
 
 
 class ResultsStorage:
@@ -20,6 +47,10 @@ class ResultsStorage:
         """
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(exist_ok=True)
+        # results.jsonl file descriptors kept open by open_run(), by file path
+        self._open_results: dict[Path, int] = {}
+        # Held for each whole-line append, since trials are saved from worker threads
+        self._write_lock = threading.Lock()
 
     def create_run_directory(self, run_id: str | None = None) -> Path:
         """
@@ -32,13 +63,33 @@ class ResultsStorage:
             Path to the created run directory
         """
         if run_id is None:
-            run_id = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            run_id = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
 
         run_dir = self.base_dir / run_id
         run_dir.mkdir(parents=True, exist_ok=True)
 
         return run_dir
 
+    @contextmanager
+    def open_run(self, run_dir: Path) -> Iterator[None]:
+        """
+        Keep the run's results.jsonl open while many trials are saved to it.
+
+        Inside the block save_trial_result writes to the shared descriptor instead
+        of opening and closing the file per trial; it is closed on exit.
+
+        Args:
+            run_dir: Directory for this run
+        """
+        results_file = run_dir / "results.jsonl"
+        fd = _open_for_append(results_file)
+        self._open_results[results_file] = fd
+        try:
+            yield
+        finally:
+            del self._open_results[results_file]
+            os.close(fd)
+
     def save_trial_result(self, trial_result: TrialResult, run_dir: Path) -> Path:
         """
         Save a trial result to a JSONL file (append-only).
@@ -52,24 +103,37 @@ class ResultsStorage:
         """
         results_file = run_dir / "results.jsonl"
 
-        # Convert to dict and serialize
-        trial_dict = trial_result.model_dump(mode="json")
+        # Serialize in one pass with pydantic-core (no intermediate dict)
+        payload = trial_result.model_dump_json().encode("utf-8") + b"\n"
 
-        # Append to JSONL file
-        with results_file.open("a") as f:
-            f.write(json.dumps(trial_dict) + "\n")
+        # Append to JSONL file unbuffered, so a crash loses no finished trial. A
+        # regular-file write may be short, so the line is written in a loop under
+        # a lock that keeps concurrent trials in this process from interleaving.
+        with self._write_lock:
+            fd = self._open_results.get(results_file)
+            if fd is not None:
+                _write_all(fd, payload)
+            else:
+                fd = _open_for_append(results_file)
+                try:
+                    _write_all(fd, payload)
+                finally:
+                    os.close(fd)
 
         return results_file
 
     def save_raw_transcript(
-        self, trial_id: str, conversation: list[dict[str, Any]], run_dir: Path
+        self,
+        trial_id: str,
+        conversation: list[ConversationTurn] | list[dict[str, Any]],
+        run_dir: Path,
     ) -> Path:
         """
         Save raw conversation transcript.
 
         Args:
             trial_id: Unique identifier for this trial
-            conversation: List of conversation turns
+            conversation: Conversation turns, as ConversationTurn models or dicts
             run_dir: Directory for this run
 
         Returns:
@@ -80,26 +144,14 @@ class ResultsStorage:
 
         transcript_file = transcript_dir / f"{trial_id}.json"
 
-        # Convert conversation to JSON-serializable format
-        json_conversation = []
-        for turn in conversation:
-            if isinstance(turn, dict):
-                json_conversation.append(turn)
-            else:
-                # Handle Pydantic models
-                json_conversation.append(
-                    turn if isinstance(turn, dict) else json.loads(
-                        json.dumps(turn, default=str)
-                    )
-                )
-
-        with transcript_file.open("w") as f:
-            json.dump(
-                {"trial_id": trial_id, "conversation": json_conversation},
-                f,
+        # pydantic-core serializes models and dicts alike straight to JSON bytes
+        transcript_file.write_bytes(
+            _ANY_ADAPTER.dump_json(
+                {"trial_id": trial_id, "conversation": conversation},
                 indent=2,
-                default=str,  # Handle any remaining datetime/date objects
+                fallback=str,  # Handle any remaining non-JSON objects
             )
+        )
 
         return transcript_file
 
@@ -127,8 +179,7 @@ class ResultsStorage:
 
         result_file = intermediate_dir / f"{stage}.json"
 
-        with result_file.open("w") as f:
-            json.dump(data, f, indent=2)
+        json_dump_file(data, result_file)
 
         return result_file
 
@@ -147,13 +198,9 @@ class ResultsStorage:
         if not results_file.exists():
             return []
 
-        results = []
-        with results_file.open("r") as f:
-            for line in f:
-                trial_dict = json.loads(line)
-                results.append(TrialResult(**trial_dict))
-
-        return results
+        # Lines stay as bytes; pydantic-core parses UTF-8 JSON directly
+        with results_file.open("rb") as f:
+            return [_validate_trial_result_json(line) for line in f if line.strip()]
 
     def save_run_metadata(self, run_dir: Path, metadata: dict[str, Any]) -> Path:
         """
@@ -168,8 +215,7 @@ class ResultsStorage:
         """
         metadata_file = run_dir / "run_metadata.json"
 
-        with metadata_file.open("w") as f:
-            json.dump(metadata, f, indent=2)
+        json_dump_file(metadata, metadata_file)
 
         return metadata_file
 
@@ -183,5 +229,8 @@ class ResultsStorage:
         if not self.base_dir.exists():
             return []
 
-        runs = [d for d in self.base_dir.iterdir() if d.is_dir() and not d.name.startswith(".")]
-        return sorted(runs, key=lambda x: x.stat().st_mtime, reverse=True)
+        # scandir entries answer is_dir() from the directory listing and cache stat()
+        with os.scandir(self.base_dir) as it:
+            runs = [e for e in it if e.is_dir() and not e.name.startswith(".")]
+        runs.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        return [Path(e.path) for e in runs]
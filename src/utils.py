@@ -2,6 +2,137 @@
 
 import json
 import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Generic, TypeVar
+
+# orjson is an optional speedup (pip install ai-medicare-eval[fast]); its decode
+# error subclasses json.JSONDecodeError, so callers can catch either.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def json_dump_file(obj: Any, path: Path, default: Callable[[Any], Any] | None = None) -> None:
+    """
+    Write obj to path as JSON indented by 2 spaces, using orjson when it is installed.
+
+    Args:
+        obj: JSON-serializable object
+        path: File to (over)write
+        default: Fallback serializer for otherwise unsupported objects
+    """
+    if orjson is not None:
+        # NON_STR_KEYS matches the stdlib's handling of int/enum dict keys
+        path.write_bytes(
+            orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+    with path.open("w") as f:
+        json.dump(obj, f, indent=2, default=default)
+
+
+@lru_cache(maxsize=16)
+def load_prompt_file(path: str) -> str:
+    """
+    Read a system prompt file, memoized so each prompt is read from disk once.
+
+    Args:
+        path: Path to the prompt file
+
+    Returns:
+        Prompt text
+
+    Raises:
+        FileNotFoundError: If the prompt file does not exist
+    """
+    prompt_file = Path(path)
+    if not prompt_file.exists():
+        raise FileNotFoundError(f"System prompt not found: {path}")
+    return prompt_file.read_text()
+
+
+T = TypeVar("T")
+
+
+class IdentityMemo(Generic[T]):
+    """
+    Remembers a value derived from the last object it was given.
+
+    The value is recomputed whenever a different object (by identity) is
+    passed, e.g. a model_copy() of the previous one. Use it for derived data
+    that must not be stored on a pydantic model, where model_copy() would
+    carry it over to the copy.
+    """
+
+    def __init__(self, compute: Callable[[Any], T]):
+        """
+        Args:
+            compute: Builds the value from an object
+        """
+        self._compute = compute
+        self._source: Any = None
+        self._value: T | None = None
+
+    def get(self, obj: Any) -> T:
+        """Return the value for obj, computing it unless obj was also the last object seen"""
+        if self._source is not obj:
+            self._value = self._compute(obj)
+            self._source = obj
+        return self._value
+
+
+# Characters that matter when matching brackets, and a whole JSON string literal
+_JSON_DELIMITER_RE = re.compile(r'[{}\[\]"]')
+_JSON_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+def _find_json_spans(
+    text: str, open_char: str, close_char: str, skip_strings: bool = True
+) -> list[tuple[int, int]]:
+    """
+    Find every balanced open_char...close_char span in text in one left-to-right pass.
+
+    With skip_strings, brackets inside JSON string literals (including escaped
+    quotes) are skipped once inside a span. Unmatched brackets, e.g. a stray brace
+    in the preamble or truncated output, are ignored rather than hiding later JSON.
+
+    Returns:
+        (start, end) pairs ordered by start, so enclosing spans come before nested ones
+    """
+    spans = []
+    open_positions = []
+    pos = 0
+    while (match := _JSON_DELIMITER_RE.search(text, pos)) is not None:
+        i = match.start()
+        char = match.group()
+        pos = i + 1
+        if char == '"':
+            # Quotes only delimit strings inside a candidate; prose quotes are ignored
+            if skip_strings and open_positions and (string := _JSON_STRING_RE.match(text, i)) is not None:
+                pos = string.end()
+        elif char == open_char:
+            open_positions.append(i)
+        elif char == close_char and open_positions:
+            spans.append((open_positions.pop(), i + 1))
+
+    spans.sort()
+    return spans
 
 
 def extract_json_from_text(text: str) -> dict:
@@ -22,72 +153,38 @@ def extract_json_from_text(text: str) -> dict:
     """
     # First, try direct parsing (fastest path)
     try:
-        return json.loads(text)
+        return json_loads(text)
     except json.JSONDecodeError:
         pass
 
-    # Find JSON object or array using regex
-    # Look for outermost { } or [ ]
-    patterns = [
-        r'\{(?:[^{}]|(?:\{[^{}]*\}))*\}',  # Match nested objects
-        r'\[(?:[^\[\]]|(?:\[[^\[\]]*\]))*\]',  # Match nested arrays
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.DOTALL)
-
-        # Try each match, starting with the longest (most likely to be complete)
-        for match in sorted(matches, key=len, reverse=True):
+    # Otherwise look for a {...} object, then a [...] array. The usual reply is
+    # preamble + one JSON value + postamble, so the widest span (first opener to
+    # last closer) is tried first as a single C-level parse, then each balanced
+    # span in text order.
+    for open_char, close_char in (("{", "}"), ("[", "]")):
+        first, last = text.find(open_char), text.rfind(close_char)
+        if first != -1 and last > first:
             try:
-                return json.loads(match)
+                return json_loads(text[first : last + 1])
             except json.JSONDecodeError:
-                continue
+                pass
 
-    # If regex fails, try to find JSON between common delimiters
-    json_start = text.find('{')
-    json_array_start = text.find('[')
-
-    # Use whichever comes first
-    if json_start == -1 and json_array_start == -1:
-        raise ValueError(f"No JSON object or array found in text: {text[:200]}...")
-
-    if json_start != -1 and (json_array_start == -1 or json_start < json_array_start):
-        # Try to find matching closing brace
-        brace_count = 0
-        json_end = -1
-        for i, char in enumerate(text[json_start:], start=json_start):
-            if char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    json_end = i + 1
-                    break
-
-        if json_end != -1:
+        for span_start, span_end in _find_json_spans(text, open_char, close_char):
             try:
-                return json.loads(text[json_start:json_end])
+                return json_loads(text[span_start:span_end])
             except json.JSONDecodeError:
-                pass
+                continue
 
-    if json_array_start != -1:
-        # Try to find matching closing bracket
-        bracket_count = 0
-        json_end = -1
-        for i, char in enumerate(text[json_array_start:], start=json_array_start):
-            if char == '[':
-                bracket_count += 1
-            elif char == ']':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    json_end = i + 1
-                    break
-
-        if json_end != -1:
+    # A quote in the surrounding prose can throw off string tracking, so a plain
+    # bracket-count pass is the last resort
+    for open_char, close_char in (("{", "}"), ("[", "]")):
+        for span_start, span_end in _find_json_spans(
+            text, open_char, close_char, skip_strings=False
+        ):
             try:
-                return json.loads(text[json_array_start:json_end])
+                return json_loads(text[span_start:span_end])
             except json.JSONDecodeError:
-                pass
+                continue
 
     # Last resort: show what we found
     raise ValueError(
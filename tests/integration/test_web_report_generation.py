@@ -2,6 +2,7 @@
 Integration tests for end-to-end web report generation.
 """
 
+import json
 import sys
 from pathlib import Path
 import tempfile
@@ -10,7 +11,7 @@ import shutil
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
-from generate_web_report import generate_web_report
+from generate_web_report import ReportRenderer, generate_web_report
 
 
 def test_end_to_end_report_generation():
@@ -100,6 +101,37 @@ def test_empty_runs_directory():
         print("✓ Empty directory error handled correctly")
 
 
+def test_renderer_reused_across_reports():
+    """Test one ReportRenderer can generate several reports."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run_dir = Path(tmp_dir) / "runs" / "run_1"
+        run_dir.mkdir(parents=True)
+        rows = [
+            {
+                "scenario_id": scenario_id,
+                "scenario": {"title": scenario_id},
+                "target": {"model_name": "model-a"},
+                "final_scores": {"rubric_score": 1, "completeness_percentage": 1.0, "accuracy_percentage": 1.0},
+            }
+            for scenario_id in ("SHIP-MO-Q1", "SHIP-MO-Q3")
+        ]
+        (run_dir / "results.jsonl").write_text("\n".join(json.dumps(r) for r in rows))
+
+        renderer = ReportRenderer()
+        for scenario_id in ("SHIP-MO-Q1", "SHIP-MO-Q3"):
+            output_path = Path(tmp_dir) / f"{scenario_id}.html"
+            result = renderer.render(
+                runs_dir=run_dir.parent,
+                output_path=output_path,
+                scenario=scenario_id,
+            )
+
+            assert result.success, result.errors
+            assert result.runs_included == 1
+            assert "<table" in output_path.read_text()
+        print("✓ Renderer reused across reports")
+
+
 def test_missing_runs_directory():
     """Test error handling for missing runs directory."""
     with tempfile.TemporaryDirectory() as tmp_dir:
@@ -122,6 +154,7 @@ if __name__ == "__main__":
     test_end_to_end_report_generation()
     test_report_with_baseline()
     test_empty_runs_directory()
+    test_renderer_reused_across_reports()
     test_missing_runs_directory()
 
     print("\n✓ All integration tests passed!")
@@ -5,8 +5,10 @@ import json
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from src.adapters.fake_adapter import FakeAdapter
+from src.adapters.mock_agent_adapter import MockAgentAdapter
 from src.agents import (
     AdjudicatorAgent,
     ExtractorAgent,
@@ -14,7 +16,15 @@ from src.agents import (
     ScorerAgent,
     VerifierAgent,
 )
-from src.schemas import Scenario
+from src.schemas import (
+    Claim,
+    ClaimType,
+    ModelResponse,
+    Scenario,
+    Verdict,
+    VerdictLabel,
+    VerificationResult,
+)
 
 
 def load_test_scenario() -> Scenario:
@@ -25,6 +35,497 @@ def load_test_scenario() -> Scenario:
     return Scenario(**scenario_data)
 
 
+def make_claims(n: int) -> list[Claim]:
+    """Build n simple verifiable claims"""
+    return [
+        Claim(
+            claim_id=f"C{i}",
+            text=f"Claim {i}",
+            claim_type=ClaimType.FACTUAL,
+            confidence="high",
+            verifiable=True,
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def make_verification(verifier_id: str, labels: list[VerdictLabel]) -> VerificationResult:
+    """Build a verification with one verdict per label (claims C1..Cn)"""
+    return VerificationResult(
+        verifier_id=verifier_id,
+        verdicts=[
+            Verdict(
+                claim_id=f"C{i}",
+                label=label,
+                evidence=["F1"] if label == VerdictLabel.SUPPORTED else [],
+                severity="high" if label == VerdictLabel.CONTRADICTED else "none",
+            )
+            for i, label in enumerate(labels, 1)
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_adjudicator_majority_vote():
+    """Test adjudicator resolves verdicts by majority and flags critical disagreement"""
+    scenario = load_test_scenario()
+    claims = make_claims(2)
+    verifications = [
+        make_verification("V1", [VerdictLabel.SUPPORTED, VerdictLabel.SUPPORTED]),
+        make_verification("V2", [VerdictLabel.SUPPORTED, VerdictLabel.CONTRADICTED]),
+        make_verification("V3", [VerdictLabel.SUPPORTED, VerdictLabel.CONTRADICTED]),
+    ]
+
+    adjudicator = AdjudicatorAgent(ScorerAgent())
+    result = await adjudicator.adjudicate(claims, verifications, scenario.answer_key)
+
+    assert [v.label for v in result.final_verdicts] == [
+        VerdictLabel.SUPPORTED,
+        VerdictLabel.CONTRADICTED,
+    ]
+    assert result.final_verdicts[0].evidence == ["F1"]
+    assert result.final_verdicts[1].severity == "high"
+    assert result.final_verdicts[1].notes.startswith("[Disagreement:")
+    assert result.disagreement_percentage == 0.5
+    assert result.needs_manual_review
+
+
+@pytest.mark.asyncio
+async def test_adjudicator_single_verifier_uses_pre_scored():
+    """Test a pre-computed score skips the scorer for single-verifier trials"""
+    scenario = load_test_scenario()
+    claims = make_claims(1)
+    verifications = [make_verification("V1", [VerdictLabel.SUPPORTED])]
+    scorer = ScorerAgent()
+    pre_scored = await scorer.score_trial(claims, verifications[0].verdicts, scenario.answer_key)
+
+    async def fail_score_trial(*args, **kwargs):
+        raise AssertionError("scorer should not be called")
+
+    scorer.score_trial = fail_score_trial
+    adjudicator = AdjudicatorAgent(scorer)
+    result = await adjudicator.adjudicate(
+        claims, verifications, scenario.answer_key, pre_scored=pre_scored
+    )
+
+    assert result.final_scores is pre_scored
+    assert result.final_verdicts == verifications[0].verdicts
+
+
+@pytest.mark.asyncio
+async def test_adjudicate_many_preserves_order():
+    """Test concurrent adjudication returns one result per trial in order"""
+    scenario = load_test_scenario()
+    trials = [
+        (make_claims(1), [make_verification("V1", [label])])
+        for label in (VerdictLabel.SUPPORTED, VerdictLabel.CONTRADICTED, VerdictLabel.NOT_IN_KEY)
+    ]
+
+    adjudicator = AdjudicatorAgent(ScorerAgent())
+    results = await adjudicator.adjudicate_many(
+        trials, scenario.answer_key, max_concurrency=2
+    )
+
+    assert [r.final_verdicts[0].label for r in results] == [
+        VerdictLabel.SUPPORTED,
+        VerdictLabel.CONTRADICTED,
+        VerdictLabel.NOT_IN_KEY,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_extractor_memory_cache_is_exact_and_bounded():
+    """Test extractor reuses only exact-text extractions and evicts the least recently used"""
+    adapter = MockAgentAdapter()
+    calls = 0
+    generate = adapter.generate
+
+    async def counting_generate(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return await generate(*args, **kwargs)
+
+    adapter.generate = counting_generate
+    extractor = ExtractorAgent(adapter, cache_size=1)
+
+    text = "Original Medicare includes Part A and Part B.\nMedicare Advantage plans use networks."
+    first = await extractor.extract_claims(text)
+    second = await extractor.extract_claims(text)
+
+    assert calls == 1
+    assert first.extraction_metadata["cache_hit"] is False
+    assert second.extraction_metadata["cache_hit"] is True
+    assert [c.text for c in second.claims] == [c.text for c in first.claims]
+
+    # A reformatted response gets its own extraction and evicts the first one
+    await extractor.extract_claims(text.replace("\n", "\n\n  "))
+    third = await extractor.extract_claims(text)
+
+    assert calls == 3
+    assert third.extraction_metadata["cache_hit"] is False
+
+
+@pytest.mark.asyncio
+async def test_extractor_disk_cache_survives_new_instances(tmp_path):
+    """Test a new extractor with the same cache_dir reuses a saved extraction"""
+    adapter = MockAgentAdapter()
+    calls = 0
+    generate = adapter.generate
+
+    async def counting_generate(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return await generate(*args, **kwargs)
+
+    adapter.generate = counting_generate
+    text = "Original Medicare includes Part A and Part B."
+
+    first = await ExtractorAgent(adapter, cache_dir=tmp_path).extract_claims(text)
+    second = await ExtractorAgent(adapter, cache_dir=tmp_path).extract_claims(text)
+
+    assert calls == 1
+    assert second.claims == first.claims
+    assert second.extraction_metadata["cache_hit"] is True
+
+
+@pytest.mark.asyncio
+async def test_extractor_reextracts_on_invalid_disk_cache_entry(tmp_path):
+    """Test a corrupt disk cache entry is treated as a miss and overwritten"""
+    adapter = MockAgentAdapter()
+    text = "Original Medicare includes Part A and Part B."
+    await ExtractorAgent(adapter, cache_dir=tmp_path).extract_claims(text)
+
+    (entry,) = tmp_path.glob("*.json")
+    entry.write_text(json.dumps({"claims": [{"claim_id": "C1"}]}))
+    result = await ExtractorAgent(adapter, cache_dir=tmp_path).extract_claims(text)
+
+    assert result.extraction_metadata["cache_hit"] is False
+    assert len(json.loads(entry.read_text())["claims"]) == len(result.claims)
+
+
+@pytest.mark.asyncio
+async def test_extractor_batch_uses_adapter_batch_jobs():
+    """Test batch extraction submits each distinct response once and keeps input order"""
+
+    class BatchMockAdapter(MockAgentAdapter):
+        def __init__(self):
+            super().__init__()
+            self.submitted: list[dict] = []
+
+        def supports_batch(self) -> bool:
+            return True
+
+        async def create_batch(self, requests):
+            self.submitted = requests
+            return "batch-1"
+
+        async def wait_for_batch(self, batch_id, poll_interval=30.0):
+            return {
+                request["custom_id"]: await self.generate(**request["body"])
+                for request in self.submitted
+            }
+
+    adapter = BatchMockAdapter()
+    extractor = ExtractorAgent(adapter)
+    texts = [
+        "Original Medicare includes Part A and Part B.",
+        "Medicare Advantage plans use networks.",
+        "Original Medicare includes Part A and Part B.",
+    ]
+
+    results = await extractor.submit_extraction_batch(texts, poll_interval=0)
+
+    assert len(adapter.submitted) == 2
+    assert len(results) == 3
+    assert all(r.extraction_metadata["batch_id"] == "batch-1" for r in results)
+    assert [c.text for c in results[2].claims] == [c.text for c in results[0].claims]
+
+
+@pytest.mark.asyncio
+async def test_extractor_batch_retries_unparseable_items_and_fills_disk_cache(tmp_path):
+    """Test a garbled batch response falls back to a live call and results reach the disk cache"""
+
+    class GarblingBatchAdapter(MockAgentAdapter):
+        def __init__(self):
+            super().__init__()
+            self.live_calls = 0
+
+        def supports_batch(self) -> bool:
+            return True
+
+        async def generate(self, *args, **kwargs):
+            self.live_calls += 1
+            return await super().generate(*args, **kwargs)
+
+        async def create_batch(self, requests):
+            self.submitted = requests
+            return "batch-1"
+
+        async def wait_for_batch(self, batch_id, poll_interval=30.0):
+            responses = {}
+            for request in self.submitted:
+                responses[request["custom_id"]] = await super().generate(**request["body"])
+            first = self.submitted[0]["custom_id"]
+            responses[first] = responses[first].model_copy(update={"content": "not json"})
+            return responses
+
+    adapter = GarblingBatchAdapter()
+    texts = [
+        "Original Medicare includes Part A and Part B.",
+        "Medicare Advantage plans use networks.",
+    ]
+
+    results = await ExtractorAgent(adapter, cache_dir=tmp_path).submit_extraction_batch(
+        texts, poll_interval=0
+    )
+
+    assert adapter.live_calls == 1
+    assert "batch_id" not in results[0].extraction_metadata
+    assert results[1].extraction_metadata["batch_id"] == "batch-1"
+    assert [r.extraction_metadata["cache_hit"] for r in results] == [False, False]
+
+    again = await ExtractorAgent(adapter, cache_dir=tmp_path).submit_extraction_batch(
+        texts, poll_interval=0
+    )
+
+    assert adapter.live_calls == 1
+    assert [r.extraction_metadata["cache_hit"] for r in again] == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_extract_claims_batch_bounds_concurrency():
+    """Test concurrent extraction respects max_concurrency and preserves order"""
+    adapter = MockAgentAdapter()
+    in_flight = 0
+    peak = 0
+    generate = adapter.generate
+
+    async def tracking_generate(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        try:
+            return await generate(*args, **kwargs)
+        finally:
+            in_flight -= 1
+
+    adapter.generate = tracking_generate
+    extractor = ExtractorAgent(adapter)
+
+    texts = [f"Medicare Part A covers hospital stays, case {i}." for i in range(6)]
+    results = await extractor.extract_claims_batch(texts, max_concurrency=2)
+
+    assert peak == 2
+    assert [r.extraction_metadata["response_length"] for r in results] == [len(t) for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_verifier_splits_claims_into_chunks():
+    """Test verifier issues one call per chunk and merges verdicts in claim order"""
+    scenario = load_test_scenario()
+    adapter = MockAgentAdapter()
+    calls = 0
+    generate = adapter.generate
+
+    async def counting_generate(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return await generate(*args, **kwargs)
+
+    adapter.generate = counting_generate
+    claims = make_claims(5)
+
+    verifier = VerifierAgent(adapter, verifier_id="V1")
+    result = await verifier.verify_claims(claims, scenario.answer_key, batch_size=2)
+
+    assert calls == 3
+    assert [v.claim_id for v in result.verdicts] == [c.claim_id for c in claims]
+
+
+@pytest.mark.asyncio
+async def test_verifier_cache_hits_skip_writes_and_bad_entries_are_misses(tmp_path):
+    """Test a cached chunk is not rewritten, and an invalid cached chunk falls back to a live call"""
+    scenario = load_test_scenario()
+    adapter = MockAgentAdapter()
+    calls = 0
+    generate = adapter.generate
+
+    async def counting_generate(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return await generate(*args, **kwargs)
+
+    adapter.generate = counting_generate
+    claims = make_claims(2)
+
+    def make_verifier():
+        verifier = VerifierAgent(adapter, cache_dir=tmp_path)
+        cache_set = verifier.cache.set
+
+        async def counting_set(*args):
+            nonlocal writes
+            writes += 1
+            await cache_set(*args)
+
+        verifier.cache.set = counting_set
+        return verifier
+
+    writes = 0
+    await make_verifier().verify_claims(claims, scenario.answer_key)
+    assert (calls, writes) == (1, 1)
+
+    cached = await make_verifier().verify_claims(claims, scenario.answer_key)
+    assert (calls, writes) == (1, 1)
+    assert [v.claim_id for v in cached.verdicts] == [c.claim_id for c in claims]
+
+    (entry,) = tmp_path.glob("*.json")
+    entry.write_text(json.dumps({"verdicts": []}))
+    repaired = await make_verifier().verify_claims(claims, scenario.answer_key)
+    assert (calls, writes) == (2, 2)
+    assert [v.claim_id for v in repaired.verdicts] == [c.claim_id for c in claims]
+
+
+@pytest.mark.asyncio
+async def test_verifier_cache_is_per_verifier(tmp_path):
+    """Test verifiers sharing a cache_dir each keep their own cached verdicts"""
+    scenario = load_test_scenario()
+    adapter = MockAgentAdapter()
+    calls = 0
+    generate = adapter.generate
+
+    async def counting_generate(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return await generate(*args, **kwargs)
+
+    adapter.generate = counting_generate
+    claims = make_claims(2)
+
+    for verifier_id in ("V1", "V2", "V1", "V2"):
+        await VerifierAgent(adapter, verifier_id=verifier_id, cache_dir=tmp_path).verify_claims(
+            claims, scenario.answer_key
+        )
+
+    assert calls == 2
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+@pytest.mark.asyncio
+async def test_scorer_falls_back_to_llm_on_invalid_cache_entry(tmp_path):
+    """Test an unusable cached score is treated as a miss and replaced"""
+    scenario = load_test_scenario()
+    calls = 0
+
+    class ScoringAdapter(MockAgentAdapter):
+        async def generate(self, *args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return ModelResponse(
+                content=json.dumps({
+                    "completeness_percentage": 0.5,
+                    "accuracy_percentage": 1.0,
+                    "justification": "Half the required points",
+                }),
+                model_identifier=self.model_name,
+                latency_ms=0,
+            )
+
+    scorer = ScorerAgent(ScoringAdapter(), cache_dir=tmp_path)
+    claims = make_claims(1)
+    verdicts = make_verification("V1", [VerdictLabel.SUPPORTED]).verdicts
+    await scorer.score_trial(claims, verdicts, scenario.answer_key)
+
+    (entry,) = tmp_path.glob("*.json")
+    entry.write_text(json.dumps({"accuracy_percentage": 2.0}))
+    score = await scorer.score_trial(claims, verdicts, scenario.answer_key)
+
+    assert calls == 2
+    assert score.completeness_percentage == 0.5
+    assert json.loads(entry.read_text())["justification"] == "Half the required points"
+
+
+@pytest.mark.asyncio
+async def test_questioner_prompt_follows_scenario_copies():
+    """Test a model_copy of the scenario is serialized afresh, and the scenario is read-only"""
+    scenario = load_test_scenario()
+    adapter = MockAgentAdapter()
+    sent: list[str] = []
+    generate = adapter.generate
+
+    async def recording_generate(*args, **kwargs):
+        sent.append(kwargs["messages"][-1]["content"])
+        return await generate(*args, **kwargs)
+
+    adapter.generate = recording_generate
+    questioner = QuestionerAgent(adapter)
+
+    await questioner.generate_questions(scenario)
+    await questioner.generate_questions(scenario.model_copy(update={"scenario_id": "COPY-1"}))
+
+    assert "COPY-1" not in sent[0]
+    assert '"scenario_id":"COPY-1"' in sent[1]
+    with pytest.raises(ValidationError):
+        scenario.scenario_id = "X"
+
+
+@pytest.mark.asyncio
+async def test_verifier_prompt_follows_answer_key_copies():
+    """Test a model_copy of the answer key is serialized afresh, and the key is read-only"""
+    answer_key = load_test_scenario().answer_key
+    adapter = MockAgentAdapter()
+    sent: list[str] = []
+    generate = adapter.generate
+
+    async def recording_generate(*args, **kwargs):
+        sent.append(kwargs["messages"][-1]["content"])
+        return await generate(*args, **kwargs)
+
+    adapter.generate = recording_generate
+    verifier = VerifierAgent(adapter)
+    claims = make_claims(1)
+
+    await verifier.verify_claims(claims, answer_key)
+    await verifier.verify_claims(
+        claims, answer_key.model_copy(update={"acceptable_referrals": ["Call 1-800-MEDICARE"]})
+    )
+
+    assert "Call 1-800-MEDICARE" not in sent[0]
+    assert "Call 1-800-MEDICARE" in sent[1]
+    with pytest.raises(ValidationError):
+        answer_key.required_points = []
+
+
+@pytest.mark.asyncio
+async def test_verifier_and_scorer_prompts_use_compact_json():
+    """Test prompt payloads are sent as compact JSON that round-trips"""
+    scenario = load_test_scenario()
+    adapter = MockAgentAdapter()
+    sent: list[str] = []
+    generate = adapter.generate
+
+    async def recording_generate(*args, **kwargs):
+        sent.append(kwargs["messages"][-1]["content"])
+        return await generate(*args, **kwargs)
+
+    adapter.generate = recording_generate
+    claims = make_claims(2)
+
+    verification = await VerifierAgent(adapter).verify_claims(claims, scenario.answer_key)
+    with pytest.raises(ValueError):
+        # Mock adapter has no scorer output; only the prompt matters here
+        await ScorerAgent(adapter).score_trial(
+            claims, verification.verdicts, scenario.answer_key
+        )
+
+    assert len(sent) == 2
+    for content in sent:
+        payload = content.split("\n\n", 1)[1]
+        data = json.loads(payload)
+        assert payload == json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        assert data["answer_key"] == scenario.answer_key.model_dump()
+
+
 @pytest.mark.asyncio
 async def test_questioner_simple():
     """Test questioner in simple mode (no LLM)"""
@@ -0,0 +1,104 @@
+"""Tests for the LLM response cache"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.adapters.base import BaseLLMAdapter
+from src.adapters.cache import DiskLLMCache, get_default_cache, make_cache_key
+from src.schemas import ModelResponse
+
+
+def test_cache_key_depends_on_request():
+    """Identical requests share a key; any parameter change produces a new one"""
+    messages = [{"role": "user", "content": "What is Medicare Part B?"}]
+
+    key = make_cache_key("grok-2", messages, 0.0, None, 2048)
+
+    assert key == make_cache_key("grok-2", messages, 0.0, None, 2048)
+    assert key != make_cache_key("grok-2", messages, 0.0, 42, 2048)
+    assert key != make_cache_key("grok-2", messages, 0.0, None, 4096)
+    assert key != make_cache_key("grok-3", messages, 0.0, None, 2048)
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_roundtrip(tmp_path):
+    """Values written to the disk cache are read back; misses return None"""
+    cache = DiskLLMCache(tmp_path / "cache")
+
+    assert await cache.get("missing") is None
+
+    await cache.set("abc", {"content": "hello", "latency_ms": 12})
+    assert await cache.get("abc") == {"content": "hello", "latency_ms": 12}
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_io_runs_off_the_event_loop(tmp_path, monkeypatch):
+    """Disk reads and writes happen in worker threads, not on the event loop thread"""
+    cache = DiskLLMCache(tmp_path)
+    io_threads = []
+    read, write = cache._read, cache._write
+
+    def recording_read(key):
+        io_threads.append(threading.get_ident())
+        return read(key)
+
+    def recording_write(key, value):
+        io_threads.append(threading.get_ident())
+        write(key, value)
+
+    monkeypatch.setattr(cache, "_read", recording_read)
+    monkeypatch.setattr(cache, "_write", recording_write)
+
+    await cache.set("abc", {"content": "hello"})
+    assert await cache.get("abc") == {"content": "hello"}
+    assert len(io_threads) == 2
+    assert threading.get_ident() not in io_threads
+
+
+def test_default_cache_uses_env_var(tmp_path, monkeypatch):
+    """The default cache is only enabled when LLM_CACHE_DIR is set"""
+    monkeypatch.delenv("LLM_CACHE_DIR", raising=False)
+    assert get_default_cache() is None
+
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path))
+    cache = get_default_cache()
+    assert isinstance(cache, DiskLLMCache)
+    assert cache.cache_dir == tmp_path
+
+
+@pytest.mark.asyncio
+async def test_generate_shared_collapses_identical_concurrent_calls():
+    """Identical temperature=0 calls in flight together send one request"""
+    class CountingAdapter(BaseLLMAdapter):
+        def __init__(self):
+            super().__init__("counting")
+            self.calls = 0
+
+        async def generate(self, messages, temperature=0.0, max_tokens=2048, seed=None, **kwargs):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return ModelResponse(
+                content=messages[-1]["content"], model_identifier=self.model_name, latency_ms=0
+            )
+
+        def get_model_identifier(self) -> str:
+            return self.model_name
+
+    adapter = CountingAdapter()
+    same = [{"role": "user", "content": "What is Medicare Part B?"}]
+    other = [{"role": "user", "content": "What is Medicare Part D?"}]
+
+    responses = await asyncio.gather(
+        adapter.generate_shared(same),
+        adapter.generate_shared(list(same)),
+        adapter.generate_shared(other),
+    )
+
+    assert adapter.calls == 2
+    assert [r.content for r in responses] == [same[0]["content"]] * 2 + [other[0]["content"]]
+    assert adapter._inflight == {}
+
+    await asyncio.gather(adapter.generate_shared(same, 0.7), adapter.generate_shared(same, 0.7))
+    assert adapter.calls == 4
@@ -0,0 +1,190 @@
+"""Tests for the SHIP rubric grader"""
+
+import asyncio
+
+import pytest
+
+from src.adapters.base import BaseLLMAdapter
+from src.grader import MedicareAdviceGrader
+from src.grading_rubric import (
+    QUESTION_GROUPS_DUAL_ELIGIBLE,
+    QUESTION_GROUPS_MEDICARE_ONLY,
+    QUESTION_TO_GROUP_MAP_DE,
+    QUESTION_TO_GROUP_MAP_MO,
+    ScoreCategory,
+    get_question_group,
+)
+from src.schemas import ModelResponse
+
+GRADING_OUTPUT = """SCORE: ACCURATE_COMPLETE
+
+CRITERIA_MET:
+- Mentioned the enrollment window
+
+CRITERIA_MISSED:
+- None
+
+EXPLANATION:
+Covers both parts of the question.
+"""
+
+
+class ScriptedGradingAdapter(BaseLLMAdapter):
+    """Returns a fixed grading output and records peak concurrency"""
+
+    def __init__(self, content: str = GRADING_OUTPUT, fail_on: str | None = None):
+        super().__init__("scripted-grader")
+        self.content = content
+        self.fail_on = fail_on
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate(self, messages, temperature=0.0, max_tokens=2048, seed=None, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_on and self.fail_on in messages[-1]["content"]:
+                raise RuntimeError("grading failed")
+            return ModelResponse(
+                content=self.content, model_identifier=self.model_name, latency_ms=0
+            )
+        finally:
+            self.in_flight -= 1
+
+    def get_model_identifier(self) -> str:
+        return self.model_name
+
+
+def make_questions(n: int) -> list[dict]:
+    """Build n question/response dicts for Medicare-only questions 1..n"""
+    return [
+        {
+            "question_number": i,
+            "question_text": f"Question {i}",
+            "response_text": f"Response {i}",
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_grade_run_concurrent_preserves_order():
+    """Test grade_run grades concurrently, keeps order, and isolates failures"""
+    adapter = ScriptedGradingAdapter(fail_on="Response 2")
+    grader = MedicareAdviceGrader(adapter)
+
+    run_score = await grader.grade_run("run-1", make_questions(4), max_concurrency=2)
+
+    assert adapter.peak == 2
+    assert [qs.question_number for qs in run_score.question_scores] == [1, 2, 3, 4]
+    assert run_score.question_scores[1].score == ScoreCategory.MISSING
+    assert run_score.accurate_complete_count == 3
+
+
+def test_parse_grading_response():
+    """Test the grading output format is parsed into score, criteria and explanation"""
+    grader = MedicareAdviceGrader(ScriptedGradingAdapter())
+
+    result = grader._parse_grading_response(GRADING_OUTPUT)
+
+    assert result["score"] == ScoreCategory.ACCURATE_COMPLETE
+    assert result["criteria_met"] == ["Mentioned the enrollment window"]
+    assert result["criteria_missed"] == ["None"]
+    assert result["explanation"] == "Covers both parts of the question."
+
+
+@pytest.mark.asyncio
+async def test_grade_response_uses_disk_cache(tmp_path):
+    """Test a cached grade is reused without calling the adapter again"""
+    adapter = ScriptedGradingAdapter()
+    grader = MedicareAdviceGrader(adapter, cache_dir=tmp_path)
+
+    first = await grader.grade_response(1, "Question 1", "Response 1")
+    second = await MedicareAdviceGrader(adapter, cache_dir=tmp_path).grade_response(
+        1, "Question 1", "Response 1"
+    )
+
+    assert adapter.calls == 1
+    assert second.score == first.score == ScoreCategory.ACCURATE_COMPLETE
+    assert second.criteria_met == first.criteria_met
+
+
+@pytest.mark.asyncio
+async def test_grade_response_does_not_cache_fallback_score(tmp_path):
+    """Test a response with no SCORE line is graded again instead of served from cache"""
+    adapter = ScriptedGradingAdapter(content="EXPLANATION:\nThe response was cut off")
+    grader = MedicareAdviceGrader(adapter, cache_dir=tmp_path)
+
+    first = await grader.grade_response(1, "Question 1", "Response 1")
+    await grader.grade_response(1, "Question 1", "Response 1")
+
+    assert first.score == ScoreCategory.NOT_SUBSTANTIVE
+    assert adapter.calls == 2
+    assert list(tmp_path.glob("*.json")) == []
+
+
+@pytest.mark.asyncio
+async def test_grade_response_regrades_partial_cache_entry(tmp_path):
+    """Test a cached grade missing fields is treated as a miss and replaced"""
+    adapter = ScriptedGradingAdapter()
+    grader = MedicareAdviceGrader(adapter, cache_dir=tmp_path)
+    await grader.grade_response(1, "Question 1", "Response 1")
+
+    (entry,) = tmp_path.glob("*.json")
+    entry.write_text('{"score": "ACCURATE_COMPLETE"}')
+    regraded = await grader.grade_response(1, "Question 1", "Response 1")
+
+    assert adapter.calls == 2
+    assert regraded.criteria_met == ["Mentioned the enrollment window"]
+    assert "criteria_met" in entry.read_text()
+
+
+def test_parse_grading_response_uses_first_named_score():
+    """Test the score is the first whole category name on the SCORE line"""
+    grader = MedicareAdviceGrader(ScriptedGradingAdapter())
+
+    result = grader._parse_grading_response(
+        "SCORE: SUBSTANTIVE_INCOMPLETE (not ACCURATE_COMPLETE)\nEXPLANATION:\nMissing details."
+    )
+
+    assert result["score"] == ScoreCategory.SUBSTANTIVE_INCOMPLETE
+
+
+@pytest.mark.asyncio
+async def test_grade_run_grades_duplicate_responses_once():
+    """Test identical question/response pairs in a run share one grading call"""
+    adapter = ScriptedGradingAdapter()
+    grader = MedicareAdviceGrader(adapter)
+    questions = make_questions(2)
+    questions.append(dict(questions[0]))
+
+    run_score = await grader.grade_run("run-1", questions)
+
+    assert adapter.calls == 2
+    assert [qs.question_number for qs in run_score.question_scores] == [1, 2, 1]
+    assert run_score.question_scores[2] == run_score.question_scores[0]
+    assert run_score.question_scores[2] is not run_score.question_scores[0]
+
+
+@pytest.mark.parametrize(
+    "groups, question_map",
+    [
+        (QUESTION_GROUPS_MEDICARE_ONLY, QUESTION_TO_GROUP_MAP_MO),
+        (QUESTION_GROUPS_DUAL_ELIGIBLE, QUESTION_TO_GROUP_MAP_DE),
+    ],
+)
+def test_question_maps_match_scenario_groups(groups, question_map):
+    """Test each question map covers exactly its scenario's groups"""
+    assert all(qnum in group.question_numbers for qnum, group in question_map.items())
+    assert {id(group) for group in question_map.values()} == {id(group) for group in groups}
+
+
+def test_shared_group_registered_under_scenario_question_number():
+    """Test QG2 maps to Q16 for Medicare-Only and Q8 for Dual-Eligible only"""
+    assert get_question_group(16, "medicare_only").group_id == "QG2"
+    assert get_question_group(8, "dual_eligible").group_id == "QG2"
+    assert get_question_group(8, "medicare_only").group_id == "QG15"
+    assert get_question_group(16, "dual_eligible") is None
@@ -0,0 +1,198 @@
+"""Tests for the evaluation orchestrator"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from src.adapters._http import close_shared_http_client, get_shared_http_client
+from src.adapters.base import BaseLLMAdapter
+from src.adapters.fake_adapter import FakeAdapter
+from src.orchestrator import EvaluationOrchestrator, create_adapter, main
+from src.schemas import ModelResponse
+from src.storage import ResultsStorage
+
+from .test_agents import load_test_scenario
+
+
+class EchoAdapter(BaseLLMAdapter):
+    """Echoes the last user message and records each request's messages"""
+
+    def __init__(self):
+        super().__init__("echo")
+        self.requests = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate(self, messages, temperature=0.0, max_tokens=2048, seed=None, **kwargs):
+        self.requests.append(list(messages))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return ModelResponse(
+                content=f"echo: {messages[-1]['content']}",
+                model_identifier=self.model_name,
+                latency_ms=0,
+            )
+        finally:
+            self.in_flight -= 1
+
+    def get_model_identifier(self) -> str:
+        return self.model_name
+
+
+def make_orchestrator(target_adapter: BaseLLMAdapter, tmp_path, **scenario_updates):
+    """Build an orchestrator for the test scenario with fake agents"""
+    scenario = load_test_scenario().model_copy(update=scenario_updates)
+    return EvaluationOrchestrator(
+        scenario=scenario,
+        target_adapter=target_adapter,
+        agent_adapter=FakeAdapter(),
+        grade_adapter=FakeAdapter(),
+        storage=ResultsStorage(tmp_path),
+    )
+
+
+TURNS = [
+    {"turn_id": "Q1", "user_message": "First?"},
+    {"turn_id": "Q2", "user_message": "Second?"},
+    {"turn_id": "Q3", "user_message": "Third?"},
+]
+
+
+@pytest.mark.asyncio
+async def test_independent_turns_are_sent_concurrently(tmp_path):
+    """Test independent turns each get a single-message request, sent together"""
+    adapter = EchoAdapter()
+    orchestrator = make_orchestrator(adapter, tmp_path, independent_turns=True)
+
+    conversation = await orchestrator._conduct_conversation(TURNS)
+
+    assert adapter.peak == len(TURNS)
+    assert all(len(messages) == 1 for messages in adapter.requests)
+    assert [(t.turn_id, t.content) for t in conversation] == [
+        ("Q1", "First?"),
+        ("Q1_response", "echo: First?"),
+        ("Q2", "Second?"),
+        ("Q2_response", "echo: Second?"),
+        ("Q3", "Third?"),
+        ("Q3_response", "echo: Third?"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dependent_turns_carry_conversation_history(tmp_path):
+    """Test turns are asked in sequence with prior turns as context by default"""
+    adapter = EchoAdapter()
+    orchestrator = make_orchestrator(adapter, tmp_path)
+
+    await orchestrator._conduct_conversation(TURNS)
+
+    assert adapter.peak == 1
+    assert [len(messages) for messages in adapter.requests] == [1, 3, 5]
+
+
+@pytest.mark.asyncio
+async def test_background_writes_finish_before_result_is_saved(tmp_path):
+    """Test transcript and grading files are on disk once run_evaluation returns"""
+    orchestrator = make_orchestrator(EchoAdapter(), tmp_path)
+    run_dir = orchestrator.storage.create_run_directory("bg-writes")
+
+    trial = await orchestrator.run_evaluation(run_dir)
+
+    assert orchestrator._pending_writes == []
+    assert (run_dir / "transcripts" / f"{trial.trial_id}.json").exists()
+    assert (run_dir / "intermediate" / trial.trial_id / "grading.json").exists()
+    assert (run_dir / "results.jsonl").exists()
+
+
+def test_cli_runs_twice_in_one_process(tmp_path, monkeypatch):
+    """Test a second CLI run in the same process does not reuse the first run's adapters"""
+    for run_id in ("first", "second"):
+        monkeypatch.setattr(sys, "argv", [
+            "orchestrator", "run",
+            "--scenario", "scenarios/v1/scenario_001.json",
+            "--target-model", "fake:perfect",
+            "--grade-model", "fake:perfect",
+            "--output-dir", str(tmp_path),
+            "--run-id", run_id,
+            "--quiet",
+        ])
+        main()
+        assert (tmp_path / run_id / "results.jsonl").exists()
+
+    pytest.importorskip("openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    assert create_adapter("openai", "gpt-4o") is not create_adapter("openai", "gpt-4o")
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "abc"])
+def test_cli_rejects_non_positive_max_concurrency(value, monkeypatch):
+    """Test --max-concurrency below 1 is a usage error instead of a hang"""
+    monkeypatch.setattr(sys, "argv", [
+        "orchestrator", "run",
+        "--scenario", "scenarios/v1/scenario_001.json",
+        "--target-model", "fake:perfect",
+        "--max-concurrency", value,
+    ])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+
+
+def test_shared_http_client_is_per_event_loop():
+    """Test each event loop gets its own pooled client, closed by that loop's shutdown"""
+
+    async def run_once():
+        client = get_shared_http_client()
+        assert get_shared_http_client() is client
+        await close_shared_http_client()
+        return client
+
+    first = asyncio.run(run_once())
+    second = asyncio.run(run_once())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
+@pytest.mark.asyncio
+async def test_short_writes_still_save_whole_result_lines(tmp_path, monkeypatch):
+    """Test results.jsonl lines are complete even when os.write writes a few bytes at a time"""
+    real_write = os.write
+    monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, bytes(data[:7])))
+    orchestrator = make_orchestrator(EchoAdapter(), tmp_path)
+    run_dir = orchestrator.storage.create_run_directory("short-writes")
+
+    trials = [await orchestrator.run_evaluation(run_dir) for _ in range(2)]
+
+    loaded = orchestrator.storage.load_trial_results(run_dir)
+    assert [t.trial_id for t in loaded] == [t.trial_id for t in trials]
+
+
+@pytest.mark.asyncio
+async def test_xai_warmup_is_explicit_and_cancelled_on_close(monkeypatch):
+    """Test constructing an xAI adapter sends nothing, and close() cancels a pending warmup"""
+    pytest.importorskip("openai")
+    from src.adapters.xai_adapter import XAIAdapter
+
+    started = asyncio.Event()
+
+    async def slow_warmup(self):
+        started.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(XAIAdapter, "_warmup", slow_warmup)
+    adapter = XAIAdapter("grok-test", api_key="test-key")
+    assert adapter._warmup_task is None
+
+    warmup = asyncio.create_task(adapter.warmup())
+    await started.wait()
+    await adapter.close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await warmup
@@ -0,0 +1,29 @@
+"""Tests for shared utility functions"""
+
+import pytest
+
+from src.utils import extract_json_from_text
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"verdicts": []}', {"verdicts": []}),
+        ('Here you go:\n{"a": {"b": {"c": [1, 2]}}}\nThanks!', {"a": {"b": {"c": [1, 2]}}}),
+        ('x {"s": "has } brace"} y', {"s": "has } brace"}),
+        ('{"q": "say \\"hi\\" {"} done', {"q": 'say "hi" {'}),
+        ('Use {name}. Result: {"verdicts": []}', {"verdicts": []}),
+        ('stray { then {"a": 1}', {"a": 1}),
+        ('He said "wow {" then {"a": "b"}', {"a": "b"}),
+        ("Results: [1, 2, 3] end", [1, 2, 3]),
+    ],
+)
+def test_extract_json_from_text(text, expected):
+    """Test JSON is found despite preamble, postamble, nesting and brackets in strings"""
+    assert extract_json_from_text(text) == expected
+
+
+def test_extract_json_from_text_raises_without_json():
+    """Test text with no parseable JSON raises ValueError"""
+    with pytest.raises(ValueError):
+        extract_json_from_text('Truncated: {"a": [1, 2')
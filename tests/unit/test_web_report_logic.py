@@ -85,6 +85,24 @@ def test_calculate_score_distribution():
     assert stats["incomplete_count"] == 0
 
 
+def test_calculate_score_distribution_all_scores():
+    """Test score distribution counts every score bucket and incomplete runs."""
+    results = [
+        {"final_scores": {"rubric_score": score, "completeness_percentage": 0.5, "accuracy_percentage": 1.0}}
+        for score in (1, 2, 3, 4, 4)
+    ]
+    results.append({"final_scores": {"rubric_score": None}})
+
+    stats = calculate_score_distribution(results)
+
+    assert stats["total"] == 6
+    assert stats["scored_total"] == 5
+    assert [stats[f"score_{n}_count"] for n in (1, 2, 3, 4)] == [1, 1, 1, 2]
+    assert stats["score_4_pct"] == 40.0
+    assert stats["incomplete_count"] == 1
+    assert stats["avg_completeness"] == 50.0
+
+
 def test_prepare_table_data_by_model():
     """Test table data preparation grouped by model."""
     results = [
@@ -153,6 +171,9 @@ if __name__ == "__main__":
     test_calculate_score_distribution()
     print("✓ test_calculate_score_distribution passed")
 
+    test_calculate_score_distribution_all_scores()
+    print("✓ test_calculate_score_distribution_all_scores passed")
+
     test_prepare_table_data_by_model()
     print("✓ test_prepare_table_data_by_model passed")
 